@@ -8,19 +8,11 @@ import logging
 # Add the parent directory to sys.path for proper imports
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
+from utils.logging_setup import setup_logging as configure_logging, apply_logging_config
+
 # Setup logging first
 def setup_logging():
-    logs_dir = Path(__file__).parent / "logs"
-    logs_dir.mkdir(exist_ok=True)
-
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(logs_dir / "biome.log", encoding='utf-8'),
-            logging.StreamHandler()
-        ]
-    )
+    configure_logging()
     return logging.getLogger(__name__)
 
 # Initialize logging
@@ -29,6 +21,7 @@ logger = setup_logging()
 from typing import Dict, Any, List, Optional
 import json
 import asyncio
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskID
 from rich.markdown import Markdown
 from rich.console import Console
@@ -44,12 +37,19 @@ from textual.binding import Binding
 
 from utils.checkpoint_manager import CheckpointManager
 from utils.node_manager import NodeManager
-from utils.reporting import BiomeReportGenerator
+from utils.plugin_discovery import PluginDiscovery
+from utils.analysis_cache import AnalysisCache
+from utils.reporting import BiomeReportGenerator, ReportIndex, REPORT_FORMATS
+from utils.aggregate_report import AggregateReport
+from utils.session_diff import diff_sessions
 
 # Initialize rich console
 console = Console()
 app = typer.Typer(help="ElizaOS Plugin Bug Hunter CLI")
 checkpoint_manager = CheckpointManager()
+aggregate_report = AggregateReport(Path("reports"))
+# Root of the monorepo whose plugins are analyzed
+workspace_root = Path(__file__).parent.parent.parent
 
 class PluginAnalyzerApp(App):
     """A Textual app for analyzing ElizaOS plugins."""
@@ -119,42 +119,181 @@ def generate_analysis_report(analysis_result: Dict[str, Any]) -> str:
 
     # Parse Biome output
     biome_results = analysis_result.get("results", {}).get("biome", {})
-    report_gen.parse_biome_output(
-        biome_output=biome_results.get("output", ""),
+    report_gen.load_biome_result(
+        biome_results,
         plugin_name=analysis_result.get("plugin_name", "unknown")
     )
 
     return report_gen.generate_markdown_report()
 
-@app.command()
-def start(
-    plugins: Optional[List[str]] = typer.Option(None, "--plugins", "-p", help="Specific plugins to analyze"),
-    config_path: Path = typer.Option(
-        Path("config/analysis.config.json"), "--config", "-c",
-        help="Analysis configuration file"
-    ),
-):
-    """Start a new analysis session."""
-    console.print(Panel("Starting new analysis session...", title="Bug Hunter"))
+def analyze_plugin(
+    node_manager: NodeManager,
+    plugin_path: Path,
+    config_data: Dict[str, Any],
+    analysis_cache: Optional[AnalysisCache] = None,
+    biome_result: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Run the analysis tools for a single plugin. Safe to call from worker threads."""
+    if analysis_cache:
+        cache_key = analysis_cache.compute_key(plugin_path, node_manager.get_tool_versions(), config_data)
+        analysis_result = analysis_cache.get(cache_key)
+        if analysis_result is not None:
+            logger.info(f"Reusing cached analysis for {plugin_path.name}")
+            analysis_result["plugin_name"] = plugin_path.name
+            return analysis_result
+
+    analysis_result = node_manager.analyze_typescript(
+        str(plugin_path),
+        config=config_data,
+        biome_result=biome_result
+    )
+    analysis_result["plugin_name"] = plugin_path.name
 
-    # Get workspace root
-    workspace_root = Path(__file__).parent.parent.parent
+    if analysis_cache:
+        analysis_cache.put(cache_key, plugin_path.name, analysis_result)
 
-    # Initialize session and managers
-    session_name = Prompt.ask("Enter session name", default="bug_hunt_session")
-    checkpoint_manager.start_session(session_name)
+    return analysis_result
 
-    # Initialize and setup Node environment
-    console.print("[yellow]Setting up Node.js environment...[/yellow]")
-    node_manager = NodeManager(work_dir=str(workspace_root))
+def save_plugin_results(
+    plugin_path: Path,
+    analysis_result: Dict[str, Any],
+    report_formats: Optional[List[str]] = None,
+) -> None:
+    """Save the report and checkpoint entry for an analyzed plugin.
 
-    # Load configuration
+    Only called from the thread driving the analysis, so report and checkpoint
+    writes never interleave even when plugins are analyzed in parallel.
+    """
+    # Generate and save report
+    report_dir = Path("reports")
+    report_dir.mkdir(exist_ok=True)
+
+    # Create report generator
+    report_gen = BiomeReportGenerator()
+
+    # Use the parsed Biome result as is
+    biome_results = analysis_result.get("results", {}).get("biome", {})
+    report_gen.load_biome_result(
+        biome_results,
+        plugin_name=plugin_path.name,
+        source_dir=os.path.relpath(plugin_path.resolve(), workspace_root.resolve())
+    )
+
+    # Save report
+    report_gen.save_report(report_dir, report_formats or ["markdown"])
+
+    # Fold the plugin into the workspace summary
+    aggregate_report.add_plugin(
+        plugin_path.name,
+        biome_results.get("diagnostics") or [],
+        biome_results.get("summary")
+    )
+
+    # Update checkpoint
+    checkpoint_manager.save_plugin_progress(
+        plugin_path.name,
+        analysis_result
+    )
+
+def load_analysis_config(config_path: Path) -> Dict[str, Any]:
+    """Load the analysis configuration, falling back to defaults"""
     try:
         with open(config_path, 'r', encoding='utf-8') as f:
-            config_data = json.load(f)
+            return json.load(f)
     except FileNotFoundError:
         console.print(f"[red]Configuration file not found: {config_path}[/red]")
-        config_data = {"plugins_dir": "packages", "exclude_patterns": []}
+        return {"plugins_dir": "packages", "exclude_patterns": []}
+
+def configure_timeouts(node_manager: NodeManager, config_data: Dict[str, Any], timeout: Optional[float]) -> None:
+    """Apply the config's "timeouts" section and the --timeout option"""
+    timeouts = dict(config_data.get("timeouts", {}))
+    if timeout is not None:
+        timeouts["plugin"] = timeout
+    node_manager.configure_timeouts(timeouts)
+
+def parse_report_formats(report_format: str) -> List[str]:
+    """Split the --format option ("markdown,sarif") into report formats"""
+    formats = [name.strip().lower() for name in report_format.split(",") if name.strip()]
+    unknown = [name for name in formats if name not in REPORT_FORMATS]
+    if unknown or not formats:
+        raise typer.BadParameter(
+            f"Unknown report format: {', '.join(unknown) or report_format!r}, use {', '.join(REPORT_FORMATS)}",
+            param_hint="--format"
+        )
+    return formats
+
+def configure_checkpoints(config_data: Dict[str, Any]) -> None:
+    """Apply the config's "checkpoint" section (flush_every, flush_interval)"""
+    checkpoint_config = config_data.get("checkpoint", {})
+    checkpoint_manager.configure_flush(
+        flush_every=checkpoint_config.get("flush_every"),
+        flush_interval=checkpoint_config.get("flush_interval"),
+    )
+
+def create_analysis_cache(
+    node_manager: NodeManager,
+    config_data: Dict[str, Any],
+    workspace_root: Path,
+    no_cache: bool,
+) -> Optional[AnalysisCache]:
+    """Create the analysis cache used to reuse results of unchanged plugins"""
+    if no_cache:
+        return None
+
+    cache_config = config_data.get("cache", {})
+    analysis_cache = AnalysisCache(
+        max_entries=cache_config.get("max_entries", 500),
+        max_age_days=cache_config.get("max_age_days", 30),
+        workspace_root=workspace_root,
+    )
+    # Resolve tool versions once, before the workers need them for cache keys
+    node_manager.get_tool_versions()
+    return analysis_cache
+
+def run_analysis(
+    node_manager: NodeManager,
+    plugin_paths: List[Path],
+    config_data: Dict[str, Any],
+    jobs: int,
+    analysis_cache: Optional[AnalysisCache],
+    biome_workspace: bool = False,
+    biome_daemon: bool = False,
+    report_formats: Optional[List[str]] = None,
+) -> None:
+    """Analyze plugins and record their results in the active session"""
+    if biome_daemon:
+        node_manager.start_biome_daemon()
+    try:
+        _run_analysis(
+            node_manager, plugin_paths, config_data, jobs, analysis_cache, biome_workspace, report_formats
+        )
+    finally:
+        node_manager.stop_biome_daemon()
+        # Leave a self-contained snapshot behind for other tools reading checkpoints
+        checkpoint_manager.compact()
+
+def _run_analysis(
+    node_manager: NodeManager,
+    plugin_paths: List[Path],
+    config_data: Dict[str, Any],
+    jobs: int,
+    analysis_cache: Optional[AnalysisCache],
+    biome_workspace: bool,
+    report_formats: List[str],
+) -> None:
+    """Run the plugin analysis itself, see run_analysis"""
+    # Check every plugin that has no cached result with one Biome run up front
+    biome_results: Dict[str, Dict[str, Any]] = {}
+    if biome_workspace:
+        stale_paths = [
+            str(plugin_path) for plugin_path in plugin_paths
+            if not analysis_cache or not analysis_cache.contains(
+                analysis_cache.compute_key(plugin_path, node_manager.get_tool_versions(), config_data)
+            )
+        ]
+        if stale_paths:
+            console.print(f"[yellow]Running Biome across {len(stale_paths)} plugins...[/yellow]")
+            biome_results = node_manager.run_biome_workspace(stale_paths, config=config_data)
 
     # Initialize progress tracking
     with Progress(
@@ -164,79 +303,184 @@ def start(
         TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
     ) as progress:
 
-        # Find plugins to analyze using absolute path
-        plugins_dir = workspace_root / config_data.get("plugins_dir", "packages")
-        console.print(f"Looking for plugins in: {plugins_dir}")
-
-        if plugins:
-            plugin_paths = [plugins_dir / p for p in plugins]
-        else:
-            # Look for plugins with TypeScript files
-            plugin_paths = []
-            for plugin_dir in plugins_dir.glob("plugin-*"):
-                if list(plugin_dir.glob("**/*.ts")) or list(plugin_dir.glob("**/*.tsx")):
-                    plugin_paths.append(plugin_dir)
-                    console.print(f"[green]Found TypeScript files in {plugin_dir.name}[/green]")
-
-        if not plugin_paths:
-            console.print("[red]No plugins with TypeScript files found![/red]")
-            return
-
         # Create analysis task
         task = progress.add_task("Analyzing plugins...", total=len(plugin_paths))
 
-        # Analyze each plugin
-        for plugin_path in plugin_paths:
-            progress.update(task, description=f"Analyzing {plugin_path.name}")
-
-            try:
-                # Run TypeScript analysis with configuration
-                analysis_result = node_manager.analyze_typescript(str(plugin_path), config=config_data)
-                analysis_result["plugin_name"] = plugin_path.name
-
-                # Generate and save report
-                report_dir = Path("reports")
-                report_dir.mkdir(exist_ok=True)
+        # Analyze plugins on a worker pool. The tools run as subprocesses, so threads
+        # are enough to keep every core busy; results are consumed here as they finish.
+        executor = ThreadPoolExecutor(max_workers=jobs)
+        try:
+            futures = {
+                executor.submit(
+                    analyze_plugin,
+                    node_manager,
+                    plugin_path,
+                    config_data,
+                    analysis_cache,
+                    biome_results.get(str(plugin_path))
+                ): plugin_path
+                for plugin_path in plugin_paths
+            }
+            # Wake up when a batch of checkpoint writes is due too, so results are
+            # not left pending while slow plugins are still running
+            running = set(futures)
+            while running:
+                done, running = wait(
+                    running, timeout=checkpoint_manager.seconds_until_flush(), return_when=FIRST_COMPLETED
+                )
+                checkpoint_manager.flush_if_due()
+
+                for future in done:
+                    plugin_path = futures[future]
+                    progress.update(task, description=f"Analyzed {plugin_path.name}")
+
+                    try:
+                        save_plugin_results(plugin_path, future.result(), report_formats)
+                    except TimeoutError as e:
+                        logger.error(f"Timed out analyzing {plugin_path.name}: {str(e)}")
+                        checkpoint_manager.add_error(
+                            plugin_path.name,
+                            f"Timeout: {str(e)}"
+                        )
+                    except Exception as e:
+                        logger.error(f"Failed to analyze {plugin_path.name}: {str(e)}")
+                        checkpoint_manager.add_error(
+                            plugin_path.name,
+                            str(e)
+                        )
+
+                    progress.advance(task)
+        except KeyboardInterrupt:
+            # Don't start any queued plugins, and stop the running ones: their tools
+            # run in their own sessions, so Ctrl-C never reached them
+            node_manager.cancel_running()
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+        finally:
+            executor.shutdown(wait=True)
+            # Written once per run, also covering the plugins finished before an interruption
+            aggregate_report.save()
+            aggregate_report.save_unique_issues()
 
-                # Create report generator
-                report_gen = BiomeReportGenerator()
+        progress.update(task, description="Analysis complete!")
 
-                # Parse Biome output - pass the entire result as JSON
-                biome_results = analysis_result.get("results", {}).get("biome", {})
-                report_gen.parse_biome_output(
-                    biome_output=json.dumps(biome_results),
-                    plugin_name=plugin_path.name
-                )
+    console.print(f"Workspace summary: {aggregate_report.report_path}")
 
-                # Save report
-                report_gen.save_report(report_dir)
+    if analysis_cache:
+        analysis_cache.evict()
 
-                # Update checkpoint
-                checkpoint_manager.save_plugin_progress(
-                    plugin_path.name,
-                    analysis_result
-                )
+@app.command()
+def start(
+    plugins: Optional[List[str]] = typer.Option(None, "--plugins", "-p", help="Specific plugins to analyze"),
+    config_path: Path = typer.Option(
+        Path("config/analysis.config.json"), "--config", "-c",
+        help="Analysis configuration file"
+    ),
+    jobs: int = typer.Option(1, "--jobs", "-j", min=1, help="Number of plugins to analyze in parallel"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Re-analyze every plugin, ignoring cached results"),
+    biome_workspace: bool = typer.Option(
+        False, "--biome-workspace",
+        help="Check all plugins with a single Biome run instead of one run per plugin"
+    ),
+    biome_daemon: bool = typer.Option(
+        False, "--biome-daemon",
+        help="Run checks through a long-lived Biome server instead of a cold process per plugin"
+    ),
+    timeout: Optional[float] = typer.Option(
+        None, "--timeout", min=0,
+        help="Time budget per plugin in seconds, 0 for none (overrides the config)"
+    ),
+    results_db: bool = typer.Option(
+        False, "--results-db",
+        help="Index results in the SQLite results store as they come in"
+    ),
+    report_format: str = typer.Option(
+        "markdown", "--format",
+        help="Report formats to write, comma separated: markdown, sarif, json"
+    ),
+):
+    """Start a new analysis session."""
+    report_formats = parse_report_formats(report_format)
+    console.print(Panel("Starting new analysis session...", title="Bug Hunter"))
 
-            except Exception as e:
-                logger.error(f"Failed to analyze {plugin_path.name}: {str(e)}")
-                checkpoint_manager.add_error(
-                    plugin_path.name,
-                    str(e)
-                )
+    # Initialize session and managers
+    session_name = Prompt.ask("Enter session name", default="bug_hunt_session")
+    if results_db:
+        checkpoint_manager.enable_results_store()
+    checkpoint_manager.start_session(session_name)
 
-            progress.advance(task)
+    # Initialize and setup Node environment
+    console.print("[yellow]Setting up Node.js environment...[/yellow]")
+    node_manager = NodeManager(work_dir=str(workspace_root))
 
-        progress.update(task, description="Analysis complete!")
+    # Load configuration
+    config_data = load_analysis_config(config_path)
+    apply_logging_config(config_data.get("logging"))
+    configure_checkpoints(config_data)
+    configure_timeouts(node_manager, config_data, timeout)
+    analysis_cache = create_analysis_cache(node_manager, config_data, workspace_root, no_cache)
+
+    # Find plugins to analyze using absolute path
+    plugins_dir = workspace_root / config_data.get("plugins_dir", "packages")
+    console.print(f"Looking for plugins in: {plugins_dir}")
+
+    if plugins:
+        plugin_paths = [plugins_dir / p for p in plugins]
+    else:
+        # Look for plugins with TypeScript files
+        discovery = PluginDiscovery(exclude_patterns=config_data.get("exclude_patterns", []))
+        plugin_paths = discovery.discover(plugins_dir)
+        for plugin_dir in plugin_paths:
+            console.print(f"[green]Found TypeScript files in {plugin_dir.name}[/green]")
+
+    if not plugin_paths:
+        console.print("[red]No plugins with TypeScript files found![/red]")
+        return
+
+    # Record the work queue so an interrupted session can be resumed
+    checkpoint_manager.set_session_plan([str(p) for p in plugin_paths], config_data)
+
+    run_analysis(
+        node_manager, plugin_paths, config_data, jobs, analysis_cache, biome_workspace, biome_daemon,
+        report_formats
+    )
 
 @app.command()
 def resume(
     session: str = typer.Option(None, "--session", "-s", help="Session name to resume"),
+    config_path: Path = typer.Option(
+        Path("config/analysis.config.json"), "--config", "-c",
+        help="Analysis configuration file, used when the session did not record one"
+    ),
+    jobs: int = typer.Option(1, "--jobs", "-j", min=1, help="Number of plugins to analyze in parallel"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Re-analyze every plugin, ignoring cached results"),
+    biome_workspace: bool = typer.Option(
+        False, "--biome-workspace",
+        help="Check all plugins with a single Biome run instead of one run per plugin"
+    ),
+    biome_daemon: bool = typer.Option(
+        False, "--biome-daemon",
+        help="Run checks through a long-lived Biome server instead of a cold process per plugin"
+    ),
+    timeout: Optional[float] = typer.Option(
+        None, "--timeout", min=0,
+        help="Time budget per plugin in seconds, 0 for none (overrides the config)"
+    ),
+    results_db: bool = typer.Option(
+        False, "--results-db",
+        help="Index results in the SQLite results store as they come in"
+    ),
+    report_format: str = typer.Option(
+        "markdown", "--format",
+        help="Report formats to write, comma separated: markdown, sarif, json"
+    ),
 ):
     """Resume a previous analysis session."""
+    report_formats = parse_report_formats(report_format)
     if not session:
         # List available sessions
-        checkpoints = list(Path("checkpoints").glob("*.json"))
-        if not checkpoints:
+        sessions = checkpoint_manager.list_sessions()
+        if not sessions:
             console.print("[red]No previous sessions found![/red]")
             raise typer.Exit(1)
 
@@ -245,31 +489,72 @@ def resume(
         table.add_column("Last Updated")
         table.add_column("Plugins Analyzed")
 
-        for checkpoint in checkpoints:
-            with open(checkpoint, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                table.add_row(
-                    data["session_name"],
-                    data["last_updated"],
-                    str(len(data["plugins_analyzed"]))
-                )
+        for entry in sessions:
+            data = checkpoint_manager.load_checkpoint(entry["checkpoint_file"])
+            table.add_row(
+                data["session_name"],
+                data["last_updated"],
+                str(len(data["plugins_analyzed"]))
+            )
 
         console.print(table)
         session = Prompt.ask("Enter session name to resume")
 
-    checkpoint = checkpoint_manager.load_latest_session(session)
+    if results_db:
+        checkpoint_manager.enable_results_store()
+    checkpoint = checkpoint_manager.resume_session(session)
     if not checkpoint:
         console.print(f"[red]Session '{session}' not found![/red]")
         raise typer.Exit(1)
 
     logger.info(f"Resumed session: {session}")
-    # TODO: Continue analysis from checkpoint
+
+    config_data = checkpoint.get("config") or load_analysis_config(config_path)
+    apply_logging_config(config_data.get("logging"))
+    configure_checkpoints(config_data)
+    plugins_dir = workspace_root / config_data.get("plugins_dir", "packages")
+
+    pending = checkpoint_manager.get_pending_plugins(checkpoint)
+    if not pending and not checkpoint.get("plugins_planned"):
+        # Sessions from before the work queue was recorded: rediscover the plugins
+        discovery = PluginDiscovery(exclude_patterns=config_data.get("exclude_patterns", []))
+        completed = {entry["plugin_name"] for entry in checkpoint["plugins_analyzed"]}
+        pending = [str(p) for p in discovery.discover(plugins_dir) if p.name not in completed]
+
+    if not pending:
+        console.print(f"[green]Session '{session}' is already complete.[/green]")
+        return
+
+    console.print(
+        f"Resuming '{session}': {len(checkpoint['plugins_analyzed'])} plugins done, "
+        f"{len(pending)} remaining"
+    )
+
+    plugin_paths = [Path(p) if Path(p).is_absolute() else plugins_dir / p for p in pending]
+    node_manager = NodeManager(work_dir=str(workspace_root))
+    configure_timeouts(node_manager, config_data, timeout)
+    analysis_cache = create_analysis_cache(node_manager, config_data, workspace_root, no_cache)
+    run_analysis(
+        node_manager, plugin_paths, config_data, jobs, analysis_cache, biome_workspace, biome_daemon,
+        report_formats
+    )
 
 @app.command()
 def view_reports(
     plugin: str = typer.Option(None, "--plugin", "-p", help="View report for specific plugin"),
+    rule: str = typer.Option(None, "--rule", "-r", help="Query diagnostics by rule (% wildcards allowed)"),
+    severity: str = typer.Option(None, "--severity", help="Query diagnostics by severity"),
+    file: str = typer.Option(None, "--file", "-f", help="Query diagnostics by file (% wildcards allowed)"),
+    session: str = typer.Option(None, "--session", "-s", help="Session to query, the latest by default"),
+    limit: int = typer.Option(200, "--limit", min=1, help="Maximum number of diagnostics to show"),
+    sort: str = typer.Option("plugin", "--sort", help="Sort the report list by plugin, updated or issues"),
+    min_issues: int = typer.Option(0, "--min-issues", min=0, help="Only list reports with at least this many issues"),
 ):
-    """View analysis reports."""
+    """View analysis reports, or query diagnostics of a session."""
+    if rule or severity or file or session:
+        query_diagnostics(session, plugin=plugin, rule=rule, severity=severity, file=file, limit=limit)
+        return
+
     reports_dir = Path("reports")
     if not reports_dir.exists():
         console.print("[red]No reports found![/red]")
@@ -286,17 +571,133 @@ def view_reports(
             # Use rich's Markdown renderer
             console.print(Markdown(content))
     else:
-        # List all reports
-        table = Table(title="Available Reports")
-        table.add_column("Plugin")
-        table.add_column("Last Updated")
-        table.add_column("Issues Found")
+        list_reports(reports_dir, sort, min_issues)
+
+def list_reports(reports_dir: Path, sort: str, min_issues: int) -> None:
+    """Print the available reports with their metadata from the report index"""
+    sort_keys = {
+        "plugin": (lambda row: row[0], False),
+        "updated": (lambda row: row[1].get("timestamp", ""), True),
+        "issues": (lambda row: row[1].get("total_issues", -1), True),
+    }
+    if sort not in sort_keys:
+        console.print(f"[red]Cannot sort by '{sort}', use one of: {', '.join(sort_keys)}[/red]")
+        raise typer.Exit(1)
 
-        for report in reports_dir.glob("*_report.md"):
-            # TODO: Parse report metadata
-            table.add_row(report.stem.replace("_report", ""), "N/A", "N/A")
+    index = ReportIndex(reports_dir).load()
+    rows = [
+        (report.stem.replace("_report", ""), index.get(report.name, {}))
+        for report in reports_dir.glob("*_report.md")
+    ]
+    if min_issues:
+        rows = [row for row in rows if row[1].get("total_issues", 0) >= min_issues]
+    key, reverse = sort_keys[sort]
+    rows.sort(key=key, reverse=reverse)
+
+    table = Table(title="Available Reports")
+    table.add_column("Plugin")
+    table.add_column("Last Updated")
+    table.add_column("Issues Found")
+    table.add_column("Errors")
+    table.add_column("Warnings")
+
+    for name, metadata in rows:
+        severities = metadata.get("issues_by_severity", {})
+        table.add_row(
+            name,
+            metadata.get("timestamp", "N/A"),
+            str(metadata.get("total_issues", "N/A")),
+            str(severities.get("error", "N/A")),
+            str(severities.get("warning", "N/A"))
+        )
 
-        console.print(table)
+    console.print(table)
+
+def query_diagnostics(session: Optional[str], limit: int, **filters) -> None:
+    """Print the diagnostics of a session matching filters, answered from the results store"""
+    diagnostics = checkpoint_manager.query_diagnostics(session, limit=limit, **filters)
+    if diagnostics is None:
+        console.print(f"[red]Session '{session}' not found![/red]" if session else "[red]No sessions found![/red]")
+        raise typer.Exit(1)
+
+    table = Table(title="Diagnostics")
+    table.add_column("Plugin")
+    table.add_column("Location")
+    table.add_column("Rule")
+    table.add_column("Severity")
+    table.add_column("Message")
+    for diagnostic in diagnostics:
+        table.add_row(
+            diagnostic["plugin"],
+            f"{diagnostic['file']}:{diagnostic['line']}:{diagnostic['column']}",
+            diagnostic["rule"],
+            diagnostic["severity"],
+            diagnostic["message"]
+        )
+
+    console.print(table)
+    plugins = sorted({diagnostic["plugin"] for diagnostic in diagnostics})
+    console.print(f"{len(diagnostics)} diagnostics in {len(plugins)} plugins: {', '.join(plugins)}")
+    if len(diagnostics) == limit:
+        console.print(f"[yellow]Showing the first {limit}, use --limit to see more[/yellow]")
+
+@app.command()
+def diff(
+    base: str = typer.Argument(..., help="Baseline session name or checkpoint file"),
+    head: str = typer.Argument(..., help="Session name or checkpoint file to compare against the baseline"),
+    as_json: bool = typer.Option(False, "--json", help="Print the diff as JSON"),
+    limit: int = typer.Option(100, "--limit", min=1, help="Maximum number of issues to show per table"),
+    fail_on_new: bool = typer.Option(False, "--fail-on-new", help="Exit with status 1 if there are new issues"),
+):
+    """Show which diagnostics are new, fixed or moved between two sessions."""
+    base_data = load_session(base)
+    head_data = load_session(head)
+    result = diff_sessions(base_data, head_data)
+
+    if as_json:
+        print(json.dumps(result, indent=2))
+    else:
+        for title, key, style in (("New", "new", "red"), ("Fixed", "fixed", "green"), ("Moved", "moved", "yellow")):
+            entries = result[key]
+            if not entries:
+                continue
+            table = Table(title=f"{title} Issues ({len(entries)})", title_style=style)
+            table.add_column("Plugin")
+            table.add_column("Location")
+            table.add_column("Rule")
+            table.add_column("Severity")
+            table.add_column("Message")
+            for entry in entries[:limit]:
+                line = f"{entry['base_line']} -> {entry['line']}" if key == "moved" else str(entry["line"])
+                table.add_row(entry["plugin"], f"{entry['file']}:{line}", entry["rule"], entry["severity"], entry["message"])
+            console.print(table)
+            if len(entries) > limit:
+                console.print(f"[yellow]Showing the first {limit}, use --limit to see more[/yellow]")
+
+        console.print(
+            f"{len(result['new'])} new, {len(result['fixed'])} fixed, {len(result['moved'])} moved "
+            f"in {result['plugins_compared']} plugins analyzed by both sessions"
+        )
+        for key, session in (("failed_in_base", base), ("failed_in_head", head)):
+            if result[key]:
+                console.print(f"[red]Analysis failed in {session}, not compared: {', '.join(result[key])}[/red]")
+        for key, session in (("only_in_base", base), ("only_in_head", head)):
+            if result[key]:
+                console.print(f"[yellow]Only analyzed in {session}: {', '.join(result[key])}[/yellow]")
+
+    if fail_on_new and result["new"]:
+        raise typer.Exit(1)
+
+def load_session(session: str) -> Dict[str, Any]:
+    """Load the latest checkpoint of a session, or a checkpoint file given by path"""
+    if Path(session).is_file():
+        return checkpoint_manager.load_checkpoint(Path(session))
+
+    checkpoint_data = checkpoint_manager.load_latest_session(session)
+    if not checkpoint_data:
+        console.print(f"[red]Session '{session}' not found![/red]")
+        raise typer.Exit(1)
+    return checkpoint_data
 
 def main():
     """Main entry point for the CLI."""
@@ -304,11 +705,40 @@ def main():
         action, params = show_main_menu()
         if action == "start":
             # Call start with default values when coming from menu
-            start(plugins=None, config_path=Path("config/analysis.config.json"))
+            start(
+                plugins=None,
+                config_path=Path("config/analysis.config.json"),
+                jobs=1,
+                no_cache=False,
+                biome_workspace=False,
+                biome_daemon=False,
+                timeout=None,
+                results_db=False,
+                report_format="markdown",
+            )
         elif action == "resume":
-            resume()
+            resume(
+                session=None,
+                config_path=Path("config/analysis.config.json"),
+                jobs=1,
+                no_cache=False,
+                biome_workspace=False,
+                biome_daemon=False,
+                timeout=None,
+                results_db=False,
+                report_format="markdown",
+            )
         elif action == "reports":
-            view_reports()
+            view_reports(
+                plugin=None,
+                rule=None,
+                severity=None,
+                file=None,
+                session=None,
+                limit=200,
+                sort="plugin",
+                min_issues=0,
+            )
     except Exception as e:
         logger.error(f"An error occurred: {str(e)}")
         console.print_exception()
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The scripts import their helpers as "utils.*", relative to this directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,39 @@
+from utils.aggregate_report import AggregateReport
+from utils.diagnostic import Diagnostic
+
+def make_diagnostic(file="src/index.ts", line=1, rule="lint/style/useConst"):
+    return Diagnostic(
+        file=file,
+        line=line,
+        column=5,
+        rule=rule,
+        severity="error",
+        message="This let declares a variable that is only assigned once.",
+        code_snippet=[f"{line} │ let x = 1;"],
+    )
+
+def test_unique_issues_from_saved_state(tmp_path):
+    report = AggregateReport(tmp_path)
+    report.add_plugin("plugin-a", [make_diagnostic()])
+    report.add_plugin("plugin-b", [make_diagnostic(file="src/actions.ts", line=7)])
+    report.save()
+
+    # A later run in which no plugin was analyzed still lists the saved issues
+    issues = AggregateReport(tmp_path).unique_issues()
+
+    assert len(issues) == 1
+    assert issues[0]["rule"] == "lint/style/useConst"
+    assert [(o["plugin"], o["file"], o["line"]) for o in issues[0]["occurrences"]] == [
+        ("plugin-a", "src/index.ts", 1),
+        ("plugin-b", "src/actions.ts", 7),
+    ]
+
+def test_add_plugin_replaces_previous_contribution(tmp_path):
+    report = AggregateReport(tmp_path)
+    report.add_plugin("plugin-a", [make_diagnostic(), make_diagnostic(line=3)])
+    report.add_plugin("plugin-a", [make_diagnostic(rule="lint/suspicious/noExplicitAny")])
+
+    issues = report.unique_issues()
+
+    assert [issue["rule"] for issue in issues] == ["lint/suspicious/noExplicitAny"]
+    assert len(issues[0]["occurrences"]) == 1
@@ -0,0 +1,49 @@
+import json
+
+from utils.analysis_cache import AnalysisCache
+from utils.blob_store import BlobStore
+
+def make_result(dependencies_success=True):
+    return {
+        "success": dependencies_success,
+        "results": {
+            "biome": {"success": True, "output": "", "diagnostics": []},
+            "dependencies": {"success": dependencies_success, "dependencies": {}, "errors": ""},
+        },
+    }
+
+def test_failed_dependency_check_is_not_cached(tmp_path):
+    cache = AnalysisCache(cache_dir=tmp_path / "cache", blob_store=BlobStore(tmp_path / "blobs"))
+    cache.put("ok", "plugin-a", make_result())
+    cache.put("failed", "plugin-a", make_result(dependencies_success=False))
+
+    assert cache.contains("ok")
+    assert not cache.contains("failed")
+
+def test_key_ignores_config_that_does_not_change_results(tmp_path):
+    plugin_path = tmp_path / "plugin-a"
+    (plugin_path / "src").mkdir(parents=True)
+    (plugin_path / "src" / "index.ts").write_text("export const a = 1;\n")
+    cache = AnalysisCache(cache_dir=tmp_path / "cache", workspace_root=tmp_path)
+    versions = {"biome": "1.9.4"}
+
+    key = cache.compute_key(plugin_path, versions, {"biome": {"reporter": "json"}})
+
+    assert key == cache.compute_key(
+        plugin_path, versions, {"biome": {"reporter": "json"}, "logging": {"level": "DEBUG"}, "timeouts": {"plugin": 60}}
+    )
+    assert key != cache.compute_key(plugin_path, versions, {"biome": {"reporter": "text"}})
+
+def test_entries_reference_the_raw_output(tmp_path):
+    cache = AnalysisCache(cache_dir=tmp_path / "cache", blob_store=BlobStore(tmp_path / "blobs"))
+    result = make_result()
+    result["results"]["biome"].update(output="src/index.ts:1:1 lint/style/useConst\n" * 100, errors="")
+    cache.put("key", "plugin-a", result)
+
+    entry = json.loads((tmp_path / "cache" / "key.json").read_text())
+    biome = entry["analysis_result"]["results"]["biome"]
+    assert "output" not in biome and biome["output_blob"].startswith("sha256:")
+
+    cached = cache.get("key")["results"]["biome"]
+    assert cached["output"] == result["results"]["biome"]["output"]
+    assert len(cached["all_output"]) == 100
@@ -0,0 +1,103 @@
+import json
+
+import pytest
+
+from utils.biome_json_parser import BiomeJsonStreamParser
+
+SOURCE = 'const a = "é";\nlet b = 1;\n'
+
+def make_report():
+    """A report in the shape of Biome's --reporter=json output, with awkward strings"""
+    diagnostics = [
+        {
+            "category": "lint/style/useConst",
+            "severity": "error",
+            "description": 'This let declares "b", which is never reassigned: use const {not let} [1]',
+            "tags": ["fixable"],
+            "location": {"path": {"file": "src/index.ts"}, "span": [20, 21], "sourceCode": SOURCE},
+        },
+        {
+            "category": "lint/suspicious/noExplicitAny",
+            "severity": "warning",
+            "description": "Escapes \\ \" \n \t é 😀 and a lone } or ] in a string",
+            "location": {"path": {"file": "src/index.ts"}, "span": [6, 7], "sourceCode": SOURCE},
+        },
+    ]
+    return (
+        "Checked 2 files\n"
+        + json.dumps({
+            "summary": {"changed": 0, "unchanged": 2, "errors": 1, "warnings": 1},
+            "diagnostics": diagnostics,
+            "command": "check",
+        }, ensure_ascii=False)
+        + "\n"
+    )
+
+def parse(chunks):
+    parser = BiomeJsonStreamParser()
+    diagnostics = []
+    for chunk in chunks:
+        diagnostics.extend(parser.feed(chunk))
+    diagnostics.extend(parser.close())
+    return parser, diagnostics
+
+def summarize(diagnostics):
+    return [(d["rule"], d["severity"], d["message"], d["line"], d["column"], d["fixable"]) for d in diagnostics]
+
+def test_whole_document():
+    parser, diagnostics = parse([make_report()])
+
+    assert parser.complete
+    assert parser.command == "check"
+    assert parser.get_counts() == {"errors": 1, "warnings": 1, "files_checked": 2}
+    assert summarize(diagnostics) == [
+        ("lint/style/useConst", "error", 'This let declares "b", which is never reassigned: use const {not let} [1]', 2, 5, True),
+        ("lint/suspicious/noExplicitAny", "warning", "Escapes \\ \" \n \t é 😀 and a lone } or ] in a string", 1, 7, False),
+    ]
+    assert diagnostics[0]["code_snippet"] == ["2 │ let b = 1;"]
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 7, 64])
+def test_chunked_document(size):
+    report = make_report()
+    expected = summarize(parse([report])[1])
+
+    parser, diagnostics = parse(report[i:i + size] for i in range(0, len(report), size))
+
+    assert parser.complete
+    assert summarize(diagnostics) == expected
+
+def test_every_split_point():
+    report = make_report()
+    expected = summarize(parse([report])[1])
+
+    # Covers splits inside strings, right after a backslash and inside \u escapes
+    for split in range(1, len(report)):
+        parser, diagnostics = parse([report[:split], report[split:]])
+        assert parser.complete, split
+        assert summarize(diagnostics) == expected, split
+
+def test_truncated_document():
+    report = make_report().rstrip()
+    # Cut off inside the second diagnostic
+    cut = report.index("noExplicitAny")
+
+    parser, diagnostics = parse([report[:cut]])
+
+    assert not parser.complete
+    assert [d["rule"] for d in diagnostics] == ["lint/style/useConst"]
+
+def test_unterminated_document():
+    report = make_report().rstrip()
+    # Every diagnostic is there, but the array and the report are never closed
+    cut = report.index('], "command"')
+
+    parser, diagnostics = parse([report[:cut]])
+
+    assert not parser.complete
+    assert len(diagnostics) == 2
+
+def test_unterminated_string():
+    parser, diagnostics = parse(['{"summary": {"errors": 1}, "command": "che'])
+
+    assert not parser.complete
+    assert diagnostics == []
@@ -0,0 +1,95 @@
+import json
+
+import pytest
+
+from utils.atomic_write import atomic_write
+from utils.blob_store import BlobStore
+from utils.checkpoint_manager import CheckpointManager
+
+def make_manager(checkpoints_dir):
+    manager = CheckpointManager(flush_every=1)
+    manager.checkpoints_dir = checkpoints_dir
+    manager.blob_store = BlobStore(checkpoints_dir / "blobs")
+    return manager
+
+def make_result(plugin_name):
+    return {"plugin_name": plugin_name, "results": {"biome": {"success": True, "output": "", "errors": "", "diagnostics": []}}}
+
+@pytest.fixture
+def manager(tmp_path):
+    return make_manager(tmp_path)
+
+def analyzed(checkpoint_data):
+    return [entry["plugin_name"] for entry in checkpoint_data["plugins_analyzed"]]
+
+def test_torn_last_journal_line_is_skipped(manager, tmp_path):
+    session = manager.start_session("torn")
+    manager.save_plugin_progress("plugin-a", make_result("plugin-a"))
+    manager.active_session.close()
+
+    # A crash in the middle of an append leaves half a record behind
+    with open(session.journal_path, "a", encoding="utf-8") as f:
+        f.write('{"seq": 2, "type": "plugin_analyzed", "data": {"plugin_na')
+
+    assert analyzed(make_manager(tmp_path).load_checkpoint(session.checkpoint_file)) == ["plugin-a"]
+
+    # Appending after the torn line starts a new line instead of extending it
+    manager.save_plugin_progress("plugin-b", make_result("plugin-b"))
+
+    assert analyzed(make_manager(tmp_path).load_checkpoint(session.checkpoint_file)) == ["plugin-a", "plugin-b"]
+
+def test_records_are_not_applied_twice_after_interrupted_compaction(manager, tmp_path):
+    session = manager.start_session("compaction")
+    for plugin_name in ("plugin-a", "plugin-b", "plugin-c"):
+        manager.save_plugin_progress(plugin_name, make_result(plugin_name))
+    manager.active_session.close()
+
+    # Compaction wrote the snapshot but crashed before removing the journal
+    checkpoint_data = manager.load_checkpoint(session.checkpoint_file)
+    with atomic_write(session.checkpoint_file) as f:
+        json.dump(checkpoint_data, f)
+    assert session.journal_path.exists()
+
+    loaded = make_manager(tmp_path).load_checkpoint(session.checkpoint_file)
+
+    assert analyzed(loaded) == ["plugin-a", "plugin-b", "plugin-c"]
+    assert loaded["journal_seq"] == 3
+
+def test_resume_continues_sequence(manager, tmp_path):
+    manager.start_session("resume")
+    manager.save_plugin_progress("plugin-a", make_result("plugin-a"))
+
+    resumed = make_manager(tmp_path)
+    assert analyzed(resumed.resume_session("resume")) == ["plugin-a"]
+    resumed.save_plugin_progress("plugin-b", make_result("plugin-b"))
+
+    assert analyzed(make_manager(tmp_path).load_latest_session("resume")) == ["plugin-a", "plugin-b"]
+
+def test_checkpoints_missing_from_the_index_are_found(manager, tmp_path):
+    manager.start_session("indexed")
+
+    # Another process starts a session the index cached here does not know about
+    other = make_manager(tmp_path)
+    session = other.start_session("unindexed")
+    other.save_plugin_progress("plugin-a", make_result("plugin-a"))
+
+    assert manager._get_latest_checkpoint("unindexed") == session.checkpoint_file
+    assert analyzed(manager.load_latest_session("unindexed")) == ["plugin-a"]
+    assert manager._get_latest_checkpoint("never-started") is None
+
+def test_pending_results_are_flushed_once_due_without_new_records(manager, tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("utils.checkpoint_manager.time.monotonic", lambda: now[0])
+    manager.configure_flush(flush_every=10, flush_interval=5.0)
+    session = manager.start_session("idle")
+    manager.save_plugin_progress("plugin-a", make_result("plugin-a"))
+
+    manager.flush_if_due()
+    assert manager.seconds_until_flush() == 5.0
+    assert not session.journal_path.exists()
+
+    now[0] += 5.0
+    manager.flush_if_due()
+
+    assert manager.seconds_until_flush() is None
+    assert analyzed(make_manager(tmp_path).load_checkpoint(session.checkpoint_file)) == ["plugin-a"]
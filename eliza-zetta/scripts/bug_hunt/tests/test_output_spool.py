@@ -0,0 +1,35 @@
+from utils.output_spool import OutputSpool
+
+def test_spills_and_discards(tmp_path):
+    spool = OutputSpool(10, spool_dir=tmp_path)
+    spool.write("line one\n")
+    assert not spool.spilled
+    spool.write("line two\nline three\n")
+    spool.close()
+
+    assert spool.spilled
+    assert list(spool.iter_lines()) == ["line one", "line two", "line three"]
+
+    spool.discard()
+
+    assert list(tmp_path.iterdir()) == []
+    assert spool.head() == "line one\n"
+
+def test_discard_without_spill(tmp_path):
+    spool = OutputSpool(100, spool_dir=tmp_path)
+    spool.write("short\n")
+    spool.discard()
+
+    assert list(spool.iter_lines()) == ["short"]
+
+def test_without_spill_only_the_head_is_kept(tmp_path):
+    spool = OutputSpool(10, spool_dir=tmp_path, spill=False)
+    spool.write("line one\n")
+    spool.write("line two\n")
+    spool.discard()
+
+    assert not spool.spilled
+    assert spool.truncated
+    assert spool.total_chars == 18
+    assert spool.head() == "line one\nl"
+    assert list(tmp_path.iterdir()) == []
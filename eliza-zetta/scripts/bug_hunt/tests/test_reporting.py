@@ -0,0 +1,52 @@
+import io
+import json
+
+from utils.diagnostic import Diagnostic
+from utils.reporting import BiomeReportGenerator, ReportIndex
+
+def test_sarif_locations_are_workspace_relative():
+    report_gen = BiomeReportGenerator()
+    report_gen.load_biome_result(
+        {
+            "diagnostics": [
+                Diagnostic(file="src/index.ts", line=3, column=7, rule="lint/style/useConst", severity="error", message="Use const"),
+            ],
+            "summary": {"errors": 1, "warnings": 0, "files_checked": 1},
+        },
+        plugin_name="plugin-foo",
+        source_dir="packages/plugin-foo",
+    )
+
+    f = io.StringIO()
+    report_gen.write_sarif_report(f)
+    run = json.loads(f.getvalue())["runs"][0]
+
+    location = run["results"][0]["locations"][0]["physicalLocation"]
+    assert location["artifactLocation"] == {"uri": "packages/plugin-foo/src/index.ts", "uriBaseId": "%SRCROOT%"}
+    assert location["region"] == {"startLine": 3, "startColumn": 7}
+    assert "%SRCROOT%" in run["originalUriBaseIds"]
+    assert run["tool"]["driver"]["rules"] == [
+        {"id": "lint/style/useConst", "helpUri": "https://biomejs.dev/linter/rules/use-const"}
+    ]
+
+def test_save_report_records_outputs_in_index(tmp_path):
+    report_gen = BiomeReportGenerator()
+    report_gen.load_biome_result(
+        {
+            "diagnostics": [Diagnostic(file="src/index.ts", line=1, rule="lint/style/useConst", severity="warning")],
+            "summary": {"errors": 0, "warnings": 1, "files_checked": 1},
+        },
+        plugin_name="plugin-foo",
+    )
+
+    report_gen.save_report(tmp_path, formats=("markdown", "sarif", "json"))
+
+    index = ReportIndex(tmp_path).load()
+    metadata = index["plugin-plugin-foo_report.md"]
+    assert metadata["total_issues"] == 1
+    assert metadata["outputs"] == {
+        "markdown": "plugin-plugin-foo_report.md",
+        "sarif": "plugin-plugin-foo_report.sarif",
+        "json": "plugin-plugin-foo_report.json",
+    }
+    assert all((tmp_path / name).is_file() for name in metadata["outputs"].values())
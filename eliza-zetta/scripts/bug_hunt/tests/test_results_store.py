@@ -0,0 +1,42 @@
+import pytest
+
+from utils.results_store import ResultsStore
+
+def diagnostic(file, rule, severity="error"):
+    return {"file": file, "line": 1, "column": 1, "rule": rule, "severity": severity, "message": "m"}
+
+@pytest.fixture
+def store(tmp_path):
+    store = ResultsStore(tmp_path / "results.db")
+    diagnostics = [
+        diagnostic("src/index.ts", "lint/style/useConst"),
+        diagnostic("src/my_actions.ts", "lint/suspicious/noExplicitAny", "warning"),
+    ]
+    checkpoint = {
+        "session_name": "session",
+        "plugins_analyzed": [
+            {"plugin_name": "plugin-a", "results": {"results": {"biome": {"diagnostics": diagnostics}}}},
+        ],
+    }
+    store.record_session(tmp_path / "session.json", checkpoint)
+    yield store
+    store.close()
+
+def query_plan(store, rule=None, file=None):
+    sql, params = store._diagnostics_query(1, rule, None, file, None, None)
+    return " ".join(row["detail"] for row in store.conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+
+def test_exact_and_pattern_filters(store, tmp_path):
+    checkpoint_file = tmp_path / "session.json"
+
+    by_rule = store.query_diagnostics(checkpoint_file, rule="lint/style/useConst")
+    by_file = store.query_diagnostics(checkpoint_file, file="src/my_actions.ts")
+
+    assert [d["file"] for d in by_rule] == ["src/index.ts"]
+    assert [d["rule"] for d in by_file] == ["lint/suspicious/noExplicitAny"]
+    assert len(store.query_diagnostics(checkpoint_file, rule="lint/%")) == 2
+    assert [d["file"] for d in store.query_diagnostics(checkpoint_file, file="%actions%")] == ["src/my_actions.ts"]
+
+def test_exact_filters_use_their_index(store):
+    assert "diagnostics_rule (session_id=? AND rule=?)" in query_plan(store, rule="lint/style/useConst")
+    assert "diagnostics_file (session_id=? AND file=?)" in query_plan(store, file="src/index.ts")
@@ -0,0 +1,41 @@
+from utils.session_diff import diff_sessions
+
+def analyzed(plugin_name, diagnostics, success=True):
+    return {
+        "plugin_name": plugin_name,
+        "results": {"results": {"biome": {"success": success, "diagnostics": diagnostics}}},
+    }
+
+def diagnostic(line, rule="lint/style/useConst", snippet="let x = 1;"):
+    return {
+        "file": "src/index.ts",
+        "line": line,
+        "rule": rule,
+        "severity": "error",
+        "message": "Use const",
+        "code_snippet": [f"{line} │ {snippet}"],
+    }
+
+def test_new_fixed_and_moved():
+    base = {"plugins_analyzed": [analyzed("plugin-a", [diagnostic(3), diagnostic(10, snippet="let y = 2;")])]}
+    head = {"plugins_analyzed": [analyzed("plugin-a", [diagnostic(5), diagnostic(12, rule="lint/suspicious/noExplicitAny")])]}
+
+    result = diff_sessions(base, head)
+
+    assert [(e["line"], e["base_line"]) for e in result["moved"]] == [(5, 3)]
+    assert [e["rule"] for e in result["new"]] == ["lint/suspicious/noExplicitAny"]
+    assert [e["line"] for e in result["fixed"]] == [10]
+
+def test_failed_runs_are_not_reported_as_fixed():
+    base = {"plugins_analyzed": [analyzed("plugin-a", [diagnostic(3)]), analyzed("plugin-b", [diagnostic(3)])]}
+    head = {
+        "plugins_analyzed": [analyzed("plugin-a", [], success=False)],
+        "errors": [{"plugin_name": "plugin-b", "error": "Timeout"}],
+    }
+
+    result = diff_sessions(base, head)
+
+    assert result["fixed"] == [] and result["new"] == []
+    assert result["plugins_compared"] == 0
+    assert result["failed_in_head"] == ["plugin-a", "plugin-b"]
+    assert result["only_in_base"] == [] and result["only_in_head"] == []
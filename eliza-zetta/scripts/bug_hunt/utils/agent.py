@@ -12,6 +12,8 @@ import os
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
 from dotenv import load_dotenv
+from utils.aggregate_report import AggregateReport
+from utils.reporting import ReportIndex
 
 # Load environment variables
 load_dotenv()
@@ -27,6 +29,28 @@ console = Console()
 # Configure logger
 logger = logging.getLogger("biome_workflow")
 
+# Deduplicated issues written by AggregateReport.save_unique_issues
+UNIQUE_ISSUES_FILE = AggregateReport.ISSUES_FILE
+# JSON files the bug hunter writes next to the Biome reports, which are not Biome output
+GENERATED_REPORT_FILES = (ReportIndex.INDEX_FILE, AggregateReport.STATE_FILE, UNIQUE_ISSUES_FILE)
+# Unique issues sent to the agent per request
+ISSUES_PER_REQUEST = 25
+# Occurrences listed per issue; the rest are only counted
+LOCATIONS_PER_ISSUE = 5
+
+def is_generated_report(report_file: Path) -> bool:
+    """Whether a JSON file in the reports directory is one of the bug hunter's own outputs.
+
+    Besides the index and summaries, that is the per-plugin JSON reports
+    (plugin-<name>_report.json) and the consolidated analyses this workflow saves.
+    """
+    name = report_file.name
+    return (
+        name in GENERATED_REPORT_FILES
+        or (name.startswith("plugin-") and name.endswith("_report.json"))
+        or name.startswith("consolidated_analysis_")
+    )
+
 class BiomeWorkflow:
     def __init__(self):
 
@@ -166,11 +190,17 @@ Format:
         """Run the complete analysis workflow for all reports"""
         logger.info("Starting analysis workflow for reports")
 
+        issues_file = PR_REPORTS_PATH / UNIQUE_ISSUES_FILE
+        if issues_file.exists():
+            return self.run_unique_issues(issues_file)
+
         try:
             results = []
 
             # Process each report file in the reports directory
             for report_file in PR_REPORTS_PATH.glob("*.json"):
+                if is_generated_report(report_file):
+                    continue
                 logger.info(f"Processing report file: {report_file}")
 
                 try:
@@ -198,6 +228,57 @@ Format:
             logger.error(error_msg)
             return {"error": error_msg, "status": "failed"}
 
+    def run_unique_issues(self, issues_file: Path) -> Dict[str, Any]:
+        """Analyze deduplicated issues, sending each distinct issue to the agent once.
+
+        Issues copied between plugins appear once, with the number of places they
+        occur and the first few of them, instead of once per plugin report.
+        """
+        logger.info(f"Processing unique issues file: {issues_file}")
+
+        try:
+            with open(issues_file, encoding="utf-8") as f:
+                issues = json.load(f).get("issues", [])
+
+            results = []
+            for start in range(0, len(issues), ISSUES_PER_REQUEST):
+                batch = issues[start:start + ISSUES_PER_REQUEST]
+                biome_data = json.dumps({
+                    "issues": [
+                        {
+                            "rule": issue["rule"],
+                            "severity": issue["severity"],
+                            "message": issue["message"],
+                            "code_snippet": issue["code_snippet"],
+                            "occurrence_count": len(issue["occurrences"]),
+                            "plugins": sorted({o["plugin"] for o in issue["occurrences"]}),
+                            "locations": [
+                                f"{o['plugin']}/{o['file']}:{o['line']}:{o['column']}"
+                                for o in issue["occurrences"][:LOCATIONS_PER_ISSUE]
+                            ],
+                        }
+                        for issue in batch
+                    ]
+                }, indent=2, ensure_ascii=False)
+
+                # Generate analysis for this batch of issues
+                final_response = self.generate_final_response(biome_data)
+                results.append({
+                    "file": str(issues_file),
+                    "fingerprints": [issue["fingerprint"] for issue in batch],
+                    "analysis": final_response
+                })
+
+            return {
+                "results": results,
+                "status": "success"
+            }
+
+        except Exception as e:
+            error_msg = f"Analysis workflow failed: {str(e)}"
+            logger.error(error_msg)
+            return {"error": error_msg, "status": "failed"}
+
 if __name__ == "__main__":
     # Configure paths
     PR_REPORTS_PATH = Path("/Users/ilessio/dev-agents/ELIZA_FIX/eliza_aiflow/scripts/bug_hunt/reports")
@@ -0,0 +1,254 @@
+import json
+import logging
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from utils.atomic_write import atomic_write
+from utils.fingerprint import issue_fingerprint
+
+SEVERITIES = ("error", "warning", "info")
+
+
+class AggregateReport:
+    """Workspace-wide summary of the Biome results of every analyzed plugin"""
+
+    STATE_FILE = "workspace_summary.json"
+    REPORT_FILE = "workspace_summary.md"
+    ISSUES_FILE = "unique_issues.json"
+
+    def __init__(self, reports_dir: Path = Path("reports"), top_n: int = 20):
+        self.reports_dir = Path(reports_dir)
+        self.top_n = top_n
+        self.logger = logging.getLogger(__name__)
+
+        self._plugins: Optional[Dict[str, Dict[str, Any]]] = None
+        self._rules: Counter = Counter()
+        self._files: Counter = Counter()
+        self._severities: Counter = Counter()
+        # Fingerprint -> rule, severity, message and snippet of the issue
+        self._issues: Dict[str, Dict[str, Any]] = {}
+        self._issue_counts: Counter = Counter()
+        self._issue_plugins: Counter = Counter()
+
+    @property
+    def state_path(self) -> Path:
+        return self.reports_dir / self.STATE_FILE
+
+    @property
+    def issues_path(self) -> Path:
+        return self.reports_dir / self.ISSUES_FILE
+
+    @property
+    def report_path(self) -> Path:
+        return self.reports_dir / self.REPORT_FILE
+
+    def add_plugin(
+        self,
+        plugin_name: str,
+        diagnostics: List[Dict[str, Any]],
+        summary: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Add the diagnostics of a plugin, replacing what it contributed before"""
+        plugins = self._load()
+        if plugin_name in plugins:
+            self._apply(plugins.pop(plugin_name), -1)
+
+        rules: Counter = Counter()
+        files: Counter = Counter()
+        severities: Counter = Counter()
+        issues: Dict[str, List[list]] = {}
+        for diagnostic in diagnostics:
+            # The verbose parser's stand-in for diagnostics it could not show
+            if diagnostic.get("file") == "Summary":
+                continue
+            rules[diagnostic.get("rule") or "unknown"] += 1
+            files[f"{plugin_name}/{diagnostic.get('file') or 'unknown'}"] += 1
+            severities[diagnostic.get("severity") or "warning"] += 1
+
+            key = issue_fingerprint(diagnostic)
+            if key not in self._issues:
+                self._issues[key] = {
+                    "rule": diagnostic.get("rule") or "unknown",
+                    "severity": diagnostic.get("severity") or "warning",
+                    "message": diagnostic.get("message") or "",
+                    "code_snippet": list(diagnostic.get("code_snippet") or []),
+                }
+            issues.setdefault(key, []).append(
+                [
+                    diagnostic.get("file") or "",
+                    diagnostic.get("line") or 0,
+                    diagnostic.get("column") or 0,
+                ]
+            )
+
+        # Biome's totals also count diagnostics past its display limit
+        if summary:
+            severities["error"] = max(severities["error"], summary.get("errors", 0))
+            severities["warning"] = max(severities["warning"], summary.get("warnings", 0))
+
+        entry = {
+            "updated_at": datetime.now().isoformat(),
+            "severities": dict(severities),
+            "rules": dict(rules),
+            "files": dict(files),
+            "issues": issues,
+        }
+        plugins[plugin_name] = entry
+        self._apply(entry, 1)
+
+    def save(self) -> None:
+        """Write the running totals and the rendered markdown summary.
+
+        Rewrites both files in full, so call it once all plugins of a run were added.
+        """
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
+        with atomic_write(self.state_path) as f:
+            json.dump({"plugins": self._load(), "issues": self._issues}, f)
+        with atomic_write(self.report_path) as f:
+            self.write_markdown_report(f)
+
+    def unique_issues(self) -> List[Dict[str, Any]]:
+        """Every distinct issue once, most frequent first, with the places it occurs"""
+        # Loading the state first fills in the issues of earlier runs
+        plugins = self._load()
+        occurrences: Dict[str, List[Dict[str, Any]]] = {key: [] for key in self._issue_counts}
+        for plugin_name, entry in sorted(plugins.items()):
+            for key, locations in entry.get("issues", {}).items():
+                occurrences[key].extend(
+                    {"plugin": plugin_name, "file": file_path, "line": line, "column": column}
+                    for file_path, line, column in locations
+                )
+
+        return [
+            {"fingerprint": key, **self._issues[key], "occurrences": occurrences[key]}
+            for key, _ in self._issue_counts.most_common()
+        ]
+
+    def save_unique_issues(self) -> None:
+        """Write unique_issues.json, the deduplicated issues for tools such as BiomeWorkflow"""
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
+        issues = self.unique_issues()
+        with atomic_write(self.issues_path) as f:
+            json.dump(
+                {
+                    "generated_at": datetime.now().isoformat(),
+                    "total_occurrences": sum(len(issue["occurrences"]) for issue in issues),
+                    "issues": issues,
+                },
+                f,
+            )
+
+    def write_markdown_report(self, f) -> None:
+        """Write the markdown summary to an open file, one line at a time"""
+        lines = self.iter_markdown_lines()
+        f.write(next(lines))
+        for line in lines:
+            f.write("\n")
+            f.write(line)
+
+    def iter_markdown_lines(self) -> Iterator[str]:
+        """Yield the lines of the markdown summary, without line endings"""
+        plugins = self._load()
+
+        # Header
+        yield "# Biome Workspace Summary"
+        yield f"\nGenerated at: {datetime.now().isoformat()}\n"
+
+        # Summary
+        yield "## Summary"
+        yield f"- Plugins Analyzed: {len(plugins)}"
+        yield f"- Total Issues: {sum(self._severities.values())}"
+        with_issues = sum(1 for entry in plugins.values() if any(entry["severities"].values()))
+        yield f"- Plugins With Issues: {with_issues}"
+        yield f"- Unique Issues: {len(self._issue_counts)}"
+
+        # Severity histogram
+        yield "\n## Issues by Severity"
+        yield "\n```"
+        largest = max(self._severities.values(), default=0)
+        for severity in SEVERITIES:
+            count = self._severities.get(severity, 0)
+            bar = "█" * round(40 * count / largest) if largest else ""
+            yield f"{severity.capitalize():<8} {count:>7} {bar}".rstrip()
+        yield "```"
+
+        yield f"\n## Top {self.top_n} Rules"
+        yield "\n| Rule | Issues |"
+        yield "| --- | ---: |"
+        for rule, count in self._rules.most_common(self.top_n):
+            yield f"| `{rule}` | {count} |"
+
+        yield f"\n## Top {self.top_n} Noisiest Files"
+        yield "\n| File | Issues |"
+        yield "| --- | ---: |"
+        for file_path, count in self._files.most_common(self.top_n):
+            yield f"| {file_path} | {count} |"
+
+        yield f"\n## Top {self.top_n} Issues Repeated Across Plugins"
+        yield "\n| Rule | Message | Occurrences | Plugins |"
+        yield "| --- | --- | ---: | ---: |"
+        shown = 0
+        for key, count in self._issue_counts.most_common():
+            if shown == self.top_n:
+                break
+            if self._issue_plugins[key] < 2:
+                continue
+            issue = self._issues[key]
+            message = (
+                issue["message"].splitlines()[0].replace("|", "\\|") if issue["message"] else ""
+            )
+            yield f"| `{issue['rule']}` | {message} | {count} | {self._issue_plugins[key]} |"
+            shown += 1
+
+        yield "\n## Plugins"
+        yield "\n| Plugin | Errors | Warnings | Info | Total |"
+        yield "| --- | ---: | ---: | ---: | ---: |"
+        ranked = sorted(
+            plugins.items(), key=lambda item: (-sum(item[1]["severities"].values()), item[0])
+        )
+        for plugin_name, entry in ranked:
+            counts = [entry["severities"].get(severity, 0) for severity in SEVERITIES]
+            total = sum(entry["severities"].values())
+            yield f"| {plugin_name} | {' | '.join(str(count) for count in counts)} | {total} |"
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Per-plugin contributions, read from the state file on first use"""
+        if self._plugins is None:
+            self._plugins = {}
+            try:
+                with open(self.state_path, "r", encoding="utf-8") as f:
+                    state = json.load(f)
+                self._plugins = state.get("plugins", {})
+                self._issues = state.get("issues", {})
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                self.logger.warning(
+                    f"Cannot read {self.state_path}, starting a new summary: {str(e)}"
+                )
+
+            for entry in self._plugins.values():
+                self._apply(entry, 1)
+        return self._plugins
+
+    def _apply(self, entry: Dict[str, Any], sign: int) -> None:
+        """Add (sign 1) or remove (sign -1) a plugin's contribution to the totals"""
+        for totals, counts in (
+            (self._rules, entry["rules"]),
+            (self._files, entry["files"]),
+            (self._severities, entry["severities"]),
+        ):
+            for key, count in counts.items():
+                totals[key] += sign * count
+                if totals[key] <= 0:
+                    del totals[key]
+
+        for key, locations in entry.get("issues", {}).items():
+            self._issue_counts[key] += sign * len(locations)
+            self._issue_plugins[key] += sign
+            if self._issue_counts[key] <= 0:
+                del self._issue_counts[key]
+                del self._issue_plugins[key]
+                self._issues.pop(key, None)
@@ -0,0 +1,176 @@
+import os
+import json
+import time
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from utils.atomic_write import atomic_write
+from utils.blob_store import BlobStore
+from utils.plugin_discovery import DEFAULT_IGNORED_DIRS
+from utils.diagnostic import Diagnostic, to_json
+from utils.node_manager import BIOME_CONFIG_FILES
+
+# Sections of the analysis config that change the results, the others (logging,
+# timeouts, checkpoint, cache, ...) only change how the analysis runs
+RESULT_CONFIG_SECTIONS = ("biome",)
+
+class AnalysisCache:
+    """Persistent cache of analysis results keyed by plugin content.
+
+    The key hashes every source file of the plugin, the Biome configuration files
+    that apply to it, the tool versions and the parts of the analysis configuration
+    that affect results, so a hit is only possible when re-running the tools would
+    produce the same result. Only results of runs where every tool succeeded are
+    stored. Entries are evicted least-recently-used first once the cache grows past
+    max_entries, and unconditionally after max_age_days. Raw Biome output is kept
+    in the BlobStore shared with the checkpoints, entries only reference it.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_entries: int = 500,
+        max_age_days: float = 30,
+        workspace_root: Optional[Path] = None,
+        blob_store: Optional[BlobStore] = None,
+    ):
+        self.root_dir = Path(__file__).parent.parent
+        self.cache_dir = Path(cache_dir) if cache_dir else self.root_dir / "cache" / "analysis"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self.workspace_root = Path(workspace_root).resolve() if workspace_root else None
+        self.blob_store = blob_store or BlobStore(self.root_dir / "blobs")
+
+        self.logger = logging.getLogger(__name__)
+        self.logger.debug(f"Initialized AnalysisCache with cache dir: {self.cache_dir}")
+
+    def compute_key(self, plugin_path: Path, tool_versions: Dict[str, str], config: Dict[str, Any]) -> str:
+        """Hash the plugin sources, Biome config, tool versions and analysis config"""
+        plugin_path = Path(plugin_path).resolve()
+        digest = hashlib.sha256()
+        digest.update(json.dumps(tool_versions, sort_keys=True).encode("utf-8"))
+        result_config = {section: config.get(section) for section in RESULT_CONFIG_SECTIONS}
+        digest.update(json.dumps(result_config, sort_keys=True, default=str).encode("utf-8"))
+
+        for config_file in self._biome_config_files(plugin_path):
+            self._update_with_file(digest, str(config_file), config_file)
+
+        for rel_path in self._source_files(plugin_path):
+            self._update_with_file(digest, rel_path, plugin_path / rel_path)
+
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored analysis result for key, if any"""
+        entry_path = self.cache_dir / f"{key}.json"
+        try:
+            with open(entry_path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        # Touch the entry so eviction sees it as recently used
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+        self.logger.debug(f"Analysis cache hit for {entry.get('plugin_name')}: {key}")
+        analysis_result = self.blob_store.unpack_result(entry["analysis_result"])
+        biome = analysis_result.get("results", {}).get("biome")
+        if biome and biome.get("diagnostics"):
+            biome["diagnostics"] = [Diagnostic.from_dict(d) for d in biome["diagnostics"]]
+        return analysis_result
+
+    def contains(self, key: str) -> bool:
+        """Check for an entry without loading it"""
+        return (self.cache_dir / f"{key}.json").exists()
+
+    def put(self, key: str, plugin_name: str, analysis_result: Dict[str, Any]) -> None:
+        """Store an analysis result under key"""
+        if not self._is_cacheable(analysis_result):
+            self.logger.debug(f"Not caching incomplete result for {plugin_name}")
+            return
+
+        entry = {
+            "plugin_name": plugin_name,
+            "cached_at": time.time(),
+            "analysis_result": self.blob_store.pack_result(analysis_result),
+        }
+
+        # Concurrent readers never see half an entry
+        with atomic_write(self.cache_dir / f"{key}.json") as f:
+            json.dump(entry, f, default=to_json)
+
+    def evict(self) -> int:
+        """Drop expired entries and trim the cache to max_entries, least recently used first"""
+        entries = []
+        for entry_path in self.cache_dir.glob("*.json"):
+            try:
+                entries.append((entry_path.stat().st_mtime, entry_path))
+            except OSError:
+                continue
+
+        entries.sort(reverse=True)
+        expiry = time.time() - self.max_age_days * 86400
+        evicted = 0
+        for position, (mtime, entry_path) in enumerate(entries):
+            if position >= self.max_entries or mtime < expiry:
+                try:
+                    entry_path.unlink()
+                    evicted += 1
+                except OSError:
+                    pass
+
+        if evicted:
+            self.logger.info(f"Evicted {evicted} analysis cache entries")
+        return evicted
+
+    def _source_files(self, plugin_path: Path) -> List[str]:
+        """List plugin files relative to plugin_path, skipping build output and dependencies"""
+        files = []
+        for dirpath, dirnames, filenames in os.walk(plugin_path):
+            dirnames[:] = [d for d in dirnames if d not in DEFAULT_IGNORED_DIRS]
+            rel_dir = os.path.relpath(dirpath, plugin_path)
+            for filename in filenames:
+                files.append(filename if rel_dir == "." else f"{rel_dir}/{filename}".replace(os.sep, "/"))
+        return sorted(files)
+
+    def _biome_config_files(self, plugin_path: Path) -> List[Path]:
+        """Biome config files from the plugin directory up to the workspace root"""
+        config_files = []
+        for directory in [plugin_path, *plugin_path.parents]:
+            for name in BIOME_CONFIG_FILES:
+                if (directory / name).is_file():
+                    config_files.append(directory / name)
+            if directory == self.workspace_root:
+                break
+        # Biome config used by the bug hunter itself
+        config_files.extend(
+            self.root_dir / name for name in BIOME_CONFIG_FILES if (self.root_dir / name).is_file()
+        )
+        return config_files
+
+    @staticmethod
+    def _update_with_file(digest, name: str, path: Path) -> None:
+        """Feed a file's name and content into digest"""
+        digest.update(name.encode("utf-8"))
+        digest.update(b"\0")
+        try:
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 16), b""):
+                    digest.update(chunk)
+        except OSError:
+            digest.update(b"<unreadable>")
+        digest.update(b"\0")
+
+    @staticmethod
+    def _is_cacheable(analysis_result: Dict[str, Any]) -> bool:
+        """Only cache results where Biome actually ran and the dependency check succeeded"""
+        results = analysis_result.get("results", {})
+        biome = results.get("biome", {})
+        dependencies = results.get("dependencies", {})
+        return bool(biome.get("success") or biome.get("output")) and bool(dependencies.get("success"))
@@ -0,0 +1,30 @@
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator, Union
+
+@contextmanager
+def atomic_write(path: Union[str, Path], mode: str = "w") -> Iterator[IO]:
+    """Open a temporary file next to path, renamed over path once written.
+
+    Readers see either the previous content or the new one, never a partial
+    file. The data is fsynced before the rename, so a crash cannot leave an
+    empty file in place of the previous one. The temporary file is named
+    after the process and thread, so concurrent writers never share it, and it
+    is removed if writing fails, leaving path untouched.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, mode, encoding=None if "b" in mode else "utf-8") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
@@ -0,0 +1,261 @@
+import bisect
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from utils.diagnostic import Diagnostic
+
+# Characters that matter to the scanner outside and inside JSON strings
+STRUCTURAL_CHARS = re.compile(r'["\[\]{}:,]')
+STRING_CHARS = re.compile(r'["\\]')
+# Next element or the end of the diagnostics array
+ARRAY_ITEM_CHARS = re.compile(r"[{\]]")
+# What the end of an array element looks like
+ELEMENT_END = re.compile(r"\}\s*[,\]]")
+# The report object starts on its own line, anything before it (e.g. warnings) is skipped
+DOCUMENT_START = re.compile(r"(?m)^\{")
+
+# Biome severities mapped onto the ones used in reports
+SEVERITY_MAP = {
+    "fatal": "error",
+    "error": "error",
+    "warning": "warning",
+    "information": "info",
+    "hint": "info",
+}
+
+
+class BiomeJsonStreamParser:
+    """Incremental parser for Biome's ``--reporter=json`` output, fed in arbitrary chunks"""
+
+    def __init__(self, source_root: Optional[str] = None):
+        self.source_root = Path(source_root) if source_root else Path(".")
+        self.summary: Dict[str, Any] = {}
+        self.command: Optional[str] = None
+        # Set once the top-level document has been closed
+        self.complete = False
+        self.logger = logging.getLogger(__name__)
+
+        self._buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._expect_key = False
+        self._key: Optional[str] = None
+        self._string_start: Optional[int] = None
+        self._value_start: Optional[int] = None
+        self._retry_size = 0
+        self._attempted_to = 0
+        self._decoder = json.JSONDecoder()
+
+        # Line offsets of the last source file, diagnostics come grouped by file
+        self._source_path: Optional[str] = None
+        self._source: bytes = b""
+        self._line_starts: List[int] = [0]
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """Consume a chunk of output and return the diagnostics it completed"""
+        self._buffer += chunk
+        diagnostics = []
+        buffer = self._buffer
+        pos = self._pos
+
+        while True:
+            if self._depth == 2 and self._key == "diagnostics" and not self._in_string:
+                if self._value_start is None:
+                    match = ARRAY_ITEM_CHARS.search(buffer, pos)
+                    if not match:
+                        pos = len(buffer)
+                        break
+                    if match.group() == "]":
+                        self._depth -= 1
+                        pos = match.end()
+                        continue
+                    self._value_start = match.start()
+                    self._retry_size = 0
+
+                # Wait until enough data arrived to make another decode attempt worthwhile
+                if (
+                    self._retry_size
+                    and len(buffer) - self._value_start < self._retry_size
+                    and not ELEMENT_END.search(buffer, self._attempted_to)
+                ):
+                    pos = len(buffer)
+                    break
+                try:
+                    raw, end = self._decoder.raw_decode(buffer, self._value_start)
+                except json.JSONDecodeError:
+                    self._retry_size = 2 * (len(buffer) - self._value_start)
+                    # The closing brace may be the last character, its separator still to come
+                    self._attempted_to = max(self._value_start, len(buffer) - 1)
+                    pos = len(buffer)
+                    break
+
+                diagnostics.append(self._convert(raw))
+                self._value_start = None
+                pos = end
+                continue
+
+            if self._in_string:
+                pattern = STRING_CHARS
+            elif self._depth == 0:
+                pattern = DOCUMENT_START
+            else:
+                pattern = STRUCTURAL_CHARS
+            match = pattern.search(buffer, pos)
+            if not match:
+                pos = len(buffer)
+                break
+
+            i = match.start()
+            char = buffer[i]
+            pos = i + 1
+
+            if self._in_string:
+                if char == "\\":
+                    if pos >= len(buffer):
+                        # Escape split across chunks, rescan it with the next one
+                        pos = i
+                        break
+                    pos += 1
+                    continue
+                self._in_string = False
+                if self._depth == 1 and self._string_start is not None:
+                    text = json.loads(buffer[self._string_start : pos])
+                    if self._expect_key:
+                        self._key = text
+                    elif self._key == "command":
+                        self.command = text
+                    self._string_start = None
+                continue
+
+            if char == '"':
+                self._in_string = True
+                if self._depth == 1:
+                    self._string_start = i
+            elif char in "{[":
+                self._depth += 1
+                if self._depth == 1:
+                    self._expect_key = True
+                elif self._depth == 2 and self._key != "diagnostics":
+                    self._value_start = i
+            elif char in "}]":
+                if self._depth == 2 and self._key == "summary" and self._value_start is not None:
+                    self.summary = json.loads(buffer[self._value_start : pos])
+                    self._value_start = None
+                elif self._depth == 2:
+                    self._value_start = None
+                self._depth -= 1
+                if self._depth == 0:
+                    self.complete = True
+            elif self._depth == 1:
+                self._expect_key = char == ","
+
+        # Drop everything that is no longer needed
+        keep_from = min(
+            start for start in (self._value_start, self._string_start, pos) if start is not None
+        )
+        self._buffer = buffer[keep_from:]
+        self._pos = pos - keep_from
+        if self._value_start is not None:
+            self._value_start -= keep_from
+            self._attempted_to = max(0, self._attempted_to - keep_from)
+        if self._string_start is not None:
+            self._string_start -= keep_from
+
+        return diagnostics
+
+    def close(self) -> List[Dict[str, Any]]:
+        """Finish parsing, returning a last diagnostic still waiting to be decoded"""
+        diagnostics = []
+        if self._value_start is not None and self._depth == 2 and self._key == "diagnostics":
+            try:
+                raw, _ = self._decoder.raw_decode(self._buffer, self._value_start)
+                diagnostics.append(self._convert(raw))
+            except json.JSONDecodeError:
+                pass
+
+        if self._depth or self._in_string:
+            self.logger.warning("Biome JSON output ended unexpectedly, it may be truncated")
+        self._buffer = ""
+        self._source = b""
+        self._line_starts = [0]
+        return diagnostics
+
+    def get_counts(self) -> Dict[str, int]:
+        """Error and warning totals as reported by Biome's summary"""
+        return {
+            "errors": self.summary.get("errors", 0),
+            "warnings": self.summary.get("warnings", 0),
+            "files_checked": self.summary.get("changed", 0) + self.summary.get("unchanged", 0),
+        }
+
+    def _convert(self, raw: Dict[str, Any]) -> Diagnostic:
+        """Convert a Biome diagnostic into the report diagnostic shape"""
+        location = raw.get("location") or {}
+        path = location.get("path") or {}
+        file_path = path.get("file", "") if isinstance(path, dict) else str(path)
+        span = location.get("span")
+        tags = raw.get("tags") or []
+
+        line, column, snippet = 0, 0, []
+        if file_path and span:
+            line, column, snippet = self._locate(file_path, span, location.get("sourceCode"))
+
+        return Diagnostic(
+            file=file_path,
+            line=line,
+            column=column,
+            rule=raw.get("category") or "",
+            severity=SEVERITY_MAP.get(raw.get("severity", ""), "warning"),
+            message=raw.get("description", ""),
+            code_snippet=snippet,
+            fixable="fixable" in tags if isinstance(tags, list) else False,
+        )
+
+    def _locate(
+        self, file_path: str, span: List[int], source_code: Optional[str]
+    ) -> tuple[int, int, List[str]]:
+        """Turn a byte span into a 1-based line/column and the source lines it covers"""
+        if file_path != self._source_path:
+            if source_code is not None:
+                self._set_source(file_path, source_code.encode("utf-8"))
+            else:
+                try:
+                    with open(self.source_root / file_path, "rb") as f:
+                        self._set_source(file_path, f.read())
+                except OSError:
+                    self._set_source(file_path, b"")
+
+        if not self._source:
+            return 0, 0, []
+
+        start, end = span[0], max(span[0], span[1])
+        first = bisect.bisect_right(self._line_starts, start) - 1
+        last = bisect.bisect_right(self._line_starts, end) - 1
+        column = (
+            len(self._source[self._line_starts[first] : start].decode("utf-8", errors="replace"))
+            + 1
+        )
+
+        snippet = []
+        for index in range(first, min(last, first + 4) + 1):
+            line_end = (
+                self._line_starts[index + 1]
+                if index + 1 < len(self._line_starts)
+                else len(self._source)
+            )
+            text = self._source[self._line_starts[index] : line_end].decode(
+                "utf-8", errors="replace"
+            )
+            snippet.append(f"{index + 1} │ {text.rstrip()}")
+
+        return first + 1, column, snippet
+
+    def _set_source(self, file_path: str, source: bytes) -> None:
+        """Remember a source file and index its line starts"""
+        self._source_path = file_path
+        self._source = source
+        self._line_starts = [0] + [match.end() for match in re.finditer(rb"\n", source)]
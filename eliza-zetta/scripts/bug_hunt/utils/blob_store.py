@@ -0,0 +1,91 @@
+import gzip
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from utils.atomic_write import atomic_write
+
+# Biome result fields moved into the blob store, and the fields derived from them
+BLOB_FIELDS = ("output", "errors")
+DERIVED_FIELDS = ("raw_output", "all_output", "error_logs")
+
+class BlobStore:
+    """Content-addressed store of gzip-compressed text.
+
+    Blobs are named after the SHA-256 of their content, so storing the same
+    output twice (e.g. an unchanged plugin in another session) costs nothing.
+    Checkpoints keep only the "sha256:<hex>" reference and load the text when
+    something actually needs it.
+    """
+
+    def __init__(self, blobs_dir: Optional[Path] = None):
+        root_dir = Path(__file__).parent.parent
+        self.blobs_dir = Path(blobs_dir) if blobs_dir else root_dir / "blobs"
+        self.logger = logging.getLogger(__name__)
+
+    def put(self, text: str) -> str:
+        """Store text and return its reference"""
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        blob_path = self._blob_path(digest)
+
+        if not blob_path.exists():
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            with atomic_write(blob_path, "wb") as f:
+                f.write(gzip.compress(data, compresslevel=6))
+
+        return f"sha256:{digest}"
+
+    def get(self, ref: str) -> str:
+        """Load the text a reference points to"""
+        digest = ref.split(":", 1)[-1]
+        with open(self._blob_path(digest), "rb") as f:
+            return gzip.decompress(f.read()).decode("utf-8")
+
+    def pack_result(self, analysis_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of an analysis result with the raw Biome output replaced by blob references.
+
+        "output" and "errors" become "output_blob" and "errors_blob"; the fields
+        that only repeat them in another shape are dropped. Diagnostics, summary
+        and the other structured fields stay as they are.
+        """
+        results = analysis_result.get("results")
+        biome = results.get("biome") if isinstance(results, dict) else None
+        if not biome or not any(field in biome for field in BLOB_FIELDS):
+            return analysis_result
+
+        packed_biome = {
+            key: value for key, value in biome.items()
+            if key not in BLOB_FIELDS and key not in DERIVED_FIELDS
+        }
+        for field in BLOB_FIELDS:
+            packed_biome[f"{field}_blob"] = self.put(biome.get(field) or "")
+
+        return {**analysis_result, "results": {**results, "biome": packed_biome}}
+
+    def unpack_result(self, analysis_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of a packed analysis result with the raw Biome output loaded back"""
+        results = analysis_result.get("results")
+        biome = results.get("biome") if isinstance(results, dict) else None
+        if not biome or "output_blob" not in biome:
+            return analysis_result
+
+        unpacked_biome = {key: value for key, value in biome.items() if not key.endswith("_blob")}
+        for field in BLOB_FIELDS:
+            try:
+                unpacked_biome[field] = self.get(biome[f"{field}_blob"])
+            except (OSError, KeyError) as e:
+                self.logger.warning(f"Cannot load Biome {field} blob: {str(e)}")
+                unpacked_biome[field] = ""
+
+        output, errors = unpacked_biome["output"], unpacked_biome["errors"]
+        unpacked_biome["raw_output"] = f"STDOUT:\n{output}\n\nSTDERR:\n{errors}"
+        unpacked_biome["all_output"] = output.splitlines()
+        unpacked_biome["error_logs"] = errors.splitlines()
+
+        return {**analysis_result, "results": {**results, "biome": unpacked_biome}}
+
+    def _blob_path(self, digest: str) -> Path:
+        """Blob file for a digest, fanned out over subdirectories by its first two characters"""
+        return self.blobs_dir / digest[:2] / f"{digest[2:]}.gz"
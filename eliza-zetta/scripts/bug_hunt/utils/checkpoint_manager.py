@@ -1,20 +1,139 @@
+import os
 import json
+import time
 from pathlib import Path
 from datetime import datetime
+from typing import Optional, TextIO
 import logging
 
+from utils.atomic_write import atomic_write
+from utils.blob_store import BlobStore
+from utils.diagnostic import to_json
+from utils.results_store import ResultsStore
+
+# Checkpoint lists that journal records are appended to
+JOURNAL_RECORD_TYPES = {
+    "plugin_analyzed": "plugins_analyzed",
+    "error": "errors",
+}
+
+# Maps session names to their checkpoint files, kept in checkpoints/
+SESSION_INDEX_FILE = "sessions.index"
+# SQLite index of the results, kept in checkpoints/
+RESULTS_DB_FILE = "results.sqlite3"
+
+class SessionHandle:
+    """An analysis session progress is being written to.
+
+    Returned by CheckpointManager.start_session and resume_session. It holds the
+    checkpoint path and keeps the journal open for appending, so recording a
+    result needs neither a directory lookup nor an open call. Records wait in
+    pending until the manager flushes them as one batch.
+    """
+
+    def __init__(self, name: str, checkpoint_file: Path, journal_seq: int = 0):
+        self.name = name
+        self.checkpoint_file = Path(checkpoint_file)
+        self.journal_path = self.checkpoint_file.with_suffix(".journal.jsonl")
+        # Last journal sequence number and records since the last compaction
+        self.journal_seq = journal_seq
+        self.journal_records = 0
+        # Records not written yet and when the last batch was
+        self.pending: list[dict] = []
+        self.last_flush = time.monotonic()
+        self._journal: Optional[TextIO] = None
+
+    def append(self, lines: list[str]) -> None:
+        """Append lines to the journal with a single write, and sync them to disk"""
+        if self._journal is None:
+            self._terminate_journal()
+            self._journal = open(self.journal_path, "a", encoding="utf-8")
+        self._journal.write("".join(line + "\n" for line in lines))
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+
+    def close(self) -> None:
+        """Close the journal, e.g. before it is compacted away"""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def _terminate_journal(self) -> None:
+        """End a torn last line left by a crash, so the next record starts on its own line"""
+        if not self.journal_path.exists() or self.journal_path.stat().st_size == 0:
+            return
+
+        with open(self.journal_path, "rb+") as f:
+            f.seek(-1, 2)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+
+    def __fspath__(self) -> str:
+        return str(self.checkpoint_file)
+
+    def __str__(self) -> str:
+        return str(self.checkpoint_file)
+
 class CheckpointManager:
-    def __init__(self):
+    """Stores the progress of analysis sessions in checkpoints/.
+
+    Each session has a JSON snapshot. In journal mode (the default) plugin results
+    and errors are appended to a "<snapshot>.journal.jsonl" file next to it, one
+    JSON line each, instead of rewriting the snapshot, and the journal is folded
+    back into the snapshot every compact_every records. Loading a session replays
+    the journal on top of the snapshot. Journal records carry a sequence number
+    and the snapshot stores the last one it includes, so a crash during compaction
+    never applies a record twice; a torn last line from a crash mid-append is skipped.
+
+    Sessions are looked up by exact name through a small index file, which is
+    rebuilt from the checkpoints if it is missing or out of date.
+
+    Raw Biome output is not stored in checkpoints but in a compressed,
+    content-addressed BlobStore next to them; use load_full_result to get it back.
+
+    With enable_results_store, every result is also indexed in a SQLite
+    ResultsStore as it is recorded, which query_diagnostics answers from.
+
+    Writes are group-committed: results are flushed in batches, once flush_every
+    of them are pending or flush_interval seconds passed since the last batch,
+    with one write and fsync per batch. A crash loses at most the pending batch,
+    whose plugins are then simply analyzed again on resume. Snapshots and the
+    session index are replaced atomically through a temporary file, so an
+    interrupted session is always readable.
+    """
+
+    def __init__(
+        self,
+        journal: bool = True,
+        compact_every: int = 100,
+        flush_every: int = 10,
+        flush_interval: float = 5.0,
+    ):
         # Get the root directory (scripts/bug_hunt)
         self.root_dir = Path(__file__).parent.parent
         self.checkpoints_dir = self.root_dir / "checkpoints"
         self.checkpoints_dir.mkdir(exist_ok=True)
+        self.journal = journal
+        self.compact_every = compact_every
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.blob_store = BlobStore(self.root_dir / "blobs")
+        self.results_store: Optional[ResultsStore] = None
+        self._mirror_results = False
+
+        # Session progress is written to, set by start_session/resume_session
+        self.active_session: Optional[SessionHandle] = None
+        self._index: Optional[dict] = None
 
         # Setup logging
         self.logger = logging.getLogger(__name__)
         self.logger.debug(f"Initialized CheckpointManager with checkpoints dir: {self.checkpoints_dir}")
 
-    def start_session(self, session_name: str) -> str:
+    @property
+    def index_path(self) -> Path:
+        return self.checkpoints_dir / SESSION_INDEX_FILE
+
+    def start_session(self, session_name: str) -> SessionHandle:
         """Start a new analysis session"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         checkpoint_file = self.checkpoints_dir / f"{session_name}_{timestamp}.json"
@@ -30,83 +149,393 @@ class CheckpointManager:
         self.logger.info(f"Starting new session: {session_name}")
         self.logger.info(f"Checkpoint file: {checkpoint_file}")
 
-        with open(checkpoint_file, "w", encoding="utf-8") as f:
-            json.dump(checkpoint_data, f, indent=2)
+        self._activate(SessionHandle(session_name, checkpoint_file))
+        self._write_snapshot(checkpoint_file, checkpoint_data)
+        self._add_to_index(session_name, checkpoint_file)
+        if self._mirror_results:
+            self.results_store.record_session(checkpoint_file, checkpoint_data, self._signature(checkpoint_file))
+        return self.active_session
 
-        return str(checkpoint_file)
+    def resume_session(self, session_name: str) -> Optional[dict]:
+        """Load a session and direct further progress to its checkpoint file"""
+        latest_checkpoint = self._get_latest_checkpoint(session_name)
+        if not latest_checkpoint:
+            return None
 
-    def save_plugin_progress(self, plugin_name: str, analysis_result: dict) -> None:
-        """Save analysis results for a plugin"""
-        latest_checkpoint = self._get_latest_checkpoint()
+        checkpoint_data = self.load_checkpoint(latest_checkpoint)
+
+        checkpoint_data.setdefault("resumed_at", []).append(datetime.now().isoformat())
+        checkpoint_data["last_updated"] = datetime.now().isoformat()
+
+        self._activate(SessionHandle(session_name, latest_checkpoint))
+        self._write_snapshot(latest_checkpoint, checkpoint_data)
+
+        # The resumed session is the latest one again
+        index = self._load_index()
+        index["latest"] = latest_checkpoint.name
+        self._save_index(index)
+
+        if self._mirror_results:
+            self.results_store.record_session(latest_checkpoint, checkpoint_data, self._signature(latest_checkpoint))
+
+        self.logger.info(f"Resuming session {session_name} from {latest_checkpoint}")
+        return checkpoint_data
+
+    def list_sessions(self) -> list[dict]:
+        """Sessions in the index, each with the checkpoint file of its latest run"""
+        return [
+            {"session_name": name, "checkpoint_file": self.checkpoints_dir / files[-1]}
+            for name, files in self._load_index()["sessions"].items()
+            if files
+        ]
+
+    def set_session_plan(self, plugin_paths: list[str], config: dict) -> None:
+        """Record the plugins a session is going to analyze, so it can be resumed"""
+        latest_checkpoint = self._get_active_checkpoint()
         if not latest_checkpoint:
             self.logger.error("No active session found")
             return
 
-        with open(latest_checkpoint, "r", encoding="utf-8") as f:
-            checkpoint_data = json.load(f)
+        checkpoint_data = self.load_checkpoint(latest_checkpoint)
+
+        checkpoint_data["plugins_planned"] = plugin_paths
+        checkpoint_data["config"] = config
+        checkpoint_data["last_updated"] = datetime.now().isoformat()
+
+        self._write_snapshot(latest_checkpoint, checkpoint_data)
 
-        # Update checkpoint data
-        checkpoint_data["plugins_analyzed"].append({
+    def get_pending_plugins(self, checkpoint_data: dict) -> list[str]:
+        """Plugins of a session that failed or were never analyzed, in planned order"""
+        completed = {entry["plugin_name"] for entry in checkpoint_data.get("plugins_analyzed", [])}
+
+        pending = [
+            plugin_path for plugin_path in checkpoint_data.get("plugins_planned", [])
+            if Path(plugin_path).name not in completed
+        ]
+
+        # Failed plugins that were not part of the recorded plan (e.g. older sessions)
+        known = {Path(plugin_path).name for plugin_path in pending}
+        for error in checkpoint_data.get("errors", []):
+            plugin_name = error["plugin_name"]
+            if plugin_name not in completed and plugin_name not in known:
+                pending.append(plugin_name)
+                known.add(plugin_name)
+
+        return pending
+
+    def save_plugin_progress(self, plugin_name: str, analysis_result: dict) -> None:
+        """Save analysis results for a plugin"""
+        if not self._get_active_checkpoint():
+            self.logger.error("No active session found")
+            return
+
+        analyzed_at = datetime.now().isoformat()
+        self._record("plugin_analyzed", {
             "plugin_name": plugin_name,
-            "analyzed_at": datetime.now().isoformat(),
-            "results": analysis_result
+            "analyzed_at": analyzed_at,
+            "results": self.blob_store.pack_result(analysis_result)
         })
-        checkpoint_data["last_updated"] = datetime.now().isoformat()
 
-        with open(latest_checkpoint, "w", encoding="utf-8") as f:
-            json.dump(checkpoint_data, f, indent=2)
+        if self._mirror_results:
+            session = self.active_session
+            self.results_store.record_plugin(
+                session.checkpoint_file, session.name, plugin_name, analyzed_at, analysis_result,
+                signature=self._mirror_signature(session)
+            )
 
         self.logger.info(f"Saved progress for plugin: {plugin_name}")
 
     def add_error(self, plugin_name: str, error_message: str) -> None:
         """Add an error to the current session"""
-        latest_checkpoint = self._get_latest_checkpoint()
-        if not latest_checkpoint:
+        if not self._get_active_checkpoint():
             self.logger.error("No active session found")
             return
 
-        with open(latest_checkpoint, "r", encoding="utf-8") as f:
-            checkpoint_data = json.load(f)
-
-        # Add error
-        checkpoint_data["errors"].append({
+        timestamp = datetime.now().isoformat()
+        self._record("error", {
             "plugin_name": plugin_name,
             "error": error_message,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         })
-        checkpoint_data["last_updated"] = datetime.now().isoformat()
 
-        with open(latest_checkpoint, "w", encoding="utf-8") as f:
-            json.dump(checkpoint_data, f, indent=2)
+        if self._mirror_results:
+            session = self.active_session
+            self.results_store.record_error(
+                session.checkpoint_file, session.name, plugin_name, timestamp, error_message,
+                signature=self._mirror_signature(session)
+            )
 
         self.logger.error(f"Added error for plugin {plugin_name}: {error_message}")
 
-    def load_latest_session(self, session_name: str = None) -> dict:
+    def load_latest_session(self, session_name: str = None) -> Optional[dict]:
         """Load the latest checkpoint for a session"""
         latest_checkpoint = self._get_latest_checkpoint(session_name)
         if not latest_checkpoint:
             return None
 
-        with open(latest_checkpoint, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return self.load_checkpoint(latest_checkpoint)
+
+    def load_checkpoint(self, checkpoint_file: Path) -> dict:
+        """Load a checkpoint snapshot with its journal replayed on top"""
+        self._flush_if_active(checkpoint_file)
+
+        with open(checkpoint_file, "r", encoding="utf-8") as f:
+            checkpoint_data = json.load(f)
+
+        seq = checkpoint_data.get("journal_seq", 0)
+        for record in self._read_journal(Path(checkpoint_file)):
+            if record["seq"] <= seq:
+                # Already folded into the snapshot by an interrupted compaction
+                continue
+            self._apply_record(checkpoint_data, record)
+            seq = record["seq"]
+
+        checkpoint_data["journal_seq"] = seq
+        return checkpoint_data
 
-    def _get_latest_checkpoint(self, session_name: str = None) -> Path:
-        """Get the path to the latest checkpoint file"""
-        if not self.checkpoints_dir.exists():
+    def configure_flush(self, flush_every: int = None, flush_interval: float = None) -> None:
+        """Change how many results, or how many seconds, a batch of writes waits for"""
+        if flush_every is not None:
+            self.flush_every = max(1, flush_every)
+        if flush_interval is not None:
+            self.flush_interval = flush_interval
+
+    def seconds_until_flush(self) -> Optional[float]:
+        """Time left until the pending results are due, None if nothing is pending"""
+        session = self.active_session
+        if session is None or not session.pending:
             return None
+        return max(0.0, session.last_flush + self.flush_interval - time.monotonic())
+
+    def flush_if_due(self) -> None:
+        """Flush the pending results once flush_interval has passed.
+
+        Results are otherwise only flushed as the next one is recorded, so callers
+        waiting for more work call this while idle, see seconds_until_flush.
+        """
+        if self.seconds_until_flush() == 0:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the pending results of the active session as one batch"""
+        session = self.active_session
+        if session is None or not session.pending:
+            return
+
+        records, session.pending = session.pending, []
+        session.last_flush = time.monotonic()
 
-        checkpoints = list(self.checkpoints_dir.glob("*.json"))
-        if not checkpoints:
+        if self.journal:
+            session.append([json.dumps(record, default=to_json) for record in records])
+            session.journal_records += len(records)
+            if session.journal_records >= self.compact_every:
+                self.compact(session.checkpoint_file)
+        else:
+            checkpoint_data = self.load_checkpoint(session.checkpoint_file)
+            for record in records:
+                self._apply_record(checkpoint_data, record)
+            self._write_snapshot(session.checkpoint_file, checkpoint_data)
+
+        if self._mirror_results:
+            self.results_store.update_signature(session.checkpoint_file, self._signature(session.checkpoint_file))
+
+    def enable_results_store(self) -> None:
+        """Index every result in the SQLite results store as it is recorded"""
+        self._open_results_store()
+        self._mirror_results = True
+
+    def query_diagnostics(self, session_name: str = None, **filters) -> Optional[list[dict]]:
+        """Diagnostics of a session (the latest by default) matching filters, see ResultsStore.query_diagnostics.
+
+        Sessions that were not indexed, or changed since, are indexed first.
+        Returns None if there is no such session.
+        """
+        checkpoint_file = self._get_latest_checkpoint(session_name)
+        if not checkpoint_file:
             return None
 
+        store = self._open_results_store()
+        self._flush_if_active(checkpoint_file)
+        signature = self._signature(checkpoint_file)
+        if store.session_signature(checkpoint_file) != signature:
+            self.logger.info(f"Indexing results of {checkpoint_file.name}")
+            store.record_session(checkpoint_file, self.load_checkpoint(checkpoint_file), signature)
+
+        return store.query_diagnostics(checkpoint_file, **filters)
+
+    def load_full_result(self, analysis_result: dict) -> dict:
+        """Analysis result of a checkpoint entry with the raw tool output loaded back in"""
+        return self.blob_store.unpack_result(analysis_result)
+
+    def compact(self, checkpoint_file: Path = None) -> None:
+        """Fold the journal of a checkpoint (the active one by default) into its snapshot"""
+        checkpoint_file = checkpoint_file or self._get_active_checkpoint()
+        if not checkpoint_file:
+            return
+
+        # Also folds in results still waiting for their batch
+        checkpoint_data = self.load_checkpoint(checkpoint_file)
+        if self._journal_path(checkpoint_file).exists():
+            self._write_snapshot(checkpoint_file, checkpoint_data)
+
+    def _open_results_store(self) -> ResultsStore:
+        if self.results_store is None:
+            self.results_store = ResultsStore(self.checkpoints_dir / RESULTS_DB_FILE)
+        return self.results_store
+
+    def _signature(self, checkpoint_file: Path) -> str:
+        """Cheap fingerprint of a checkpoint's current state: snapshot mtime and journal size"""
+        journal_path = self._journal_path(checkpoint_file)
+        journal_size = journal_path.stat().st_size if journal_path.exists() else 0
+        return f"{Path(checkpoint_file).stat().st_mtime_ns}:{journal_size}"
+
+    def _flush_if_active(self, checkpoint_file: Path) -> None:
+        """Flush pending results if checkpoint_file belongs to the active session"""
+        if self.active_session is not None and self.active_session.checkpoint_file == Path(checkpoint_file):
+            self.flush()
+
+    def _mirror_signature(self, session: SessionHandle) -> str:
+        """Signature for a result mirrored to the results store.
+
+        While results are still pending the checkpoint on disk does not hold them
+        yet, so the session is marked stale until flush stores the real signature.
+        """
+        return "pending" if session.pending else self._signature(session.checkpoint_file)
+
+    def _activate(self, session: SessionHandle) -> None:
+        """Make session the one progress is written to"""
+        if self.active_session is not None:
+            self.active_session.close()
+        self.active_session = session
+
+    def _record(self, record_type: str, data: dict) -> None:
+        """Add a plugin result or error to the active session, flushing when a batch is due"""
+        session = self.active_session
+        session.journal_seq += 1
+        session.pending.append({
+            "seq": session.journal_seq,
+            "type": record_type,
+            "at": datetime.now().isoformat(),
+            "data": data
+        })
+
+        if len(session.pending) >= self.flush_every:
+            self.flush()
+        else:
+            self.flush_if_due()
+
+    @staticmethod
+    def _apply_record(checkpoint_data: dict, record: dict) -> None:
+        """Apply a journal record to checkpoint data"""
+        checkpoint_data[JOURNAL_RECORD_TYPES[record["type"]]].append(record["data"])
+        checkpoint_data["last_updated"] = record["at"]
+
+    def _write_snapshot(self, checkpoint_file: Path, checkpoint_data: dict) -> None:
+        """Write a checkpoint snapshot that includes everything journaled so far, then drop the journal"""
+        with atomic_write(checkpoint_file) as f:
+            json.dump(checkpoint_data, f, indent=2, default=to_json)
+
+        session = self.active_session
+        if session is not None and session.checkpoint_file == Path(checkpoint_file):
+            session.close()
+            session.journal_records = 0
+            if self.journal:
+                session.journal_seq = checkpoint_data.get("journal_seq", 0)
+
+        journal_path = self._journal_path(checkpoint_file)
+        if journal_path.exists():
+            journal_path.unlink()
+
+        if self._mirror_results:
+            self.results_store.update_signature(checkpoint_file, self._signature(checkpoint_file))
+
+    def _read_journal(self, checkpoint_file: Path) -> list[dict]:
+        """Read the journal records of a checkpoint, skipping a torn last line"""
+        journal_path = self._journal_path(checkpoint_file)
+        if not journal_path.exists():
+            return []
+
+        records = []
+        with open(journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    self.logger.warning(f"Skipping incomplete journal record in {journal_path}")
+        return records
+
+    @staticmethod
+    def _journal_path(checkpoint_file: Path) -> Path:
+        """Journal file that belongs to a checkpoint snapshot"""
+        return Path(checkpoint_file).with_suffix(".journal.jsonl")
+
+    def _get_active_checkpoint(self) -> Optional[Path]:
+        """Get the checkpoint file of the current session"""
+        if self.active_session is not None:
+            return self.active_session.checkpoint_file
+        return None
+
+    def _get_latest_checkpoint(self, session_name: str = None, rescanned: bool = False) -> Optional[Path]:
+        """Get the path to the latest checkpoint file of a session (of any session without a name)"""
+        index = self._load_index()
         if session_name:
-            # Filter for specific session
-            checkpoints = [c for c in checkpoints if session_name in c.stem]
-            if not checkpoints:
-                return None
+            files = index["sessions"].get(session_name)
+            latest = files[-1] if files else None
+        else:
+            latest = index.get("latest")
+
+        checkpoint_file = self.checkpoints_dir / latest if latest else None
+        if checkpoint_file is not None and checkpoint_file.exists():
+            return checkpoint_file
+        if rescanned:
+            return None
+
+        # Checkpoints were added or removed behind the index's back (by hand or by
+        # another process), rescan checkpoints/ once before giving up
+        self.logger.info(f"No checkpoint indexed for {session_name or 'any session'}, rebuilding the session index")
+        self._rebuild_index()
+        return self._get_latest_checkpoint(session_name, rescanned=True)
+
+    def _add_to_index(self, session_name: str, checkpoint_file: Path) -> None:
+        """Register a new checkpoint file in the session index"""
+        index = self._load_index()
+        index["sessions"].setdefault(session_name, []).append(checkpoint_file.name)
+        index["latest"] = checkpoint_file.name
+        self._save_index(index)
+
+    def _load_index(self) -> dict:
+        """Load the session index, building it from the checkpoints if there is none"""
+        if self._index is None:
+            try:
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    self._index = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                self._rebuild_index()
+        return self._index
+
+    def _rebuild_index(self) -> None:
+        """Index every checkpoint in checkpoints/, oldest run of each session first"""
+        checkpoints = []
+        for checkpoint_file in self.checkpoints_dir.glob("*.json"):
+            try:
+                with open(checkpoint_file, "r", encoding="utf-8") as f:
+                    session_name = json.load(f)["session_name"]
+                checkpoints.append((checkpoint_file.stat().st_mtime, session_name, checkpoint_file.name))
+            except (OSError, json.JSONDecodeError, KeyError):
+                self.logger.warning(f"Skipping unreadable checkpoint {checkpoint_file}")
+
+        index = {"sessions": {}, "latest": None}
+        for _, session_name, file_name in sorted(checkpoints):
+            index["sessions"].setdefault(session_name, []).append(file_name)
+            index["latest"] = file_name
+
+        self._save_index(index)
 
-        # Sort by modification time and return latest
-        return sorted(checkpoints, key=lambda x: x.stat().st_mtime)[-1]
+    def _save_index(self, index: dict) -> None:
+        """Write the session index"""
+        with atomic_write(self.index_path) as f:
+            json.dump(index, f)
+        self._index = index
 
 if __name__ == "__main__":
     # Test the checkpoint manager
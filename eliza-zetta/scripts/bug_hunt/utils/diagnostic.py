@@ -0,0 +1,98 @@
+import sys
+from typing import Dict, Any, List, Optional, Iterator
+
+class Diagnostic:
+    """A single Biome diagnostic.
+
+    Replaces the per-diagnostic dicts the parsers used to build: the fields live
+    in __slots__ instead of a dict with the same eight keys repeated for every
+    diagnostic, and the file, rule and severity strings are interned, so the
+    thousands of diagnostics sharing a file or rule share one string. Item access
+    (d["file"], d.get("rule"), "fixable" in d, ...) still works, so code written
+    against the dict shape keeps working, and to_dict() gives the plain dict for
+    serialization (see to_json).
+    """
+
+    __slots__ = ("file", "line", "column", "rule", "severity", "message", "code_snippet", "fixable")
+
+    # Fields whose values repeat across diagnostics
+    INTERNED = ("file", "rule", "severity")
+
+    def __init__(
+        self,
+        file: str = "",
+        line: int = 0,
+        column: int = 0,
+        rule: str = "",
+        severity: str = "warning",
+        message: str = "",
+        code_snippet: Optional[List[str]] = None,
+        fixable: bool = False,
+    ):
+        self.file = sys.intern(file)
+        self.line = line
+        self.column = column
+        self.rule = sys.intern(rule)
+        self.severity = sys.intern(severity)
+        self.message = message
+        self.code_snippet = code_snippet if code_snippet is not None else []
+        self.fixable = fixable
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Diagnostic":
+        """Diagnostic from its dict shape, as stored in checkpoints and caches"""
+        return cls(
+            file=data.get("file") or "",
+            line=data.get("line") or 0,
+            column=data.get("column") or 0,
+            rule=data.get("rule") or "",
+            severity=data.get("severity") or "warning",
+            message=data.get("message") or "",
+            code_snippet=data.get("code_snippet"),
+            fixable=bool(data.get("fixable")),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    def keys(self) -> tuple:
+        return self.__slots__
+
+    def items(self) -> Iterator[tuple[str, Any]]:
+        return ((key, getattr(self, key)) for key in self.__slots__)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, sys.intern(value) if key in self.INTERNED else value)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__slots__
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (Diagnostic, dict)):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Diagnostic({self.file}:{self.line}:{self.column} {self.rule} {self.severity})"
+
+def to_json(obj: Any) -> Dict[str, Any]:
+    """json.dump default= hook that writes diagnostics as plain dicts"""
+    if isinstance(obj, Diagnostic):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -0,0 +1,43 @@
+import re
+import hashlib
+from typing import Dict, Any, List
+
+# "12 │ code" (JSON reporter) and "> 12 │ code" (text reporter) snippet line prefixes
+SNIPPET_PREFIX = re.compile(r"^\s*>?\s*\d*\s*│")
+WHITESPACE = re.compile(r"\s+")
+
+def normalize_snippet(code_snippet: List[str]) -> str:
+    """Snippet text without line numbers, markers and whitespace differences.
+
+    Lines added or removed above a diagnostic change its line number but not
+    this text, so it identifies the offending code across edits.
+    """
+    lines = []
+    for line in code_snippet or []:
+        line = WHITESPACE.sub(" ", SNIPPET_PREFIX.sub("", line)).strip()
+        if line:
+            lines.append(line)
+    return "\n".join(lines)
+
+def fingerprint(diagnostic: Dict[str, Any], file: str = None) -> str:
+    """Stable identity of a diagnostic: its rule, file and normalized snippet.
+
+    The line number is deliberately left out. Diagnostics without a snippet
+    fall back to their message. file overrides the diagnostic's own file, e.g.
+    to qualify it with the plugin it belongs to.
+    """
+    text = normalize_snippet(diagnostic.get("code_snippet")) or WHITESPACE.sub(" ", diagnostic.get("message") or "").strip()
+    key = "\0".join((diagnostic.get("rule") or "", file if file is not None else diagnostic.get("file") or "", text))
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+def issue_fingerprint(diagnostic: Dict[str, Any]) -> str:
+    """Identity of the issue a diagnostic reports, wherever it occurs.
+
+    Made of the rule, message and normalized snippet only, so the same violation
+    in boilerplate copied between plugins (or files) gets the same fingerprint
+    and can be handled once, with the places it occurs as a list.
+    """
+    text = normalize_snippet(diagnostic.get("code_snippet"))
+    message = WHITESPACE.sub(" ", diagnostic.get("message") or "").strip()
+    key = "\0".join((diagnostic.get("rule") or "", message, text))
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
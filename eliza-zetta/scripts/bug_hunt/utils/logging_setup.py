@@ -0,0 +1,136 @@
+import os
+import queue
+import atexit
+import logging
+import itertools
+import threading
+from pathlib import Path
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Any, Optional, Union
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Logger the raw lines printed by the analysis tools go to
+TOOL_OUTPUT_LOGGER = "bug_hunt.tool_output"
+# Level above CRITICAL used to switch tool output logging off
+TOOL_OUTPUT_OFF = logging.CRITICAL + 1
+
+_listener: Optional[QueueListener] = None
+_console_handler: Optional[logging.Handler] = None
+_lock = threading.Lock()
+
+class SamplingFilter(logging.Filter):
+    """Lets through one in every `every` records"""
+
+    def __init__(self, every: int = 1):
+        super().__init__()
+        self.every = max(1, every)
+        self._counter = itertools.count()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return next(self._counter) % self.every == 0
+
+def setup_logging(
+    level: Optional[str] = None,
+    levels: Optional[Dict[str, str]] = None,
+    log_file: Optional[Path] = None,
+    max_bytes: int = 10 * 1024 * 1024,
+    backup_count: int = 5,
+) -> None:
+    """Configure logging for the bug hunter.
+
+    Records are put on a queue by the calling thread and written to the console
+    and a rotating biome.log by a background listener, so slow log I/O never
+    blocks the analysis. Safe to call more than once; only the first call installs
+    the handlers, later calls just apply levels.
+
+    The root level defaults to BUG_HUNT_LOG_LEVEL (INFO if unset) and per-logger
+    levels can be given as "name=LEVEL,..." in BUG_HUNT_LOG_LEVELS.
+    """
+    global _listener, _console_handler
+
+    with _lock:
+        root = logging.getLogger()
+        if _listener is None:
+            logs_dir = Path(__file__).parent.parent / "logs"
+            logs_dir.mkdir(exist_ok=True)
+            formatter = logging.Formatter(LOG_FORMAT)
+
+            file_handler = RotatingFileHandler(
+                log_file or logs_dir / "biome.log",
+                maxBytes=max_bytes,
+                backupCount=backup_count,
+                encoding='utf-8'
+            )
+            file_handler.setFormatter(formatter)
+            _console_handler = logging.StreamHandler()
+            _console_handler.setFormatter(formatter)
+
+            _listener = QueueListener(
+                queue.SimpleQueue(),
+                file_handler,
+                _console_handler,
+                respect_handler_level=True
+            )
+            root.handlers = [QueueHandler(_listener.queue)]
+            _listener.start()
+            atexit.register(shutdown_logging)
+
+        root.setLevel(_normalize_level(level or os.environ.get("BUG_HUNT_LOG_LEVEL") or "INFO"))
+        for name, logger_level in _parse_levels(os.environ.get("BUG_HUNT_LOG_LEVELS", "")).items():
+            logging.getLogger(name).setLevel(logger_level)
+        for name, logger_level in (levels or {}).items():
+            logging.getLogger(name).setLevel(_normalize_level(logger_level))
+
+def apply_logging_config(logging_config: Optional[Dict[str, Any]]) -> None:
+    """Apply the "logging" section of analysis.config.json.
+
+    Supported keys: "level", "console_level", "levels" (logger name -> level) and
+    "tool_output_sample_rate", the fraction of raw tool output lines to log.
+    """
+    if not logging_config:
+        return
+
+    setup_logging(level=logging_config.get("level"), levels=logging_config.get("levels"))
+
+    if "console_level" in logging_config and _console_handler is not None:
+        _console_handler.setLevel(_normalize_level(logging_config["console_level"]))
+
+    if "tool_output_sample_rate" in logging_config:
+        set_tool_output_sampling(logging_config["tool_output_sample_rate"])
+
+def set_tool_output_sampling(rate: float) -> None:
+    """Log only a fraction of the raw tool output lines (1.0 logs all, 0 none)"""
+    tool_logger = logging.getLogger(TOOL_OUTPUT_LOGGER)
+    for existing in [f for f in tool_logger.filters if isinstance(f, SamplingFilter)]:
+        tool_logger.removeFilter(existing)
+
+    if rate <= 0:
+        tool_logger.setLevel(TOOL_OUTPUT_OFF)
+        return
+    if tool_logger.level == TOOL_OUTPUT_OFF:
+        tool_logger.setLevel(logging.NOTSET)
+    if rate < 1:
+        tool_logger.addFilter(SamplingFilter(round(1 / rate)))
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+            logging.getLogger().handlers = []
+
+def _parse_levels(spec: str) -> Dict[str, str]:
+    """Parse "name=LEVEL,name=LEVEL" into a dict"""
+    levels = {}
+    for item in spec.split(","):
+        if "=" in item:
+            name, logger_level = item.split("=", 1)
+            levels[name.strip()] = _normalize_level(logger_level)
+    return levels
+
+def _normalize_level(level: Union[str, int]) -> Union[str, int]:
+    """Level names in any case ("debug", "Info"), as logging only accepts upper case"""
+    return level.strip().upper() if isinstance(level, str) else level
@@ -1,14 +1,137 @@
 import os
+import re
+import codecs
+import signal
+import threading
+import asyncio
 import subprocess
+import traceback
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Callable, Iterable, Union, Set, Coroutine
 import json
 import nodeenv
 import logging
 
+from utils.biome_json_parser import BiomeJsonStreamParser
+from utils.diagnostic import Diagnostic, to_json
+from utils.logging_setup import TOOL_OUTPUT_LOGGER
+from utils.output_spool import OutputSpool
+
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
+# Header line of a diagnostic in Biome's text output, e.g.
+# "packages/plugin-x/src/index.ts:3:7 lint/suspicious/noExplicitAny ━━━━━━"
+BIOME_DIAGNOSTIC_HEADER = re.compile(r"^(?P<path>\S+?)(?::\d+:\d+)?\s+\S+.*━━")
+
+# Biome config files; a plugin that has its own must be checked from its directory
+BIOME_CONFIG_FILES = ("biome.json", "biome.jsonc")
+
+# Diagnostics Biome prints per run by default
+BIOME_MAX_DIAGNOSTICS = 20
+# Stderr lines of a Biome run that failed, rather than finished with findings
+BIOME_STDERR_ERROR = re.compile(r"(?im)^.*(\berror\b|×|✖).*$")
+
+# Read size for streamed tool output, and how much of it is kept in memory
+STREAM_CHUNK_SIZE = 1 << 16
+DEFAULT_MAX_OUTPUT_CHARS = 1 << 20
+
+# Time budgets in seconds for each tool run and for a whole plugin; None disables one
+DEFAULT_TIMEOUTS = {
+    "biome": 300,
+    "madge": 300,
+    "plugin": 900,
+    # Cap on the workspace Biome run, which otherwise gets the biome budget per plugin
+    "biome_workspace": 1800,
+    # npm install of a pinned tool into the tool cache
+    "install": 600,
+}
+
+# Analysis tools and the versions installed into the local tool cache
+PINNED_TOOLS = {
+    "biome": {"package": "@biomejs/biome", "bin": "biome", "version": "1.9.4"},
+    "madge": {"package": "madge", "bin": "madge", "version": "8.0.0"},
+}
+
+class Toolchain:
+    """Resolves the analysis tool binaries once so they can be run directly.
+
+    A tool is taken from node_modules/.bin of the workspace (or of the bug hunter)
+    when installed there, otherwise from a version-pinned cache under
+    cache/tools, installing it with npm on first use. If that is not possible
+    either, the tool falls back to the pnpm wrapper it was run through before.
+    run_tool runs the npm install, given the command and the directory to run it in.
+    """
+
+    def __init__(
+        self,
+        work_dir: Path,
+        cache_dir: Optional[Path] = None,
+        run_tool: Optional[Callable[[List[str], str], subprocess.CompletedProcess]] = None,
+    ):
+        self.root_dir = Path(__file__).parent.parent
+        self.work_dir = Path(work_dir)
+        self.cache_dir = Path(cache_dir) if cache_dir else self.root_dir / "cache" / "tools"
+        self.run_tool = run_tool or self._run_tool
+        self.logger = logging.getLogger(__name__)
+
+        self._commands: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+
+    def command(self, tool: str) -> List[str]:
+        """Command prefix that runs tool, resolved on first use"""
+        with self._lock:
+            if tool not in self._commands:
+                self._commands[tool] = self._resolve(tool)
+                self.logger.info("Using %s: %s", tool, " ".join(self._commands[tool]))
+            return self._commands[tool]
+
+    def _resolve(self, tool: str) -> List[str]:
+        """Find or install the binary for tool"""
+        spec = PINNED_TOOLS[tool]
+        for project_dir in (self.work_dir, self.root_dir):
+            binary = self._bin_path(project_dir, spec["bin"])
+            if binary.is_file():
+                return [str(binary)]
+
+        install_dir = self.cache_dir / f"{spec['package'].replace('/', '+')}@{spec['version']}"
+        binary = self._bin_path(install_dir, spec["bin"])
+        if binary.is_file() or self._install(spec, install_dir):
+            return [str(binary)]
+
+        self.logger.warning("Could not install %s, falling back to pnpm", tool)
+        return ["pnpm", spec["bin"]] if tool == "biome" else ["pnpm", "dlx", spec["bin"]]
+
+    def _install(self, spec: Dict[str, str], install_dir: Path) -> bool:
+        """Install a pinned package into install_dir"""
+        package = f"{spec['package']}@{spec['version']}"
+        self.logger.info("Installing %s into %s", package, install_dir)
+        install_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            result = self.run_tool(
+                ["npm", "install", "--prefix", str(install_dir), "--no-save",
+                 "--no-audit", "--no-fund", "--prefer-offline", "--loglevel=error", package],
+                str(install_dir)
+            )
+        except (OSError, TimeoutError) as e:
+            self.logger.error("Failed to install %s: %s", package, e)
+            return False
+
+        if result.returncode != 0:
+            self.logger.error("Failed to install %s: %s", package, result.stderr.strip())
+            return False
+        return self._bin_path(install_dir, spec["bin"]).is_file()
+
+    @staticmethod
+    def _run_tool(cmd: List[str], cwd: str) -> subprocess.CompletedProcess:
+        """Run a command to completion, used when no run_tool was given"""
+        return subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, env={**os.environ})
+
+    @staticmethod
+    def _bin_path(project_dir: Path, name: str) -> Path:
+        """Location of an installed package binary"""
+        return project_dir / "node_modules" / ".bin" / (f"{name}.cmd" if os.name == "nt" else name)
+
 class NodeManager:
     """Manages Node.js tools for JavaScript/TypeScript analysis"""
 
@@ -16,84 +139,180 @@ class NodeManager:
         self.work_dir = Path(work_dir).resolve()
         self.package_json = self.work_dir / "package.json"
         self.logger = logging.getLogger(__name__)
-        self.logger.debug(f"Initialized NodeManager with work_dir: {work_dir}")
+        # Raw tool output goes to its own logger so it can be sampled or silenced
+        self.tool_output_logger = logging.getLogger(TOOL_OUTPUT_LOGGER)
+        self.logger.debug("Initialized NodeManager with work_dir: %s", work_dir)
+        self._tool_versions: Optional[Dict[str, str]] = None
+        # Installs run like any other tool: tracked for cancel_running and time-limited
+        self.toolchain = Toolchain(
+            self.work_dir, run_tool=lambda cmd, cwd: self._run_tool(cmd, cwd, self.timeouts.get("install"))
+        )
+        self.biome_daemon = False
+        self.timeouts: Dict[str, Optional[float]] = dict(DEFAULT_TIMEOUTS)
 
-    def run_biome(self, target_path: str, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Run Biome analysis on target path"""
-        try:
-            self.logger.info("=== Starting Biome Analysis ===")
-            self.logger.info(f"Target path: {target_path}")
-            self.logger.info(f"Working directory: {self.work_dir}")
-
-            # Change to the plugin directory first
-            plugin_dir = Path(target_path)
-
-            # Base command for checking only (no fixes)
-            cmd = [
-                "pnpm",
-                "biome",
-                "check",
-                "src",  # Just check src directory
-                "--verbose"
-            ]
+        # Tools run in their own sessions, out of reach of Ctrl-C, so the ones in
+        # flight (and the event loops driving them) are tracked for cancel_running
+        self._running_lock = threading.Lock()
+        self._running_processes: Set[Union[subprocess.Popen, asyncio.subprocess.Process]] = set()
+        self._running_tasks: Dict[asyncio.Task, asyncio.AbstractEventLoop] = {}
+        self._cancelled = False
+
+    def cancel_running(self) -> None:
+        """Kill every tool in flight and cancel the event loops waiting on them.
+
+        Safe to call from any thread, e.g. the main thread on KeyboardInterrupt
+        while workers are analyzing plugins. Tools started afterwards are killed
+        right away, so the NodeManager cannot be used for analysis anymore.
+        """
+        with self._running_lock:
+            self._cancelled = True
+            processes = list(self._running_processes)
+            tasks = list(self._running_tasks.items())
+
+        if processes or tasks:
+            self.logger.warning("Cancelling %s running tools", len(processes))
+        for task, loop in tasks:
+            loop.call_soon_threadsafe(task.cancel)
+        for process in processes:
+            self._kill_process_group(process)
+
+    def _run_async(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """asyncio.run, registering the main task so cancel_running can cancel it"""
+        async def tracked() -> Any:
+            task = asyncio.current_task()
+            with self._running_lock:
+                if self._cancelled:
+                    coro.close()
+                    raise asyncio.CancelledError()
+                self._running_tasks[task] = asyncio.get_running_loop()
+            try:
+                return await coro
+            finally:
+                with self._running_lock:
+                    self._running_tasks.pop(task, None)
 
-            self.logger.info("=== Command Configuration ===")
-            self.logger.info(f"Initial command: {' '.join(cmd)}")
-            self.logger.info(f"Will execute in directory: {plugin_dir}")
+        return asyncio.run(tracked())
 
+    def _track_process(self, process: Union[subprocess.Popen, asyncio.subprocess.Process]) -> None:
+        """Register a started tool with cancel_running, killing it if that already ran"""
+        with self._running_lock:
+            self._running_processes.add(process)
+            cancelled = self._cancelled
+        if cancelled:
+            self._kill_process_group(process)
+
+    def _untrack_process(self, process: Union[subprocess.Popen, asyncio.subprocess.Process]) -> None:
+        with self._running_lock:
+            self._running_processes.discard(process)
+
+    def configure_timeouts(self, timeouts: Optional[Dict[str, Optional[float]]]) -> None:
+        """Override the default time budgets, e.g. with the "timeouts" section of the config"""
+        for key, value in (timeouts or {}).items():
+            self.timeouts[key] = value or None
+        self.logger.debug("Timeouts: %s", self.timeouts)
+
+    def get_tool_versions(self) -> Dict[str, str]:
+        """Return the versions of the analysis tools, resolved once per NodeManager"""
+        if self._tool_versions is None:
+            self._tool_versions = {
+                "biome": self._get_version([*self.toolchain.command("biome"), "--version"]),
+                "madge": self._get_version([*self.toolchain.command("madge"), "--version"]),
+            }
+            self.logger.info("Tool versions: %s", self._tool_versions)
+        return self._tool_versions
+
+    def _get_version(self, cmd: list[str]) -> str:
+        """Run a version command and return its trimmed output"""
+        try:
             result = subprocess.run(
                 cmd,
-                cwd=str(plugin_dir),  # Execute in plugin directory
+                cwd=str(self.work_dir),
+                capture_output=True,
+                text=True,
+                timeout=60,
+                env={**os.environ}
+            )
+            return result.stdout.strip() or "unknown"
+        except (OSError, subprocess.TimeoutExpired) as e:
+            self.logger.error("Failed to get version with %s: %s", ' '.join(cmd), e)
+            return "unknown"
+
+    def start_biome_daemon(self) -> bool:
+        """Start a Biome server so checks reuse its loaded configuration and rules"""
+        try:
+            result = subprocess.run(
+                [*self.toolchain.command("biome"), "start"],
+                cwd=str(self.work_dir),
                 capture_output=True,
                 text=True,
+                timeout=60,
                 env={**os.environ}
             )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            self.logger.warning("Could not start the Biome daemon, running Biome cold: %s", e)
+            return False
 
-            self.logger.info("=== Biome Execution Results ===")
-            self.logger.info(f"Exit code: {result.returncode}")
+        if result.returncode != 0:
+            self.logger.warning(
+                "Could not start the Biome daemon, running Biome cold: %s",
+                (result.stderr or result.stdout).strip()
+            )
+            return False
+
+        self.logger.info("Started the Biome daemon")
+        self.biome_daemon = True
+        return True
 
-            # Store all output and errors
-            all_output = []
-            error_logs = []
+    def stop_biome_daemon(self) -> None:
+        """Stop the Biome server started by start_biome_daemon"""
+        if not self.biome_daemon:
+            return
 
-            # Log all output for debugging
-            if result.stdout:
-                self.logger.info("=== Biome Output ===")
-                for line in result.stdout.splitlines():
-                    self.logger.info(f"OUT: {line}")
-                    all_output.append(line)
+        self.biome_daemon = False
+        try:
+            subprocess.run(
+                [*self.toolchain.command("biome"), "stop"],
+                cwd=str(self.work_dir),
+                capture_output=True,
+                text=True,
+                timeout=60,
+                env={**os.environ}
+            )
+            self.logger.info("Stopped the Biome daemon")
+        except (OSError, subprocess.TimeoutExpired) as e:
+            self.logger.error("Failed to stop the Biome daemon: %s", e)
 
-            if result.stderr:
-                self.logger.error("=== Biome Errors ===")
-                for line in result.stderr.splitlines():
-                    self.logger.error(f"ERR: {line}")
-                    error_logs.append(line)
+    def run_biome(self, target_path: str, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run Biome analysis on target path"""
+        if self._biome_settings(config).get("stream_output"):
+            return self._run_async(self.run_biome_async(target_path, config))
 
-            # Parse the output into structured format
-            diagnostics = self._parse_biome_verbose_output(result.stdout)
+        try:
+            cmd = self._biome_command(target_path, config)
 
-            self.logger.info("=== Parsing Results ===")
-            self.logger.info(f"Found {len(diagnostics)} issues")
+            result = self._run_tool(
+                cmd,
+                cwd=str(Path(target_path)),  # Execute in plugin directory
+                timeout=self.timeouts.get("biome")
+            )
 
-            return {
-                "success": result.returncode == 0,
-                "output": result.stdout,
-                "errors": result.stderr,
-                "diagnostics": diagnostics,
-                "raw_output": f"STDOUT:\n{result.stdout}\n\nSTDERR:\n{result.stderr}",
-                "all_output": all_output,
-                "error_logs": error_logs
-            }
+            return self._build_biome_result(
+                result.returncode,
+                result.stdout,
+                result.stderr,
+                config=config,
+                source_root=target_path
+            )
 
         except subprocess.CalledProcessError as e:
-            self.logger.error(f"=== Biome Execution Failed ===")
-            self.logger.error(f"Error: {str(e)}")
-            self.logger.error(f"Command: {e.cmd}")
-            self.logger.error(f"Return code: {e.returncode}")
+            self.logger.error("=== Biome Execution Failed ===")
+            self.logger.error("Error: %s", e)
+            self.logger.error("Command: %s", e.cmd)
+            self.logger.error("Return code: %s", e.returncode)
             if e.stdout:
-                self.logger.error(f"Stdout: {e.stdout}")
+                self.logger.error("Stdout: %s", e.stdout)
             if e.stderr:
-                self.logger.error(f"Stderr: {e.stderr}")
+                self.logger.error("Stderr: %s", e.stderr)
             return {
                 "success": False,
                 "output": e.stdout if e.stdout else "",
@@ -103,62 +322,256 @@ class NodeManager:
                 "all_output": [],
                 "error_logs": [str(e)]
             }
+        except TimeoutError:
+            raise
         except Exception as e:
-            self.logger.error(f"=== Unexpected Error ===")
-            self.logger.error(f"Type: {type(e).__name__}")
-            self.logger.error(f"Error: {str(e)}")
-            import traceback
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
-            return {
-                "success": False,
-                "output": "",
-                "errors": str(e),
-                "diagnostics": [],
-                "raw_output": f"ERROR:\n{str(e)}\n\n{traceback.format_exc()}",
-                "all_output": [],
-                "error_logs": [str(e), traceback.format_exc()]
-            }
+            return self._biome_error_result(e)
 
-    def run_dependency_check(self, target_path: str) -> Dict[str, Any]:
-        """Run dependency analysis using pnpm-based madge"""
+    def run_biome_workspace(
+        self,
+        target_paths: List[str],
+        config: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Check the src trees of many plugins with a single Biome run.
+
+        The diagnostics are split back per plugin by file path, so each plugin gets
+        the same result dict a run_biome call in its directory would return.
+        Plugins missing from the returned dict have to be checked on their own:
+        those with their own biome.json, since a run from the workspace root would
+        not apply their configuration, and all of them if the run times out or
+        looks like it failed rather than found issues (see _workspace_run_failed).
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        targets: Dict[str, str] = {}
+        for target_path in target_paths:
+            plugin_dir = Path(target_path).resolve()
+            if any((plugin_dir / name).is_file() for name in BIOME_CONFIG_FILES):
+                self.logger.info("%s has its own Biome config, checking it separately", plugin_dir.name)
+            else:
+                targets[os.path.relpath(plugin_dir, self.work_dir).replace(os.sep, "/")] = target_path
+
+        if not targets:
+            return results
+
+        cmd = self._biome_command(
+            str(self.work_dir),
+            config,
+            paths=[f"{rel_dir}/src" for rel_dir in targets]
+        )
+        # Keep the per-plugin diagnostics budget of separate runs
+        cmd.append(f"--max-diagnostics={BIOME_MAX_DIAGNOSTICS * len(targets)}")
+
+        # Same budget per plugin as separate runs would get, up to the workspace cap.
+        # A run hitting the cap falls back to per-plugin runs, so it only costs time
+        timeout = self.timeouts.get("biome")
+        timeout = timeout * len(targets) if timeout else None
+        cap = self.timeouts.get("biome_workspace")
+        if cap:
+            timeout = min(timeout, cap) if timeout else cap
+
+        self.logger.info("=== Starting workspace Biome Analysis of %s plugins ===", len(targets))
+        streamed = None
         try:
-            cmd = [
-                "pnpm",
-                "dlx",
-                "madge",
-                "--json",
-                "--warning",
-                "--circular",
-                target_path
-            ]
+            if self._biome_settings(config).get("stream_output"):
+                streamed = self._run_async(
+                    self._stream_biome_async(
+                        cmd, str(self.work_dir), config, source_root=str(self.work_dir), timeout=timeout
+                    )
+                )
+                stdout = streamed["stdout"].iter_lines()
+                stderr = streamed["stderr"].head()
+                returncode, diagnostics, complete = streamed["returncode"], streamed["diagnostics"], streamed["complete"]
+            else:
+                result = self._run_tool(cmd, cwd=str(self.work_dir), timeout=timeout)
+                stdout, stderr, diagnostics = result.stdout, result.stderr, None
+                returncode, complete = result.returncode, None
+        except TimeoutError as e:
+            # Leave the plugins to separate runs, so a hang only costs the plugin causing it
+            self.logger.warning("Workspace Biome run failed, checking plugins one by one: %s", e)
+            return results
+        except Exception as e:
+            error_result = self._biome_error_result(e)
+            return {**results, **{target_path: dict(error_result) for target_path in targets.values()}}
 
-            result = subprocess.run(
-                cmd,
+        try:
+            return self._split_workspace_result(targets, config, returncode, stdout, stderr, diagnostics, complete)
+        finally:
+            if streamed:
+                # The run's output is fully read, drop the files it spilled to
+                streamed["stdout"].discard()
+                streamed["stderr"].discard()
+
+    def _split_workspace_result(
+        self,
+        targets: Dict[str, str],
+        config: Optional[Dict[str, Any]],
+        returncode: int,
+        stdout: Iterable[str],
+        stderr: str,
+        diagnostics: Optional[List[Dict[str, Any]]],
+        complete: Optional[bool],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Per-plugin results of a workspace Biome run, empty if the run failed"""
+        results: Dict[str, Dict[str, Any]] = {}
+        if self._biome_reporter(config) == "json":
+            if diagnostics is None:
+                parser = BiomeJsonStreamParser(source_root=str(self.work_dir))
+                diagnostics = parser.feed(stdout) + parser.close()
+                complete = parser.complete
+
+            if self._workspace_run_failed(returncode, stderr, bool(diagnostics), complete):
+                return results
+
+            for rel_dir, plugin_diagnostics in self._demux_biome_diagnostics(diagnostics, list(targets)).items():
+                counts = {
+                    "errors": sum(1 for d in plugin_diagnostics if d["severity"] == "error"),
+                    "warnings": sum(1 for d in plugin_diagnostics if d["severity"] == "warning"),
+                }
+                results[targets[rel_dir]] = self._build_biome_json_result(
+                    1 if counts["errors"] else 0,
+                    plugin_diagnostics,
+                    counts,
+                    stderr
+                )
+            return results
+
+        demuxed = self._demux_biome_output(stdout, list(targets))
+        found = any(plugin_stdout.strip() for plugin_stdout, _ in demuxed.values())
+        if self._workspace_run_failed(returncode, stderr, found, complete=True):
+            return results
+
+        for rel_dir, (plugin_stdout, error_count) in demuxed.items():
+            results[targets[rel_dir]] = self._build_biome_result(
+                1 if error_count else 0,
+                plugin_stdout,
+                stderr,
+                config=config
+            )
+
+        return results
+
+    def _workspace_run_failed(self, returncode: int, stderr: str, found: bool, complete: Optional[bool]) -> bool:
+        """Whether a workspace Biome run failed instead of reporting on the plugins.
+
+        Biome exits non-zero when it finds errors, so a non-zero exit only counts
+        as a failure when nothing was found. Errors on stderr (e.g. an invalid
+        configuration) and a JSON report that ends early also mean the results
+        cannot be trusted; reporting every plugin as clean would hide the failure
+        and get the clean results cached.
+        """
+        reason = None
+        if complete is False:
+            reason = "its JSON report is incomplete"
+        elif returncode != 0 and not found:
+            reason = f"it exited with {returncode} without reporting diagnostics"
+        elif BIOME_STDERR_ERROR.search(stderr or ""):
+            reason = "it printed errors to stderr"
+
+        if reason:
+            self.logger.warning("Workspace Biome run failed, checking plugins one by one: %s", reason)
+            if stderr:
+                self.logger.warning("Stderr: %s", stderr.strip())
+            return True
+        return False
+
+    def run_dependency_check(self, target_path: str) -> Dict[str, Any]:
+        """Run dependency analysis using madge"""
+        try:
+            result = self._run_tool(
+                self._dependency_command(target_path),
                 cwd=str(self.work_dir),
-                capture_output=True,
-                text=True,
-                env={**os.environ}
+                timeout=self.timeouts.get("madge")
             )
-            return {
-                "success": result.returncode == 0,
-                "dependencies": json.loads(result.stdout) if result.stdout else {},
-                "errors": result.stderr
-            }
+            return self._build_dependency_result(result.returncode, result.stdout, result.stderr)
         except subprocess.CalledProcessError as e:
-            self.logger.error(f"Dependency check failed: {str(e)}")
+            self.logger.error("Dependency check failed: %s", e)
             return {
                 "success": False,
                 "dependencies": {},
                 "errors": str(e)
             }
 
-    def analyze_typescript(self, target_path: str, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Run comprehensive TypeScript analysis"""
+    def analyze_typescript(
+        self,
+        target_path: str,
+        config: Optional[Dict[str, Any]] = None,
+        biome_result: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Run comprehensive TypeScript analysis, running the tools concurrently.
+
+        Pass biome_result (e.g. from run_biome_workspace) to skip the Biome run.
+        Must not be called from a running event loop, use analyze_typescript_async there.
+        """
+        return self._run_async(self.analyze_typescript_async(target_path, config, biome_result))
+
+    async def run_biome_async(self, target_path: str, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Async variant of run_biome. Cancelling it kills the Biome process."""
+        try:
+            cmd = self._biome_command(target_path, config)
+            timeout = self.timeouts.get("biome")
+            if self._biome_settings(config).get("stream_output"):
+                streamed = await self._stream_biome_async(
+                    cmd, str(Path(target_path)), config, source_root=target_path, timeout=timeout
+                )
+                return self._build_streamed_biome_result(streamed)
+
+            returncode, stdout, stderr = await self._exec_async(cmd, cwd=str(Path(target_path)), timeout=timeout)
+            return self._build_biome_result(
+                returncode,
+                stdout,
+                stderr,
+                config=config,
+                source_root=target_path
+            )
+        except TimeoutError:
+            raise
+        except Exception as e:
+            return self._biome_error_result(e)
+
+    async def run_dependency_check_async(self, target_path: str) -> Dict[str, Any]:
+        """Async variant of run_dependency_check. Cancelling it kills the madge process."""
+        returncode, stdout, stderr = await self._exec_async(
+            self._dependency_command(target_path),
+            cwd=str(self.work_dir),
+            timeout=self.timeouts.get("madge")
+        )
+        return self._build_dependency_result(returncode, stdout, stderr)
+
+    async def analyze_typescript_async(
+        self,
+        target_path: str,
+        config: Optional[Dict[str, Any]] = None,
+        biome_result: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Run Biome and the dependency check at the same time.
+
+        If either tool fails unexpectedly or times out, the other one is cancelled
+        as well. Raises TimeoutError when a tool or the plugin as a whole runs out
+        of time.
+        """
+        plugin_timeout = self.timeouts.get("plugin")
+        try:
+            async with asyncio.timeout(plugin_timeout) as budget:
+                try:
+                    async with asyncio.TaskGroup() as group:
+                        if biome_result is None:
+                            biome_task = group.create_task(self.run_biome_async(target_path, config))
+                        dependencies_task = group.create_task(self.run_dependency_check_async(target_path))
+                except ExceptionGroup as e:
+                    # Surface the tool's own error, as the sequential version did
+                    raise e.exceptions[0]
+        except TimeoutError:
+            if budget.expired():
+                raise TimeoutError(
+                    f"Analysis of {Path(target_path).name} exceeded its {plugin_timeout}s budget"
+                ) from None
+            raise
+
         results = {
             "success": True,
             "results": {
-                "biome": self.run_biome(target_path, config),
-                "dependencies": self.run_dependency_check(target_path)
+                "biome": biome_task.result() if biome_result is None else biome_result,
+                "dependencies": dependencies_task.result()
             }
         }
 
@@ -170,8 +583,510 @@ class NodeManager:
 
         return results
 
-    def _parse_biome_verbose_output(self, output: str) -> list[Dict[str, Any]]:
-        """Parse Biome verbose output into structured format"""
+    async def analyze_many_async(
+        self,
+        target_paths: List[str],
+        config: Optional[Dict[str, Any]] = None,
+        concurrency: int = 4,
+        on_result: Optional[Callable[[str, Optional[Dict[str, Any]], Optional[BaseException]], None]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Analyze many targets with at most `concurrency` of them running at once.
+
+        on_result is called from the event loop as each target finishes, with either
+        its result or the exception it raised. Results are returned keyed by target path.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        results: Dict[str, Dict[str, Any]] = {}
+
+        async def analyze_one(target_path: str) -> None:
+            async with semaphore:
+                try:
+                    result = await self.analyze_typescript_async(target_path, config)
+                except Exception as e:
+                    self.logger.error("Failed to analyze %s: %s", target_path, e)
+                    if on_result:
+                        on_result(target_path, None, e)
+                    return
+
+            results[target_path] = result
+            if on_result:
+                on_result(target_path, result, None)
+
+        async with asyncio.TaskGroup() as group:
+            for target_path in target_paths:
+                group.create_task(analyze_one(target_path))
+
+        return results
+
+    def _biome_settings(self, config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """The "biome" section of the analysis config"""
+        return (config or {}).get("biome", {})
+
+    def _biome_reporter(self, config: Optional[Dict[str, Any]]) -> str:
+        """Biome reporter to use: "json" (default) or the human-readable "text" """
+        return self._biome_settings(config).get("reporter", "json")
+
+    def _biome_command(
+        self,
+        target_path: str,
+        config: Optional[Dict[str, Any]] = None,
+        paths: Optional[List[str]] = None,
+    ) -> list[str]:
+        """Build the Biome command for a plugin directory"""
+        self.logger.info("=== Starting Biome Analysis ===")
+        self.logger.info("Target path: %s", target_path)
+        self.logger.info("Working directory: %s", self.work_dir)
+
+        # Base command for checking only (no fixes)
+        cmd = [
+            *self.toolchain.command("biome"),
+            "check",
+            *(paths or ["src"]),  # Just check src directory
+        ]
+        if self._biome_reporter(config) == "json":
+            cmd.append("--reporter=json")
+        else:
+            cmd.append("--verbose")
+        if self.biome_daemon:
+            # Send the check to the running server instead of starting a cold process
+            cmd.append("--use-server")
+
+        self.logger.info("=== Command Configuration ===")
+        self.logger.info("Initial command: %s", ' '.join(cmd))
+        self.logger.info("Will execute in directory: %s", target_path)
+        return cmd
+
+    def _dependency_command(self, target_path: str) -> list[str]:
+        """Build the madge command for a plugin directory"""
+        return [
+            *self.toolchain.command("madge"),
+            "--json",
+            "--warning",
+            "--circular",
+            target_path
+        ]
+
+    def _run_tool(self, cmd: list[str], cwd: str, timeout: Optional[float] = None) -> subprocess.CompletedProcess:
+        """Run a tool in its own process group, killing the whole group if it times out"""
+        with subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            env={**os.environ},
+            start_new_session=True
+        ) as process:
+            self._track_process(process)
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                self.logger.warning("Timed out after %ss, killing: %s", timeout, ' '.join(cmd))
+                self._kill_process_group(process)
+                process.communicate()
+                raise TimeoutError(f"{' '.join(cmd)} timed out after {timeout}s") from None
+            except BaseException:
+                self._kill_process_group(process)
+                raise
+            finally:
+                self._untrack_process(process)
+
+        return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+
+    async def _exec_async(self, cmd: list[str], cwd: str, timeout: Optional[float] = None) -> tuple[int, str, str]:
+        """Run a command without blocking the event loop, killing it if cancelled or out of time"""
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env={**os.environ},
+            start_new_session=True
+        )
+        self._track_process(process)
+        try:
+            async with asyncio.timeout(timeout):
+                stdout, stderr = await process.communicate()
+        except TimeoutError:
+            await self._kill_process(process, cmd, reason=f"Timed out after {timeout}s")
+            raise TimeoutError(f"{' '.join(cmd)} timed out after {timeout}s") from None
+        except asyncio.CancelledError:
+            await self._kill_process(process, cmd)
+            raise
+        finally:
+            self._untrack_process(process)
+
+        return (
+            process.returncode,
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace"),
+        )
+
+    async def _stream_biome_async(
+        self,
+        cmd: list[str],
+        cwd: str,
+        config: Optional[Dict[str, Any]],
+        source_root: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Run Biome, handling its output as it is produced instead of buffering it.
+
+        stdout and stderr are read in chunks into OutputSpools, which keep at most
+        max_output_chars of each in memory. With the JSON reporter, stdout goes
+        straight into the stream parser and only its head is kept, nothing of it
+        is written to disk. Returns the exit code, the spools, and the
+        diagnostics and counts (None with the text reporter, whose parser reads
+        the stdout spool back line by line afterwards). The caller has to discard
+        the spools once done with them.
+        """
+        max_chars = self._biome_settings(config).get("max_output_chars", DEFAULT_MAX_OUTPUT_CHARS)
+        parser = BiomeJsonStreamParser(source_root=source_root) if self._biome_reporter(config) == "json" else None
+        stdout_spool = OutputSpool(max_chars, prefix="biome_stdout_", spill=parser is None)
+        stderr_spool = OutputSpool(max_chars, prefix="biome_stderr_")
+        diagnostics: List[Dict[str, Any]] = []
+
+        def on_stdout(text: str) -> None:
+            stdout_spool.write(text)
+            if parser:
+                diagnostics.extend(parser.feed(text))
+
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env={**os.environ},
+            start_new_session=True
+        )
+        self._track_process(process)
+        returncode = None
+        try:
+            async with asyncio.timeout(timeout):
+                await asyncio.gather(
+                    self._pump_stream(process.stdout, on_stdout),
+                    self._pump_stream(process.stderr, stderr_spool.write),
+                )
+                returncode = await process.wait()
+        except TimeoutError:
+            await self._kill_process(process, cmd, reason=f"Timed out after {timeout}s")
+            raise TimeoutError(f"{' '.join(cmd)} timed out after {timeout}s") from None
+        except asyncio.CancelledError:
+            await self._kill_process(process, cmd)
+            raise
+        finally:
+            self._untrack_process(process)
+            for spool in (stdout_spool, stderr_spool):
+                if returncode is None:
+                    # Nobody reads back the output of a run that did not finish
+                    spool.discard()
+                else:
+                    spool.close()
+
+        if stdout_spool.spilled:
+            self.logger.info("Biome wrote %s characters, spooled to %s", stdout_spool.total_chars, stdout_spool.path)
+
+        if parser:
+            diagnostics.extend(parser.close())
+            if not parser.complete:
+                self.logger.warning("Biome's JSON report ended early, output starts with: %s", stdout_spool.head()[:500])
+        return {
+            "returncode": returncode,
+            "stdout": stdout_spool,
+            "stderr": stderr_spool,
+            "diagnostics": diagnostics if parser else None,
+            "counts": parser.get_counts() if parser else None,
+            "complete": parser.complete if parser else None,
+        }
+
+    async def _pump_stream(self, stream: asyncio.StreamReader, on_text: Callable[[str], None]) -> None:
+        """Pass a process stream to on_text chunk by chunk as it arrives"""
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        while True:
+            chunk = await stream.read(STREAM_CHUNK_SIZE)
+            if not chunk:
+                break
+            on_text(decoder.decode(chunk))
+        on_text(decoder.decode(b"", final=True))
+
+    async def _kill_process(self, process: asyncio.subprocess.Process, cmd: list[str], reason: str = "Cancelled") -> None:
+        """Kill a process and everything it started, and reap it"""
+        self.logger.warning("%s, killing: %s", reason, ' '.join(cmd))
+        self._kill_process_group(process)
+        await process.wait()
+
+    def _kill_process_group(self, process: Union[subprocess.Popen, asyncio.subprocess.Process]) -> None:
+        """Kill the process group of a tool started with start_new_session.
+
+        Tools often run behind wrappers (pnpm, shell scripts), so killing just the
+        process would leave its children running and holding the output pipes open.
+        """
+        try:
+            if hasattr(os, "killpg"):
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except ProcessLookupError:
+            pass
+
+    def _build_biome_result(
+        self,
+        returncode: int,
+        stdout: str,
+        stderr: str,
+        config: Optional[Dict[str, Any]] = None,
+        source_root: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Turn the output of a Biome run into the result dict"""
+        if self._biome_reporter(config) == "json":
+            parser = BiomeJsonStreamParser(source_root=source_root)
+            diagnostics = parser.feed(stdout) + parser.close()
+            return self._build_biome_json_result(returncode, diagnostics, parser.get_counts(), stderr)
+
+        self.logger.info("=== Biome Execution Results ===")
+        self.logger.info("Exit code: %s", returncode)
+
+        # Store all output and errors
+        all_output = []
+        error_logs = []
+
+        # Log all output for debugging
+        if stdout:
+            all_output = stdout.splitlines()
+            if self.tool_output_logger.isEnabledFor(logging.INFO):
+                self.tool_output_logger.info("=== Biome Output ===")
+                for line in all_output:
+                    self.tool_output_logger.info("OUT: %s", line)
+
+        if stderr:
+            self.logger.error("=== Biome Errors ===")
+            error_logs = stderr.splitlines()
+            for line in error_logs:
+                self.logger.error("ERR: %s", line)
+
+        # Parse the output into structured format
+        diagnostics, counts = self._parse_biome_verbose_output(stdout)
+
+        self.logger.info("=== Parsing Results ===")
+        self.logger.info("Found %s issues", len(diagnostics))
+
+        return {
+            "success": returncode == 0,
+            "output": stdout,
+            "errors": stderr,
+            "diagnostics": diagnostics,
+            "summary": counts,
+            "raw_output": f"STDOUT:\n{stdout}\n\nSTDERR:\n{stderr}",
+            "all_output": all_output,
+            "error_logs": error_logs
+        }
+
+    def _build_biome_json_result(
+        self,
+        returncode: int,
+        diagnostics: List[Dict[str, Any]],
+        counts: Dict[str, int],
+        stderr: str,
+        max_output_chars: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Build the result dict from diagnostics parsed out of Biome's JSON report.
+
+        The output keeps the shape of the text reporter's: one header line per
+        diagnostic followed by its message and code, then the "Found ..." totals.
+        With max_output_chars, diagnostics past that budget are left out of the
+        output (they are all still in "diagnostics").
+        """
+        self.logger.info("=== Biome Execution Results ===")
+        self.logger.info("Exit code: %s", returncode)
+
+        all_output = []
+        output_chars = 0
+        for index, diagnostic in enumerate(diagnostics):
+            lines = [
+                f"{diagnostic['file']}:{diagnostic['line']}:{diagnostic['column']} {diagnostic['rule']}",
+                f"  {diagnostic['severity']}: {diagnostic['message']}",
+                *(f"    {line}" for line in diagnostic["code_snippet"]),
+            ]
+            output_chars += sum(len(line) + 1 for line in lines)
+            if max_output_chars is not None and output_chars > max_output_chars:
+                all_output.append(f"... {len(diagnostics) - index} more diagnostics not shown")
+                break
+            all_output.extend(lines)
+        for severity in ("error", "warning"):
+            count = counts.get(f"{severity}s", 0)
+            if count:
+                all_output.append(f"Found {count} {severity}{'s' if count != 1 else ''}.")
+
+        error_logs = stderr.splitlines()
+        if error_logs:
+            self.logger.error("=== Biome Errors ===")
+            for line in error_logs:
+                self.logger.error("ERR: %s", line)
+
+        self.logger.info("=== Parsing Results ===")
+        self.logger.info("Found %s issues", len(diagnostics))
+
+        output = "\n".join(all_output)
+        return {
+            "success": returncode == 0,
+            "output": output,
+            "errors": stderr,
+            "diagnostics": diagnostics,
+            "summary": counts,
+            "raw_output": f"STDOUT:\n{output}\n\nSTDERR:\n{stderr}",
+            "all_output": all_output,
+            "error_logs": error_logs
+        }
+
+    def _build_streamed_biome_result(self, streamed: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the result dict of a streamed Biome run.
+
+        Only the in-memory head of the output ends up in the result, with
+        output_truncated set when there was more. The spools are discarded.
+        """
+        stdout_spool: OutputSpool = streamed["stdout"]
+        stderr_spool: OutputSpool = streamed["stderr"]
+        stderr = stderr_spool.head()
+
+        try:
+            if streamed["diagnostics"] is not None:
+                result = self._build_biome_json_result(
+                    streamed["returncode"],
+                    streamed["diagnostics"],
+                    streamed["counts"],
+                    stderr,
+                    max_output_chars=stdout_spool.max_memory_chars
+                )
+            else:
+                diagnostics, counts = self._parse_biome_verbose_output(stdout_spool.iter_lines())
+                output = stdout_spool.head()
+                self.logger.info("Exit code: %s, found %s issues", streamed['returncode'], len(diagnostics))
+                result = {
+                    "success": streamed["returncode"] == 0,
+                    "output": output,
+                    "errors": stderr,
+                    "diagnostics": diagnostics,
+                    "summary": counts,
+                    "raw_output": f"STDOUT:\n{output}\n\nSTDERR:\n{stderr}",
+                    "all_output": output.splitlines(),
+                    "error_logs": stderr.splitlines()
+                }
+        finally:
+            # Everything was parsed, spilled files would only pile up under logs/tool_output
+            stdout_spool.discard()
+            stderr_spool.discard()
+
+        if stdout_spool.truncated or stderr_spool.truncated:
+            result["output_truncated"] = True
+        return result
+
+    def _biome_error_result(self, e: Exception) -> Dict[str, Any]:
+        """Result dict for a Biome run that could not complete"""
+        self.logger.error("=== Unexpected Error ===")
+        self.logger.error("Type: %s", type(e).__name__)
+        self.logger.error("Error: %s", e)
+        self.logger.error("Traceback: %s", traceback.format_exc())
+        return {
+            "success": False,
+            "output": "",
+            "errors": str(e),
+            "diagnostics": [],
+            "raw_output": f"ERROR:\n{str(e)}\n\n{traceback.format_exc()}",
+            "all_output": [],
+            "error_logs": [str(e), traceback.format_exc()]
+        }
+
+    def _demux_biome_diagnostics(
+        self,
+        diagnostics: List[Dict[str, Any]],
+        rel_dirs: List[str],
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Split workspace diagnostics per plugin, making file paths plugin-relative"""
+        # Longest prefix first, so nested directories win over their parents
+        prefixes = sorted(rel_dirs, key=len, reverse=True)
+        grouped: Dict[str, List[Dict[str, Any]]] = {rel_dir: [] for rel_dir in rel_dirs}
+
+        for diagnostic in diagnostics:
+            file_path = diagnostic["file"]
+            rel_dir = next((rel_dir for rel_dir in prefixes if file_path.startswith(f"{rel_dir}/")), None)
+            if rel_dir is None:
+                self.logger.warning("Diagnostic outside the checked plugins: %s", file_path)
+                continue
+            diagnostic["file"] = file_path[len(rel_dir) + 1:]
+            grouped[rel_dir].append(diagnostic)
+
+        return grouped
+
+    def _demux_biome_output(
+        self,
+        output: Union[str, Iterable[str]],
+        rel_dirs: List[str],
+    ) -> Dict[str, tuple[str, int]]:
+        """Split workspace Biome text output into per-plugin output.
+
+        Diagnostic paths are made relative to the plugin directory, as they are
+        when Biome runs inside it, and each plugin gets its own "Found ..." summary.
+        Returns the output and error count for each plugin directory.
+        """
+        # Longest prefix first, so nested directories win over their parents
+        prefixes = sorted(rel_dirs, key=len, reverse=True)
+        blocks: Dict[str, List[str]] = {rel_dir: [] for rel_dir in rel_dirs}
+        counts: Dict[str, Dict[str, int]] = {rel_dir: {"error": 0, "warning": 0} for rel_dir in rel_dirs}
+        current = None
+        severity_pending = False
+
+        for line in output.splitlines() if isinstance(output, str) else output:
+            header = BIOME_DIAGNOSTIC_HEADER.match(line)
+            if header:
+                path = header.group("path")
+                current = next((rel_dir for rel_dir in prefixes if path.startswith(f"{rel_dir}/")), None)
+                if current:
+                    blocks[current].append(line[len(current) + 1:])
+                    severity_pending = True
+                continue
+
+            # Anything else starting at column 0 is the run summary, not part of a diagnostic
+            if line and not line[0].isspace():
+                current = None
+                continue
+
+            if current:
+                blocks[current].append(line)
+                marker = line.strip()[:1]
+                if severity_pending and marker in ("×", "!", "i"):
+                    if marker == "×":
+                        counts[current]["error"] += 1
+                    elif marker == "!":
+                        counts[current]["warning"] += 1
+                    severity_pending = False
+
+        demuxed = {}
+        for rel_dir in rel_dirs:
+            lines = blocks[rel_dir]
+            for severity, count in counts[rel_dir].items():
+                if count:
+                    lines.append(f"Found {count} {severity}{'s' if count != 1 else ''}.")
+            demuxed[rel_dir] = ("\n".join(lines), counts[rel_dir]["error"])
+
+        return demuxed
+
+    def _build_dependency_result(self, returncode: int, stdout: str, stderr: str) -> Dict[str, Any]:
+        """Turn the output of a madge run into the result dict"""
+        return {
+            "success": returncode == 0,
+            "dependencies": json.loads(stdout) if stdout else {},
+            "errors": stderr
+        }
+
+    def _parse_biome_verbose_output(
+        self,
+        output: Union[str, Iterable[str]],
+    ) -> tuple[list[Dict[str, Any]], Dict[str, Any]]:
+        """Parse Biome verbose output (a string or an iterable of lines) into structured format.
+
+        Returns the diagnostics and the totals Biome printed, in the shape of
+        BiomeJsonStreamParser.get_counts so report code can rely on either.
+        """
         diagnostics = []
         current_diagnostic = None
         current_file = None
@@ -180,15 +1095,14 @@ class NodeManager:
         summary_info = {
             "total_warnings": 0,
             "total_errors": 0,
-            "files_processed": []
+            "files_processed": [],
+            "diagnostics_limit": None
         }
 
-        lines = output.splitlines()
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
+        lines = output.splitlines() if isinstance(output, str) else output
+        for raw_line in lines:
+            line = raw_line.strip()
             if not line:
-                i += 1
                 continue
 
             # Capture summary information
@@ -202,6 +1116,10 @@ class NodeManager:
                 except ValueError:
                     pass
 
+            # Biome stopped printing diagnostics past --max-diagnostics
+            elif "The number of diagnostics exceeds" in line:
+                summary_info["diagnostics_limit"] = line
+
             # Capture processed files
             elif line.startswith("- src/"):
                 summary_info["files_processed"].append(line.strip("- "))
@@ -219,15 +1137,13 @@ class NodeManager:
                 rule = parts[1] if len(parts) > 1 else ""
 
                 file_parts = location.split(":")
-                current_diagnostic = {
-                    "file": file_parts[0],
-                    "line": int(file_parts[1]) if len(file_parts) > 1 else 0,
-                    "column": int(file_parts[2]) if len(file_parts) > 2 else 0,
-                    "rule": rule.split("  ")[0] if "  " in rule else rule,
-                    "severity": "error" if "error" in rule.lower() else "warning",
-                    "message": "",
-                    "code_snippet": []
-                }
+                current_diagnostic = Diagnostic(
+                    file=file_parts[0],
+                    line=int(file_parts[1]) if len(file_parts) > 1 else 0,
+                    column=int(file_parts[2]) if len(file_parts) > 2 else 0,
+                    rule=rule.split("  ")[0] if "  " in rule else rule,
+                    severity="error" if "error" in rule.lower() else "warning"
+                )
                 in_error_block = True
 
             # Capture error messages and code snippets
@@ -243,8 +1159,6 @@ class NodeManager:
                 else:
                     in_error_block = False
 
-            i += 1
-
         # Add the last diagnostic if exists
         if current_diagnostic:
             current_diagnostic["message"] = "\n".join(current_message)
@@ -252,21 +1166,26 @@ class NodeManager:
 
         # If we have no diagnostics but have summary info, create a summary diagnostic
         if not diagnostics and (summary_info["total_warnings"] > 0 or summary_info["total_errors"] > 0):
-            summary_diagnostic = {
-                "file": "Summary",
-                "line": 0,
-                "column": 0,
-                "rule": "multiple-issues",
-                "severity": "warning",
-                "message": f"Found {summary_info['total_warnings']} warnings and {summary_info['total_errors']} errors across {len(summary_info['files_processed'])} files",
-                "code_snippet": [f"Affected files:"] + [f"  - {f}" for f in summary_info['files_processed']]
-            }
+            summary_diagnostic = Diagnostic(
+                file="Summary",
+                rule="multiple-issues",
+                severity="warning",
+                message=f"Found {summary_info['total_warnings']} warnings and {summary_info['total_errors']} errors across {len(summary_info['files_processed'])} files",
+                code_snippet=[f"Affected files:"] + [f"  - {f}" for f in summary_info['files_processed']]
+            )
             diagnostics.append(summary_diagnostic)
 
-        return diagnostics
+        counts = {
+            "errors": summary_info["total_errors"],
+            "warnings": summary_info["total_warnings"],
+            "files_checked": len(summary_info["files_processed"]),
+        }
+        if summary_info["diagnostics_limit"]:
+            counts["diagnostics_limit"] = summary_info["diagnostics_limit"]
+        return diagnostics, counts
 
 if __name__ == "__main__":
     # Test the Node manager
     node_mgr = NodeManager()
     result = node_mgr.run_biome("../../packages/plugin-test")
-    print(json.dumps(result, indent=2))
\ No newline at end of file
+    print(json.dumps(result, indent=2, default=to_json))
\ No newline at end of file
@@ -0,0 +1,102 @@
+import os
+import tempfile
+import logging
+from pathlib import Path
+from typing import Iterator, List, Optional, TextIO
+
+class OutputSpool:
+    """Collects a process' output with a cap on the memory it uses.
+
+    Output is kept in memory up to max_memory_chars characters. Once it grows
+    past that, everything is written to a file under spool_dir instead, so memory
+    use stays flat however much the process prints. The in-memory head stays
+    available for reports; call discard once the full output was read back, so
+    the file does not outlive the run. With spill=False output past the head is
+    only counted, for output that is consumed as it is written.
+    """
+
+    def __init__(
+        self,
+        max_memory_chars: int,
+        spool_dir: Optional[Path] = None,
+        prefix: str = "output_",
+        spill: bool = True,
+    ):
+        root_dir = Path(__file__).parent.parent
+        self.spool_dir = Path(spool_dir) if spool_dir else root_dir / "logs" / "tool_output"
+        self.max_memory_chars = max_memory_chars
+        self.prefix = prefix
+        self.spill = spill
+        self.total_chars = 0
+        self.path: Optional[str] = None
+
+        self._chunks: List[str] = []
+        self._memory_chars = 0
+        self._file: Optional[TextIO] = None
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def spilled(self) -> bool:
+        """Whether the output outgrew memory and was written to a file"""
+        return self.path is not None
+
+    @property
+    def truncated(self) -> bool:
+        """Whether there was more output than the in-memory head"""
+        return self.total_chars > self._memory_chars
+
+    def write(self, text: str) -> None:
+        """Append output"""
+        if not text:
+            return
+        self.total_chars += len(text)
+
+        if self._file is None and self._memory_chars + len(text) <= self.max_memory_chars:
+            self._chunks.append(text)
+            self._memory_chars += len(text)
+            return
+
+        if not self.spill:
+            remaining = self.max_memory_chars - self._memory_chars
+            if remaining > 0:
+                self._chunks.append(text[:remaining])
+                self._memory_chars += remaining
+            return
+
+        if self._file is None:
+            self.spool_dir.mkdir(parents=True, exist_ok=True)
+            fd, self.path = tempfile.mkstemp(prefix=self.prefix, suffix=".log", dir=self.spool_dir)
+            self._file = os.fdopen(fd, "w", encoding="utf-8")
+            self._file.writelines(self._chunks)
+            self.logger.debug(f"Output exceeded {self.max_memory_chars} characters, spooling to {self.path}")
+        self._file.write(text)
+
+    def head(self) -> str:
+        """The part of the output kept in memory"""
+        return "".join(self._chunks)
+
+    def iter_lines(self) -> Iterator[str]:
+        """Iterate over all output lines, reading them back from the file if spilled"""
+        if self._file is None:
+            yield from "".join(self._chunks).splitlines()
+            return
+
+        if not self._file.closed:
+            self._file.flush()
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                yield line.rstrip("\n")
+
+    def close(self) -> None:
+        """Close the spool file, keeping it on disk"""
+        if self._file is not None:
+            self._file.close()
+
+    def discard(self) -> None:
+        """Close and delete the spool file, only the in-memory head remains"""
+        self.close()
+        if self.path is not None:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,168 @@
+import fnmatch
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Directories that never contain plugin sources worth analyzing
+DEFAULT_IGNORED_DIRS = frozenset(
+    {
+        "node_modules",
+        "dist",
+        "build",
+        "coverage",
+        ".git",
+        ".turbo",
+        ".next",
+    }
+)
+
+TYPESCRIPT_SUFFIXES = (".ts", ".tsx")
+
+
+class PluginDiscovery:
+    """Finds plugin directories with TypeScript sources, caching directory mtimes between scans"""
+
+    def __init__(
+        self, exclude_patterns: Optional[List[str]] = None, index_path: Optional[Path] = None
+    ):
+        self.root_dir = Path(__file__).parent.parent
+        self.index_path = (
+            Path(index_path) if index_path else self.root_dir / "cache" / "discovery_index.json"
+        )
+        self.exclude_patterns = list(exclude_patterns or [])
+        self.ignored_dirs = DEFAULT_IGNORED_DIRS
+
+        # Any change to the pruning rules invalidates every cached answer
+        self.signature = json.dumps(
+            {
+                "exclude_patterns": sorted(self.exclude_patterns),
+                "ignored_dirs": sorted(self.ignored_dirs),
+            }
+        )
+
+        self.logger = logging.getLogger(__name__)
+        self._index = self._load_index()
+        self._dirty = False
+
+    def discover(self, plugins_dir: Path, pattern: str = "plugin-*") -> List[Path]:
+        """Return the plugin directories under plugins_dir that contain TypeScript files"""
+        plugins_dir = Path(plugins_dir)
+        plugin_paths = []
+
+        try:
+            with os.scandir(plugins_dir) as entries:
+                candidates = sorted(
+                    entry.name
+                    for entry in entries
+                    if entry.is_dir() and fnmatch.fnmatch(entry.name, pattern)
+                )
+        except OSError as e:
+            self.logger.error(f"Cannot list plugins directory {plugins_dir}: {str(e)}")
+            return []
+
+        for name in candidates:
+            if self._is_excluded(name, is_dir=True):
+                self.logger.debug(f"Skipping excluded plugin: {name}")
+                continue
+            if self.has_typescript(plugins_dir / name, rel_prefix=name):
+                plugin_paths.append(plugins_dir / name)
+
+        self.save_index()
+        return plugin_paths
+
+    def has_typescript(self, plugin_dir: Path, rel_prefix: str = "") -> bool:
+        """Check whether plugin_dir contains at least one TypeScript file"""
+        key = str(Path(plugin_dir).resolve())
+        entry = self._index["plugins"].get(key)
+        if entry and self._is_fresh(plugin_dir, entry["dir_mtimes"]):
+            self.logger.debug(f"Discovery index hit for {plugin_dir}")
+            return entry["has_typescript"]
+
+        found, dir_mtimes = self._scan(Path(plugin_dir), rel_prefix or Path(plugin_dir).name)
+        self._index["plugins"][key] = {
+            "has_typescript": found,
+            "dir_mtimes": dir_mtimes,
+        }
+        self._dirty = True
+        return found
+
+    def save_index(self) -> None:
+        """Persist the discovery index if it changed"""
+        if not self._dirty:
+            return
+
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.index_path, "w", encoding="utf-8") as f:
+            json.dump(self._index, f)
+        self._dirty = False
+
+    def _scan(self, plugin_dir: Path, rel_prefix: str) -> Tuple[bool, Dict[str, int]]:
+        """Walk plugin_dir until the first TypeScript file, recording visited directory mtimes"""
+        dir_mtimes: Dict[str, int] = {}
+        stack = [""]
+
+        while stack:
+            rel_dir = stack.pop()
+            current = os.path.join(plugin_dir, rel_dir) if rel_dir else str(plugin_dir)
+            subdirs = []
+
+            try:
+                dir_mtimes[rel_dir] = os.stat(current).st_mtime_ns
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                        match_path = f"{rel_prefix}/{rel_path}"
+
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in self.ignored_dirs and not self._is_excluded(
+                                match_path, is_dir=True
+                            ):
+                                subdirs.append(rel_path)
+                        elif entry.name.endswith(TYPESCRIPT_SUFFIXES) and not self._is_excluded(
+                            match_path
+                        ):
+                            return True, dir_mtimes
+            except OSError as e:
+                self.logger.debug(f"Skipping unreadable directory {current}: {str(e)}")
+                continue
+
+            # Visit src/ first, it is where plugin sources almost always live
+            subdirs.sort(key=lambda path: path.rsplit("/", 1)[-1] == "src")
+            stack.extend(subdirs)
+
+        return False, dir_mtimes
+
+    def _is_fresh(self, plugin_dir: Path, dir_mtimes: Dict[str, int]) -> bool:
+        """A cached answer holds while no visited directory gained or lost entries"""
+        for rel_dir, mtime in dir_mtimes.items():
+            try:
+                if os.stat(os.path.join(plugin_dir, rel_dir)).st_mtime_ns != mtime:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def _is_excluded(self, rel_path: str, is_dir: bool = False) -> bool:
+        """Match a path relative to the plugins directory against exclude_patterns"""
+        candidates = [rel_path, rel_path.rsplit("/", 1)[-1]]
+        if is_dir:
+            candidates.append(f"{rel_path}/")
+        return any(
+            fnmatch.fnmatch(candidate, pattern)
+            for pattern in self.exclude_patterns
+            for candidate in candidates
+        )
+
+    def _load_index(self) -> Dict[str, Any]:
+        """Load the discovery index, discarding it if the pruning rules changed"""
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            if index.get("signature") == self.signature:
+                return index
+        except (OSError, json.JSONDecodeError):
+            pass
+
+        return {"signature": self.signature, "plugins": {}}
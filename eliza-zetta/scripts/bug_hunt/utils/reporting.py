@@ -1,56 +1,65 @@
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Iterable, Iterator, TextIO
 import json
 from pathlib import Path
 import os
+import hashlib
+import itertools
+import re
 from termcolor import colored
 from datetime import datetime
 import logging
 
+from utils.atomic_write import atomic_write
+from utils.logging_setup import setup_logging as configure_logging
+from utils.diagnostic import Diagnostic
+from utils.fingerprint import issue_fingerprint
+
 # Setup logging configuration at module level
 def setup_logging():
-    # Create logs directory if it doesn't exist
-    logs_dir = Path(__file__).parent.parent / "logs"
-    logs_dir.mkdir(exist_ok=True)
-
-    # Configure logging
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            # File handler for biome.log
-            logging.FileHandler(logs_dir / "biome.log", encoding='utf-8'),
-            # Console handler for immediate feedback
-            logging.StreamHandler()
-        ]
-    )
+    # Shared, queue-based setup; does nothing if main already configured logging
+    configure_logging()
 
 # Call setup_logging when module is imported
 setup_logging()
 
-@dataclass
-class BiomeDiagnostic:
-    message: str
-    file_path: str
-    line: int
-    column: int
-    severity: str
-    rule: str
-
 @dataclass
 class BiomeReport:
     plugin_name: str
     total_errors: int
     total_warnings: int
-    diagnostics: List[BiomeDiagnostic]
+    diagnostics: List[Diagnostic]
     raw_output: str
     timestamp: str
 
+# Report formats save_report can write, with their file extensions
+REPORT_FORMATS = {
+    "markdown": ".md",
+    "sarif": ".sarif",
+    "json": ".json",
+}
+
+# Biome severities as SARIF result levels
+SARIF_LEVELS = {
+    "error": "error",
+    "warning": "warning",
+    "info": "note",
+}
+
+# Upper-case letters that start a word of a camelCase rule name
+RULE_NAME_WORD = re.compile(r"(?<!^)(?=[A-Z])")
+
+def biome_rule_url(rule: str) -> str:
+    """Documentation page of a lint rule, e.g. lint/style/useConst -> .../rules/use-const"""
+    name = rule.rsplit("/", 1)[-1]
+    return f"https://biomejs.dev/linter/rules/{RULE_NAME_WORD.sub('-', name).lower()}"
+
 class BiomeReportGenerator:
     def __init__(self):
         self.report_data = {
             "timestamp": "",
             "plugin_name": "",
+            "source_dir": "",
             "total_issues": 0,
             "files_analyzed": 0,
             "issues_by_severity": {
@@ -63,140 +72,289 @@ class BiomeReportGenerator:
         }
 
     def parse_biome_output(self, biome_output: str, plugin_name: str) -> None:
-        """Parse the raw Biome output and store it in the report data structure"""
-        logger = logging.getLogger(__name__)
-        logger.info("=== Starting Biome Output Parsing ===")
+        """Parse serialized Biome output and store it in the report data structure.
 
-        self.report_data["timestamp"] = datetime.now().isoformat()
-        self.report_data["plugin_name"] = plugin_name
-        self.report_data["raw_output"] = biome_output
-
-        # Parse the text output
-        files_processed = []
-        diagnostics_limit_msg = None
-
-        # Get the output from node_manager's result
+        Accepts a Biome result dict serialized as JSON, or plain text output.
+        Callers holding the result dict should use load_biome_result instead.
+        """
         try:
             result = json.loads(biome_output)
-            all_output = result.get("all_output", [])
-            error_logs = result.get("error_logs", [])
-            self.report_data["logs"] = all_output + error_logs
         except json.JSONDecodeError:
-            # If it's not JSON, treat it as raw output
-            self.report_data["logs"] = biome_output.splitlines()
+            result = None
 
-        for line in self.report_data["logs"]:
-            line = line.strip()
+        if isinstance(result, dict):
+            self.load_biome_result(result, plugin_name)
+            return
 
-            # Skip empty lines
-            if not line:
-                continue
+        # If it's not JSON, treat it as raw output
+        self._start_report(plugin_name, biome_output, biome_output.splitlines())
+        self.add_diagnostics([], self._count_from_logs(self.report_data["logs"]))
 
-            # Check for diagnostics limit message
-            if "The number of diagnostics exceeds" in line:
-                diagnostics_limit_msg = line
-                continue
+    def load_biome_result(self, biome_result: Dict[str, Any], plugin_name: str, source_dir: str = "") -> None:
+        """Store a Biome result dict, as returned by NodeManager, in the report data structure.
 
-            # Capture file list
-            if line.startswith("  - src/"):
-                file = line.strip("  - ")
-                files_processed.append(file)
-                continue
+        source_dir is the plugin directory relative to the workspace root (e.g.
+        "packages/plugin-foo"); SARIF locations are given relative to it.
+        """
+        logs = biome_result.get("all_output", []) + biome_result.get("error_logs", [])
+        self._start_report(plugin_name, biome_result.get("raw_output", ""), logs)
+        self.report_data["source_dir"] = source_dir.replace(os.sep, "/").strip("/")
 
-            # Capture summary counts
-            if "Found" in line and ("warnings" in line or "errors" in line):
-                try:
-                    count = int(line.split()[1])
-                    if "warnings" in line:
-                        self.report_data["issues_by_severity"]["warning"] = count
-                        self.report_data["total_issues"] += count
-                    elif "errors" in line:
-                        self.report_data["issues_by_severity"]["error"] = count
-                        self.report_data["total_issues"] += count
-                except ValueError:
-                    pass
+        # Results recorded before NodeManager reported totals only have them in the logs
+        summary = biome_result.get("summary")
+        if summary is None:
+            summary = self._count_from_logs(logs)
+
+        self.add_diagnostics(biome_result.get("diagnostics") or [], summary)
+
+    def add_diagnostics(self, diagnostics: List[Dict[str, Any]], summary: Optional[Dict[str, Any]] = None) -> None:
+        """Add parsed diagnostics to the report, grouped by file.
+
+        summary holds Biome's own totals ("errors", "warnings", "files_checked");
+        without it the diagnostics are counted instead.
+        """
+        file_issues = self.report_data["file_issues"]
+        for diagnostic in diagnostics:
+            # The verbose parser's stand-in for diagnostics it could not show
+            if diagnostic.get("file") == "Summary":
                 continue
+            file_issues.setdefault(diagnostic.get("file") or "Unknown File", []).append(diagnostic)
+
+        if summary is None:
+            summary = {
+                "errors": sum(1 for d in diagnostics if d.get("severity") == "error"),
+                "warnings": sum(1 for d in diagnostics if d.get("severity") == "warning"),
+            }
+
+        issues_by_severity = self.report_data["issues_by_severity"]
+        issues_by_severity["error"] += summary.get("errors", 0)
+        issues_by_severity["warning"] += summary.get("warnings", 0)
+        self.report_data["total_issues"] += summary.get("errors", 0) + summary.get("warnings", 0)
 
-        # Update files analyzed count
-        self.report_data["files_analyzed"] = len(files_processed)
+        files_processed = sorted(file for file in file_issues if file != "Summary")
+        self.report_data["files_analyzed"] = summary.get("files_checked") or len(files_processed)
 
         # Create a summary entry with all information
+        file_issues.pop("Summary", None)
         if self.report_data["total_issues"] > 0:
-            summary = {
+            overview = {
                 "severity": "warning",
                 "line": 0,
                 "column": 0,
                 "rule": "summary",
-                "message": f"Found {self.report_data['issues_by_severity']['warning']} warnings and {self.report_data['issues_by_severity']['error']} errors",
+                "message": f"Found {issues_by_severity['warning']} warnings and {issues_by_severity['error']} errors",
                 "code_snippet": [],
                 "additional_info": []
             }
 
             # Add diagnostics limit message if exists
-            if diagnostics_limit_msg:
-                summary["additional_info"].append(diagnostics_limit_msg)
+            if summary.get("diagnostics_limit"):
+                overview["additional_info"].append(summary["diagnostics_limit"])
 
             # Add files list
-            summary["code_snippet"].extend([
+            overview["code_snippet"].extend([
                 "Files analyzed:",
                 ""] + [f"  - {f}" for f in files_processed])
 
-            if "Summary" not in self.report_data["file_issues"]:
-                self.report_data["file_issues"]["Summary"] = []
-            self.report_data["file_issues"]["Summary"].insert(0, summary)
+            # Keep the overview first, ahead of the per-file entries
+            self.report_data["file_issues"] = {"Summary": [overview], **file_issues}
+
+    def _start_report(self, plugin_name: str, raw_output: str, logs: List[str]) -> None:
+        """Reset the report data for a new plugin"""
+        logger = logging.getLogger(__name__)
+        logger.info("=== Starting Biome Output Parsing ===")
+
+        self.report_data["timestamp"] = datetime.now().isoformat()
+        self.report_data["plugin_name"] = plugin_name
+        self.report_data["source_dir"] = ""
+        self.report_data["raw_output"] = raw_output
+        self.report_data["logs"] = logs
+        self.report_data["total_issues"] = 0
+        self.report_data["issues_by_severity"] = {"error": 0, "warning": 0, "info": 0}
+        self.report_data["file_issues"] = {}
+
+    def _count_from_logs(self, logs: List[str]) -> Dict[str, Any]:
+        """Biome's totals, read back from the "Found ..." lines of its text output"""
+        summary = {"errors": 0, "warnings": 0}
+        for line in logs:
+            line = line.strip()
+
+            # Check for diagnostics limit message
+            if "The number of diagnostics exceeds" in line:
+                summary["diagnostics_limit"] = line
+                continue
+
+            # Capture summary counts
+            if "Found" in line and ("warnings" in line or "errors" in line):
+                try:
+                    count = int(line.split()[1])
+                    if "warnings" in line:
+                        summary["warnings"] = count
+                    elif "errors" in line:
+                        summary["errors"] = count
+                except ValueError:
+                    pass
+
+        return summary
 
     def generate_markdown_report(self) -> str:
         """Generate a formatted markdown report from the parsed data"""
-        report = []
+        return "\n".join(self.iter_markdown_lines())
+
+    def write_markdown_report(self, f: TextIO) -> str:
+        """Write the markdown report to an open file, one line at a time.
+
+        Returns the SHA-256 of the written content.
+        """
+        lines = self.iter_markdown_lines()
+        first = next(lines)
+        return self._write_chunks(f, itertools.chain([first], ("\n" + line for line in lines)))
+
+    def write_json_report(self, f: TextIO) -> str:
+        """Write the report as compact JSON, one diagnostic at a time. Returns its SHA-256."""
+        header = {
+            "plugin_name": self.report_data["plugin_name"],
+            "timestamp": self.report_data["timestamp"],
+            "total_issues": self.report_data["total_issues"],
+            "files_analyzed": self.report_data["files_analyzed"],
+            "issues_by_severity": self.report_data["issues_by_severity"],
+        }
+
+        def chunks() -> Iterator[str]:
+            yield json.dumps(header, separators=(",", ":"))[:-1] + ',"diagnostics":['
+            for index, (file_path, issue) in enumerate(self.iter_diagnostics()):
+                yield ("," if index else "") + json.dumps({
+                    "file": file_path,
+                    "line": issue.get("line", 0),
+                    "column": issue.get("column", 0),
+                    "rule": issue.get("rule", ""),
+                    "severity": issue.get("severity", "warning"),
+                    "message": issue.get("message", ""),
+                    "fixable": bool(issue.get("fixable")),
+                    "fingerprint": issue_fingerprint(issue),
+                }, separators=(",", ":"))
+            yield "]}"
+
+        return self._write_chunks(f, chunks())
+
+    def write_sarif_report(self, f: TextIO) -> str:
+        """Write the report as a SARIF 2.1.0 log, one result at a time. Returns its SHA-256."""
+        # Rules go in the driver ahead of the results that point at them by index
+        rule_index: Dict[str, int] = {}
+        for _, issue in self.iter_diagnostics():
+            rule_index.setdefault(issue.get("rule") or "unknown", len(rule_index))
+
+        driver = {
+            "name": "Biome",
+            "informationUri": "https://biomejs.dev",
+            "rules": [
+                {"id": rule, "helpUri": biome_rule_url(rule)}
+                if rule.startswith("lint/") else {"id": rule}
+                for rule in rule_index
+            ],
+        }
 
+        # Diagnostics are relative to the plugin, SARIF consumers resolve paths from the workspace root
+        source_dir = self.report_data.get("source_dir")
+        uri_prefix = f"{source_dir}/" if source_dir else ""
+
+        def chunks() -> Iterator[str]:
+            yield (
+                '{"$schema":"https://json.schemastore.org/sarif-2.1.0.json","version":"2.1.0","runs":[{'
+                f'"tool":{{"driver":{json.dumps(driver, separators=(",", ":"))}}},'
+                '"originalUriBaseIds":{"%SRCROOT%":{"description":{"text":"Workspace root"}}},'
+                f'"properties":{{"pluginName":{json.dumps(self.report_data["plugin_name"])}}},'
+                '"results":['
+            )
+            for index, (file_path, issue) in enumerate(self.iter_diagnostics()):
+                rule = issue.get("rule") or "unknown"
+                region = {}
+                if issue.get("line"):
+                    region["startLine"] = issue["line"]
+                    if issue.get("column"):
+                        region["startColumn"] = issue["column"]
+                location = {"artifactLocation": {"uri": f"{uri_prefix}{file_path}", "uriBaseId": "%SRCROOT%"}}
+                if region:
+                    location["region"] = region
+                yield ("," if index else "") + json.dumps({
+                    "ruleId": rule,
+                    "ruleIndex": rule_index[rule],
+                    "level": SARIF_LEVELS.get(issue.get("severity"), "warning"),
+                    "message": {"text": issue.get("message") or rule},
+                    "locations": [{"physicalLocation": location}],
+                    # Lets SARIF consumers match the same issue across plugins and runs
+                    "partialFingerprints": {"biomeIssue/v1": issue_fingerprint(issue)},
+                }, separators=(",", ":"))
+            yield "]}]}"
+
+        return self._write_chunks(f, chunks())
+
+    def iter_diagnostics(self) -> Iterator[tuple[str, Dict[str, Any]]]:
+        """Yield (file, diagnostic) for every diagnostic in the report, leaving out the overview"""
+        for file_path, issues in self.report_data["file_issues"].items():
+            if file_path == "Summary":
+                continue
+            for issue in issues:
+                yield file_path, issue
+
+    @staticmethod
+    def _write_chunks(f: TextIO, chunks: Iterator[str]) -> str:
+        """Write text chunks to a file and return the SHA-256 of what was written"""
+        digest = hashlib.sha256()
+        for chunk in chunks:
+            f.write(chunk)
+            digest.update(chunk.encode("utf-8"))
+        return digest.hexdigest()
+
+    def iter_markdown_lines(self) -> Iterator[str]:
+        """Yield the lines of the markdown report, without line endings"""
         # Header
-        report.append(f"# Biome Analysis Report: {self.report_data['plugin_name']}")
-        report.append(f"\nGenerated at: {self.report_data['timestamp']}\n")
+        yield f"# Biome Analysis Report: {self.report_data['plugin_name']}"
+        yield f"\nGenerated at: {self.report_data['timestamp']}\n"
 
         # Summary
-        report.append("## Summary")
-        report.append(f"- Total Issues: {self.report_data['total_issues']}")
-        report.append(f"- Files Analyzed: {self.report_data['files_analyzed']}")
-        report.append("\nIssues by Severity:")
+        yield "## Summary"
+        yield f"- Total Issues: {self.report_data['total_issues']}"
+        yield f"- Files Analyzed: {self.report_data['files_analyzed']}"
+        yield "\nIssues by Severity:"
         for severity, count in self.report_data["issues_by_severity"].items():
             if count > 0:  # Only show non-zero counts
-                report.append(f"- {severity.capitalize()}: {count}")
+                yield f"- {severity.capitalize()}: {count}"
 
         # Detailed Issues
-        report.append("\n## Detailed Issues")
+        yield "\n## Detailed Issues"
 
         # First show summary if it exists
         if "Summary" in self.report_data["file_issues"]:
-            report.append("\n### Overview")
+            yield "\n### Overview"
             for issue in self.report_data["file_issues"]["Summary"]:
                 severity_marker = "🔴" if issue["severity"] == "error" else "⚠️"
-                report.append(f"\n{severity_marker} **{issue['message']}**")
+                yield f"\n{severity_marker} **{issue['message']}**"
 
                 # Add any additional info (like diagnostics limit message)
                 if issue.get("additional_info"):
                     for info in issue["additional_info"]:
-                        report.append(f"\n> {info}")
+                        yield f"\n> {info}"
 
                 # Add file list
                 if issue.get("code_snippet"):
-                    report.append("\n```")
-                    report.extend(issue["code_snippet"])
-                    report.append("```")
+                    yield "\n```"
+                    yield from issue["code_snippet"]
+                    yield "```"
 
         # Show all logs
         if self.report_data.get("logs"):
-            report.append("\n### Full Diagnostic Output")
-            report.append("\n```")
-            for log in self.report_data["logs"]:
-                report.append(log)
-            report.append("```")
+            yield "\n### Full Diagnostic Output"
+            yield "\n```"
+            yield from self.report_data["logs"]
+            yield "```"
 
         # Then show all other files
         for file_path, issues in self.report_data["file_issues"].items():
             if file_path == "Summary":
                 continue
 
-            report.append(f"\n### {file_path}")
+            yield f"\n### {file_path}"
 
             for issue in issues:
                 severity_marker = "🔴" if issue["severity"] == "error" else "⚠️"
@@ -205,53 +363,107 @@ class BiomeReportGenerator:
                 if issue.get("fixable"):
                     rule_text += " (FIXABLE)"
 
-                report.append(f"\n{severity_marker} **{issue['severity'].upper()}** - {location}")
-                report.append(f"- Rule: {rule_text}")
+                yield f"\n{severity_marker} **{issue['severity'].upper()}** - {location}"
+                yield f"- Rule: {rule_text}"
 
                 # Add message with proper formatting
                 if issue.get("message"):
-                    report.append(f"- Message: {issue['message']}")
+                    yield f"- Message: {issue['message']}"
 
                 # Add code snippet if available
                 if issue.get("code_snippet"):
-                    report.append("\n```typescript")
-                    report.extend(issue["code_snippet"])
-                    report.append("```")
+                    yield "\n```typescript"
+                    yield from issue["code_snippet"]
+                    yield "```"
 
                 # Add additional info if available
                 if issue.get("additional_info"):
-                    report.append("\nℹ️ Additional Information:")
+                    yield "\nℹ️ Additional Information:"
                     for info in issue["additional_info"]:
-                        report.append(f"- {info}")
+                        yield f"- {info}"
 
         # Commented out Raw Output section but preserved in code
         """
-        report.append("\n## Raw Biome Output")
-        report.append("```")
-        report.append(self.report_data["raw_output"])
-        report.append("```")
+        yield "\n## Raw Biome Output"
+        yield "```"
+        yield self.report_data["raw_output"]
+        yield "```"
         """
 
-        return "\n".join(report)
+    def save_report(self, output_dir: Path, formats: Iterable[str] = ("markdown",)) -> None:
+        """Save the generated report in each of formats and record it in the report index.
 
-    def save_report(self, output_dir: Path) -> None:
-        """Save the generated report to a markdown file"""
+        formats are keys of REPORT_FORMATS; all of them are written from the same
+        parsed diagnostics.
+        """
+        writers = {
+            "markdown": self.write_markdown_report,
+            "sarif": self.write_sarif_report,
+            "json": self.write_json_report,
+        }
         output_dir.mkdir(parents=True, exist_ok=True)
-        report_path = output_dir / f"plugin-{self.report_data['plugin_name']}_report.md"
+        report_stem = f"plugin-{self.report_data['plugin_name']}_report"
+
+        outputs = {}
+        content_hash = None
+        for report_format in formats:
+            report_path = output_dir / f"{report_stem}{REPORT_FORMATS[report_format]}"
+            with open(report_path, "w", encoding="utf-8") as f:
+                digest = writers[report_format](f)
+            outputs[report_format] = report_path.name
+            # The index describes the markdown report, or the first written without one
+            if content_hash is None or report_format == "markdown":
+                content_hash = digest
+
+        ReportIndex(output_dir).update(f"{report_stem}.md", {
+            "plugin_name": self.report_data["plugin_name"],
+            "timestamp": self.report_data["timestamp"],
+            "total_issues": self.report_data["total_issues"],
+            "issues_by_severity": dict(self.report_data["issues_by_severity"]),
+            "files_analyzed": self.report_data["files_analyzed"],
+            "content_hash": f"sha256:{content_hash}",
+            "outputs": outputs,
+        })
+
+class ReportIndex:
+    """Metadata of the markdown reports in a directory, kept in reports.index.json.
+
+    Written alongside each report so listings can show totals, severities and
+    timestamps without opening the reports themselves. Entries are keyed by
+    report file name; content_hash tells whether a report was changed by hand.
+    """
+
+    INDEX_FILE = "reports.index.json"
+
+    def __init__(self, reports_dir: Path):
+        self.index_path = Path(reports_dir) / self.INDEX_FILE
+        self.logger = logging.getLogger(__name__)
 
-        with open(report_path, "w", encoding="utf-8") as f:
-            f.write(self.generate_markdown_report())
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Report file name -> metadata, empty if there is no index yet"""
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f).get("reports", {})
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Cannot read report index {self.index_path}: {str(e)}")
+            return {}
+
+    def update(self, report_name: str, metadata: Dict[str, Any]) -> None:
+        """Record the metadata of a report"""
+        reports = self.load()
+        reports[report_name] = metadata
+
+        # Readers never see half an index
+        with atomic_write(self.index_path) as f:
+            json.dump({"reports": reports}, f)
 
 class ReportGenerator:
     def __init__(self, reports_dir: str = "reports"):
         self.reports_dir = Path(reports_dir)
         self.reports_dir.mkdir(exist_ok=True)
 
-        # Setup logging
-        logging.basicConfig(
-            level=logging.DEBUG,
-            format='%(asctime)s - %(levelname)s - %(message)s'
-        )
         self.logger = logging.getLogger(__name__)
 
     def parse_biome_output(self, output: str, plugin_name: str) -> BiomeReport:
@@ -259,7 +471,7 @@ class ReportGenerator:
         try:
             self.logger.debug(f"Parsing Biome output for plugin: {plugin_name}")
 
-            diagnostics: List[BiomeDiagnostic] = []
+            diagnostics: List[Diagnostic] = []
             error_count = 0
             warning_count = 0
 
@@ -274,9 +486,9 @@ class ReportGenerator:
                         elif severity == "warning":
                             warning_count += 1
 
-                        diagnostics.append(BiomeDiagnostic(
+                        diagnostics.append(Diagnostic(
                             message=diag.get("message", ""),
-                            file_path=diag.get("file", ""),
+                            file=diag.get("file", ""),
                             line=diag.get("line", 0),
                             column=diag.get("column", 0),
                             severity=severity,
@@ -293,9 +505,9 @@ class ReportGenerator:
 
                     # Basic text parsing logic
                     if line.strip():
-                        diagnostics.append(BiomeDiagnostic(
+                        diagnostics.append(Diagnostic(
                             message=line,
-                            file_path="",
+                            file="",
                             line=0,
                             column=0,
                             severity="error" if "error" in line.lower() else "warning",
@@ -330,9 +542,9 @@ class ReportGenerator:
             ]
 
             # Group diagnostics by file
-            diagnostics_by_file: Dict[str, List[BiomeDiagnostic]] = {}
+            diagnostics_by_file: Dict[str, List[Diagnostic]] = {}
             for diag in report.diagnostics:
-                file_key = diag.file_path or "Unknown File"
+                file_key = diag.file or "Unknown File"
                 if file_key not in diagnostics_by_file:
                     diagnostics_by_file[file_key] = []
                 diagnostics_by_file[file_key].append(diag)
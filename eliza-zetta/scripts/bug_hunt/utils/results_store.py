@@ -0,0 +1,258 @@
+import logging
+import re
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    checkpoint_file TEXT NOT NULL UNIQUE,
+    started_at TEXT,
+    signature TEXT
+);
+CREATE TABLE IF NOT EXISTS plugins (
+    id INTEGER PRIMARY KEY,
+    session_id INTEGER NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    analyzed_at TEXT,
+    success INTEGER,
+    errors INTEGER,
+    warnings INTEGER,
+    error TEXT,
+    UNIQUE (session_id, name)
+);
+CREATE TABLE IF NOT EXISTS diagnostics (
+    plugin_id INTEGER NOT NULL REFERENCES plugins(id) ON DELETE CASCADE,
+    session_id INTEGER NOT NULL,
+    file TEXT,
+    line INTEGER,
+    column INTEGER,
+    rule TEXT,
+    severity TEXT,
+    message TEXT
+);
+CREATE INDEX IF NOT EXISTS diagnostics_rule ON diagnostics (session_id, rule);
+CREATE INDEX IF NOT EXISTS diagnostics_severity ON diagnostics (session_id, severity);
+CREATE INDEX IF NOT EXISTS diagnostics_file ON diagnostics (session_id, file);
+CREATE INDEX IF NOT EXISTS diagnostics_plugin ON diagnostics (plugin_id);
+"""
+
+# Filter values containing these are matched with LIKE, the others exactly
+LIKE_WILDCARDS = re.compile(r"[%_]")
+
+
+class ResultsStore:
+    """SQLite index of the sessions, plugins and diagnostics held by the checkpoints"""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+        self.logger = logging.getLogger(__name__)
+
+    def session_signature(self, checkpoint_file: Path) -> Optional[str]:
+        """Signature stored for a checkpoint, None if it was never indexed"""
+        row = self.conn.execute(
+            "SELECT signature FROM sessions WHERE checkpoint_file = ?", (str(checkpoint_file),)
+        ).fetchone()
+        return row["signature"] if row else None
+
+    def update_signature(self, checkpoint_file: Path, signature: str) -> None:
+        """Mark an indexed session as matching its checkpoint again"""
+        with self.conn:
+            self.conn.execute(
+                "UPDATE sessions SET signature = ? WHERE checkpoint_file = ?",
+                (signature, str(checkpoint_file)),
+            )
+
+    def record_session(
+        self, checkpoint_file: Path, checkpoint_data: Dict[str, Any], signature: str = None
+    ) -> None:
+        """Index a whole session, replacing whatever was indexed for it before"""
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM sessions WHERE checkpoint_file = ?", (str(checkpoint_file),)
+            )
+            session_id = self._session_id(
+                checkpoint_file, checkpoint_data["session_name"], checkpoint_data.get("started_at")
+            )
+            for entry in checkpoint_data.get("plugins_analyzed", []):
+                self._insert_plugin(
+                    session_id,
+                    entry["plugin_name"],
+                    entry.get("analyzed_at"),
+                    entry.get("results", {}),
+                )
+            for error in checkpoint_data.get("errors", []):
+                self._insert_error(
+                    session_id, error["plugin_name"], error.get("timestamp"), error.get("error")
+                )
+            self._set_signature(session_id, signature)
+
+    def record_plugin(
+        self,
+        checkpoint_file: Path,
+        session_name: str,
+        plugin_name: str,
+        analyzed_at: str,
+        analysis_result: Dict[str, Any],
+        signature: str = None,
+    ) -> None:
+        """Index one plugin result, replacing an earlier one from the same session"""
+        with self.conn:
+            session_id = self._session_id(checkpoint_file, session_name)
+            self._insert_plugin(session_id, plugin_name, analyzed_at, analysis_result)
+            self._set_signature(session_id, signature)
+
+    def record_error(
+        self,
+        checkpoint_file: Path,
+        session_name: str,
+        plugin_name: str,
+        timestamp: str,
+        error_message: str,
+        signature: str = None,
+    ) -> None:
+        """Index a plugin that failed to analyze"""
+        with self.conn:
+            session_id = self._session_id(checkpoint_file, session_name)
+            self._insert_error(session_id, plugin_name, timestamp, error_message)
+            self._set_signature(session_id, signature)
+
+    def query_diagnostics(
+        self,
+        checkpoint_file: Path,
+        rule: Optional[str] = None,
+        severity: Optional[str] = None,
+        file: Optional[str] = None,
+        plugin: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Diagnostics of a session matching every filter given.
+
+        rule and file may contain SQL LIKE wildcards (% and _). Values without
+        any are compared exactly, so the (session_id, rule) and (session_id, file)
+        indexes are used.
+        """
+        row = self.conn.execute(
+            "SELECT id FROM sessions WHERE checkpoint_file = ?", (str(checkpoint_file),)
+        ).fetchone()
+        if row is None:
+            return []
+
+        sql, params = self._diagnostics_query(row["id"], rule, severity, file, plugin, limit)
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _session_id(self, checkpoint_file: Path, name: str, started_at: str = None) -> int:
+        """Row id of a session, creating the row if needed"""
+        self.conn.execute(
+            "INSERT OR IGNORE INTO sessions (name, checkpoint_file, started_at) VALUES (?, ?, ?)",
+            (name, str(checkpoint_file), started_at),
+        )
+        return self.conn.execute(
+            "SELECT id FROM sessions WHERE checkpoint_file = ?", (str(checkpoint_file),)
+        ).fetchone()["id"]
+
+    @staticmethod
+    def _diagnostics_query(
+        session_id: int,
+        rule: Optional[str],
+        severity: Optional[str],
+        file: Optional[str],
+        plugin: Optional[str],
+        limit: Optional[int],
+    ) -> tuple[str, List[Any]]:
+        """SQL and parameters of a query_diagnostics lookup"""
+        sql = [
+            "SELECT p.name AS plugin, d.file, d.line, d.column, d.rule, d.severity, d.message",
+            "FROM diagnostics d JOIN plugins p ON p.id = d.plugin_id",
+            "WHERE d.session_id = ?",
+        ]
+        params: List[Any] = [session_id]
+        for column, value in (("d.rule", rule), ("d.file", file)):
+            if value:
+                sql.append(f"AND {column} {'LIKE' if LIKE_WILDCARDS.search(value) else '='} ?")
+                params.append(value)
+        if severity:
+            sql.append("AND d.severity = ?")
+            params.append(severity)
+        if plugin:
+            sql.append("AND p.name = ?")
+            params.append(plugin)
+        sql.append("ORDER BY p.name, d.file, d.line")
+        if limit:
+            sql.append("LIMIT ?")
+            params.append(limit)
+        return " ".join(sql), params
+
+    def _set_signature(self, session_id: int, signature: Optional[str]) -> None:
+        if signature is not None:
+            self.conn.execute(
+                "UPDATE sessions SET signature = ? WHERE id = ?", (signature, session_id)
+            )
+
+    def _insert_plugin(
+        self, session_id: int, plugin_name: str, analyzed_at: str, analysis_result: Dict[str, Any]
+    ) -> None:
+        """Insert a plugin row and its diagnostics"""
+        self.conn.execute(
+            "DELETE FROM plugins WHERE session_id = ? AND name = ?", (session_id, plugin_name)
+        )
+
+        biome = analysis_result.get("results", {}).get("biome", {})
+        diagnostics = biome.get("diagnostics") or []
+        summary = biome.get("summary") or {}
+        errors = summary.get("errors", sum(1 for d in diagnostics if d.get("severity") == "error"))
+        warnings = summary.get(
+            "warnings", sum(1 for d in diagnostics if d.get("severity") == "warning")
+        )
+
+        plugin_id = self.conn.execute(
+            "INSERT INTO plugins (session_id, name, analyzed_at, success, errors, warnings)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                session_id,
+                plugin_name,
+                analyzed_at,
+                int(bool(analysis_result.get("success"))),
+                errors,
+                warnings,
+            ),
+        ).lastrowid
+        self.conn.executemany(
+            "INSERT INTO diagnostics"
+            " (plugin_id, session_id, file, line, column, rule, severity, message)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                (
+                    plugin_id,
+                    session_id,
+                    d.get("file"),
+                    d.get("line"),
+                    d.get("column"),
+                    d.get("rule"),
+                    d.get("severity"),
+                    d.get("message"),
+                )
+                for d in diagnostics
+            ),
+        )
+
+    def _insert_error(
+        self, session_id: int, plugin_name: str, timestamp: str, error_message: str
+    ) -> None:
+        """Record a failed plugin; a plugin that also has a result keeps it, with the error noted"""
+        self.conn.execute(
+            "INSERT INTO plugins (session_id, name, analyzed_at, success, error)"
+            " VALUES (?, ?, ?, 0, ?)"
+            " ON CONFLICT (session_id, name) DO UPDATE SET error = excluded.error",
+            (session_id, plugin_name, timestamp, error_message),
+        )
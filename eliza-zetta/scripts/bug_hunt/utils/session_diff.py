@@ -0,0 +1,126 @@
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Set
+
+from utils.fingerprint import fingerprint
+
+
+def latest_results(checkpoint_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Plugin name -> its most recent analysis result in a checkpoint"""
+    results = {}
+    for entry in checkpoint_data.get("plugins_analyzed", []):
+        results[entry["plugin_name"]] = entry.get("results", {})
+    return results
+
+
+def failed_plugins(checkpoint_data: Dict[str, Any], results: Dict[str, Dict[str, Any]]) -> Set[str]:
+    """Plugins of a checkpoint whose latest run says nothing about their diagnostics.
+
+    Those are plugins that only have an error recorded (e.g. a timeout) and
+    plugins whose Biome run failed: no Biome result, or a failed run that
+    reported no diagnostics.
+    """
+    failed = {
+        error["plugin_name"]
+        for error in checkpoint_data.get("errors", [])
+        if error["plugin_name"] not in results
+    }
+    for plugin_name, analysis_result in results.items():
+        biome = analysis_result.get("results", {}).get("biome")
+        if not biome or (not biome.get("success") and not biome.get("diagnostics")):
+            failed.add(plugin_name)
+    return failed
+
+
+def iter_diagnostics(analysis_result: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Diagnostics of one plugin's analysis result, leaving out summary stand-ins"""
+    biome = analysis_result.get("results", {}).get("biome") or {}
+    for diagnostic in biome.get("diagnostics") or []:
+        if diagnostic.get("file") != "Summary":
+            yield diagnostic
+
+
+def diff_sessions(base: Dict[str, Any], head: Dict[str, Any]) -> Dict[str, Any]:
+    """Compare the diagnostics of two checkpoints.
+
+    Diagnostics are matched on fingerprint (rule, plugin file and normalized
+    snippet), so code that only shifted up or down still matches. Both sides are
+    indexed by fingerprint in one pass each, which keeps the diff linear in the
+    number of diagnostics. A fingerprint occurring several times is matched
+    occurrence by occurrence, same lines first.
+
+    Only plugins successfully analyzed in both sessions are compared. Plugins
+    whose run failed in either session (see failed_plugins) are listed under
+    "failed_in_base" and "failed_in_head" rather than having all their issues
+    reported as fixed or new; plugins analyzed in just one session are listed
+    under "only_in_base" and "only_in_head".
+
+    Returns "new" (only in head), "fixed" (only in base) and "moved" (in both,
+    at another line) entries, each with plugin, file, rule, severity, message and
+    line (moved ones have base_line and line).
+    """
+    base_results = latest_results(base)
+    head_results = latest_results(head)
+    base_failed = failed_plugins(base, base_results)
+    head_failed = failed_plugins(head, head_results)
+    base_plugins = base_results.keys() | base_failed
+    head_plugins = head_results.keys() | head_failed
+    plugins = sorted((base_results.keys() & head_results.keys()) - base_failed - head_failed)
+
+    base_index = _index(base_results, plugins)
+    head_index = _index(head_results, plugins)
+
+    new, fixed, moved = [], [], []
+    for key, head_entries in head_index.items():
+        base_entries = base_index.pop(key, [])
+        base_lines = defaultdict(list)
+        for entry in base_entries:
+            base_lines[entry["line"]].append(entry)
+
+        # Occurrences at the same line are unchanged; pair the rest up as moves
+        unmatched = []
+        for entry in head_entries:
+            if base_lines.get(entry["line"]):
+                base_lines[entry["line"]].pop()
+            else:
+                unmatched.append(entry)
+        leftover = [entry for entries in base_lines.values() for entry in entries]
+
+        for entry, base_entry in zip(unmatched, leftover):
+            moved.append({**entry, "base_line": base_entry["line"]})
+        new.extend(unmatched[len(leftover) :])
+        fixed.extend(leftover[len(unmatched) :])
+
+    for base_entries in base_index.values():
+        fixed.extend(base_entries)
+
+    return {
+        "plugins_compared": len(plugins),
+        "failed_in_base": sorted(base_failed),
+        "failed_in_head": sorted(head_failed),
+        "only_in_base": sorted(base_plugins - head_plugins - base_failed),
+        "only_in_head": sorted(head_plugins - base_plugins - head_failed),
+        "new": new,
+        "fixed": fixed,
+        "moved": moved,
+    }
+
+
+def _index(
+    results: Dict[str, Dict[str, Any]], plugins: List[str]
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Fingerprint -> occurrences of it in the given plugins"""
+    index: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for plugin_name in plugins:
+        for diagnostic in iter_diagnostics(results[plugin_name]):
+            file_path = diagnostic.get("file") or ""
+            index[fingerprint(diagnostic, f"{plugin_name}/{file_path}")].append(
+                {
+                    "plugin": plugin_name,
+                    "file": file_path,
+                    "line": diagnostic.get("line") or 0,
+                    "rule": diagnostic.get("rule") or "",
+                    "severity": diagnostic.get("severity") or "warning",
+                    "message": diagnostic.get("message") or "",
+                }
+            )
+    return index